@@ -0,0 +1,19 @@
+// Live demo sites. With BASE_URL set (e.g. http://127.0.0.1:8000 from
+// SELENIUM/standin_server.py) each site is served from {BASE_URL}/{name} instead,
+// same as site_url() in SELENIUM/utils.py.
+const SITES = {
+  saucedemo: 'https://www.saucedemo.com',
+  orangehrm: 'https://opensource-demo.orangehrmlive.com',
+  parabank: 'https://parabank.parasoft.com',
+  'parabank-testar': 'https://para.testar.org',
+  moodle: 'https://sandbox.moodledemo.net',
+  phptravels: 'https://phptravels.net',
+};
+
+function siteUrl(site, path = '') {
+  const base = process.env.BASE_URL;
+  const root = base ? `${base.replace(/\/+$/, '')}/${site}` : SITES[site];
+  return root + path;
+}
+
+module.exports = { SITES, siteUrl };
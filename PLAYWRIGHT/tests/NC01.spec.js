@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 (async () => {
   // Launch browser with maximized window
@@ -22,7 +23,7 @@ const { chromium } = require('playwright');
   try {
     // Navigate to the login page
     console.log('Step 1: Navigating to OrangeHRM login page...');
-    await page.goto('https://opensource-demo.orangehrmlive.com/web/index.php/auth/login', {
+    await page.goto(siteUrl('orangehrm', '/web/index.php/auth/login'), {
       waitUntil: 'networkidle'
     });
     console.log('✓ Login page loaded successfully\n');
@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 (async () => {
   // Launch browser with maximized window
@@ -23,7 +24,7 @@ const { chromium } = require('playwright');
   try {
     // Navigate to ParaBank
     console.log('Step 1: Navigating to ParaBank homepage...');
-    await page.goto('https://para.testar.org/parabank/index.htm', {
+    await page.goto(siteUrl('parabank-testar', '/parabank/index.htm'), {
       waitUntil: 'networkidle'
     });
     console.log('✓ ParaBank homepage loaded\n');
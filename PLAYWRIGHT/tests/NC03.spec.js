@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 (async () => {
   // Launch browser with maximized window
@@ -24,7 +25,7 @@ const { chromium } = require('playwright');
   try {
     // Navigate to PHPTravels
     console.log('Step 1: Navigating to PHPTravels homepage...');
-    await page.goto('https://phptravels.net/', {
+    await page.goto(siteUrl('phptravels', '/'), {
       waitUntil: 'networkidle'
     });
     console.log('✓ PHPTravels homepage loaded\n');
@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 (async () => {
   // Launch browser with maximized window
@@ -25,7 +26,7 @@ const { chromium } = require('playwright');
   try {
     // Navigate to SauceDemo
     console.log('Step 1: Navigating to SauceDemo...');
-    await page.goto('https://www.saucedemo.com/', {
+    await page.goto(siteUrl('saucedemo', '/'), {
       waitUntil: 'networkidle'
     });
     console.log('✓ SauceDemo homepage loaded\n');
@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 (async () => {
   // Launch browser with maximized window
@@ -25,7 +26,7 @@ const { chromium } = require('playwright');
   try {
     // Test 1: Try to load an invalid URL
     console.log('Step 1: Attempting to load INVALID URL...');
-    const invalidUrl = 'https://sandbox.moodledemo.net/abc123';
+    const invalidUrl = siteUrl('moodle', '/abc123');
     console.log(`  URL: ${invalidUrl}\n`);
     
     try {
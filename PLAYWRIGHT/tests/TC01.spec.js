@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 (async () => {
   // Launch browser with maximized window
@@ -15,7 +16,7 @@ const { chromium } = require('playwright');
   
   try {
     // Navigate to the login page
-    await page.goto('https://opensource-demo.orangehrmlive.com/web/index.php/auth/login');
+    await page.goto(siteUrl('orangehrm', '/web/index.php/auth/login'));
     
     // Enter valid credentials
     await page.fill('input[name="username"]', 'Admin');
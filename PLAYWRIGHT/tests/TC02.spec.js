@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 const fs = require('fs');
 
 /**
@@ -32,7 +33,7 @@ async function firstVisible(page, selectors, timeout = 10000) {
   
   try {
     // Open ParaBank login page (TESTAR domain)
-    await page.goto('https://para.testar.org/parabank/index.htm');
+    await page.goto(siteUrl('parabank-testar', '/parabank/index.htm'));
     
     // Enter invalid credentials
     await page.fill('input[name="username"]', 'wronguser');
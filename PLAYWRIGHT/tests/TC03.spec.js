@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 // ---- Demo credentials (change role here if you want) ----
 const USERNAME = 'teacher';  // or: admin / manager / student
@@ -19,7 +20,7 @@ const PASSWORD = 'sandbox24';
   
   try {
     // Open MoodleSandbox home → click "Log in"
-    await page.goto('https://sandbox.moodledemo.net/');
+    await page.goto(siteUrl('moodle', '/'));
     await page.click('a[href*="/login/index.php"]');
     
     // Fill username & password (per on-page hint)
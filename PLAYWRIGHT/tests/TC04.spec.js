@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 // Test Data
 const FROM_CITY = 'LHR';
@@ -28,7 +29,7 @@ const DEPART_DATE = departDate.toLocaleDateString('en-GB').replace(/\//g, '-');
     console.log('='.repeat(60));
 
     console.log('\n[1/6] Opening flights page...');
-    await page.goto('https://phptravels.net/flights');
+    await page.goto(siteUrl('phptravels', '/flights'));
     await page.waitForLoadState('domcontentloaded');
     await page.waitForTimeout(4000);
     console.log('       Page loaded');
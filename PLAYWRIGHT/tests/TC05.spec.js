@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 (async () => {
   // Launch browser with maximized window
@@ -17,7 +18,7 @@ const { chromium } = require('playwright');
     console.log("🚀 Starting SauceDemo Filter Test...");
     
     // Open the SauceDemo login page
-    await page.goto('https://www.saucedemo.com/');
+    await page.goto(siteUrl('saucedemo', '/'));
     console.log("✓ Navigated to SauceDemo");
 
     // Login with valid user (to access product page)
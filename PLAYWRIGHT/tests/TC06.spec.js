@@ -1,4 +1,5 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 const INVALID_EMP_ID = 'ZZZ999999999';
 
@@ -17,7 +18,7 @@ const INVALID_EMP_ID = 'ZZZ999999999';
 
   try {
     // Login
-    await page.goto('https://opensource-demo.orangehrmlive.com/web/index.php/auth/login');
+    await page.goto(siteUrl('orangehrm', '/web/index.php/auth/login'));
     
     await page.fill('input[name="username"]', 'Admin');
     await page.fill('input[name="password"]', 'admin123');
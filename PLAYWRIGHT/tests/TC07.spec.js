@@ -1,6 +1,7 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
-const BASE_URL = 'https://parabank.parasoft.com/parabank/index.htm';
+const BASE_URL = siteUrl('parabank', '/parabank/index.htm');
 const USERNAME = 'john';
 const PASSWORD = 'demo';
 const AMOUNT = '25';
@@ -1,6 +1,7 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
-const BASE = 'https://sandbox.moodledemo.net';
+const BASE = siteUrl('moodle');
 const USERNAME = 'admin';
 const PASSWORD = 'sandbox24';
 const TARGET_USER = 'Max Manager';
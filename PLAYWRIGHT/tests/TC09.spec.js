@@ -1,7 +1,8 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 // Configuration
-const BASE_URL = 'https://phptravels.net/hotels';
+const BASE_URL = siteUrl('phptravels', '/hotels');
 
 (async () => {
   // Setup Chrome
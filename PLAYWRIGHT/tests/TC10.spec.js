@@ -1,7 +1,8 @@
 const { chromium } = require('playwright');
+const { siteUrl } = require('../sites');
 
 // Configuration
-const BASE_URL = 'https://www.saucedemo.com';
+const BASE_URL = siteUrl('saucedemo');
 const USERNAME = 'standard_user';
 const PASSWORD = 'secret_sauce';
 const PRODUCT_NAME = 'Sauce Labs Backpack';
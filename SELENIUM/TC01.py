@@ -1,38 +1,43 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import artifacts
+from utils import StepTimer, fill_form, run_standalone, wait_settled
 
-options = Options()
-options.add_argument("--start-maximized")
 
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+def test_orangehrm_login_valid(driver, site_url, credentials):
+    steps = StepTimer(driver)
 
-# ---Navigate to the login page---
-driver.get("https://opensource-demo.orangehrmlive.com/web/index.php/auth/login")
+    # ---Navigate to the login page---
+    steps.begin("[1/3] Opening login page...")
+    driver.get(site_url("orangehrm", "/web/index.php/auth/login"))
 
-# ---Enter valid credentials---
-time.sleep(2)
-driver.find_element(By.NAME, "username").send_keys("Admin")
-driver.find_element(By.NAME, "password").send_keys("admin123")
+    # ---Enter valid credentials---
+    steps.begin("[2/3] Logging in...")
+    wait_settled(driver, replaces=2)
+    username, password = credentials("orangehrm")
+    fill_form(driver, {(By.NAME, "username"): username, (By.NAME, "password"): password})
 
-# ---Click the Login button---
-driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+    # ---Click the Login button---
+    driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
 
-# --- Verify successful login ---
-time.sleep(3)
-expected_url = "https://opensource-demo.orangehrmlive.com/web/index.php/dashboard/index"
-current_url = driver.current_url
+    # --- Verify successful login ---
+    steps.begin("[3/3] Verifying dashboard...")
+    wait_settled(driver, replaces=3)
+    expected_url = site_url("orangehrm", "/web/index.php/dashboard/index")
+    current_url = driver.current_url
 
-if "dashboard" in current_url:
-    print("Test Passed: Login successful and Dashboard page displayed.")
-else:
-    print("Test Failed: Login unsuccessful.")
+    if "dashboard" in current_url:
+        print("Test Passed: Login successful and Dashboard page displayed.")
+    else:
+        print("Test Failed: Login unsuccessful.")
+    steps.end()
 
- # ---Capture screenshot---
-driver.save_screenshot("selenium_login_success.png")
+    # ---Capture screenshot---
+    if "dashboard" not in current_url:
+        artifacts.failure(driver, "selenium_login_failure.png")
+    else:
+        artifacts.checkpoint(driver, "selenium_login_success.png")
+    assert "dashboard" in current_url, f"Expected {expected_url}, got {current_url}"
 
-# ---Close the browser---
-driver.quit()
+
+if __name__ == "__main__":
+    run_standalone(test_orangehrm_login_valid)
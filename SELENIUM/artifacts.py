@@ -0,0 +1,269 @@
+"""
+artifacts.py
+
+Screenshot and page-source capture off the test's hot path.
+
+The calling thread only grabs the raw data from the browser (base64 PNG, page
+source string); decoding, compression and the disk write happen on a small
+background thread pool. Identical content (same SHA-256) is written once and
+hard-linked for later names, and a per-run disk budget stops failure capture
+from filling the disk or stalling the test: once it is spent, further
+artifacts are skipped with a note.
+
+    artifacts.screenshot(driver, "tc04_results.png")
+    artifacts.page_source(driver, "nc03_page_source.html")   # -> .html.gz by default
+
+Settings (env):
+    ARTIFACT_COMPRESSION  gzip (default) | zstd (needs `zstandard`) | none  - for text artifacts;
+                          PNGs are already compressed and are stored as-is
+    ARTIFACT_BUDGET_MB    disk budget per run (default 200)
+    ARTIFACT_WORKERS      background writer threads (default 2)
+
+Capture policy (ARTIFACT_CAPTURE) decides what scripts actually pay for:
+    on-failure (default)  checkpoint() is a no-op; failure() captures
+    ring                  checkpoint() and every StepTimer step keep the last
+                          ARTIFACT_RING_SIZE (default 5) screenshots in memory;
+                          they are written only when the test fails
+    always                checkpoint() and failure() both capture
+
+    artifacts.checkpoint(driver, "saucedemo_success.png")
+    artifacts.failure(driver, "nc04_click_failure.png", source="nc04_failure_page_source.html")
+
+Relative names resolve against the cwd at capture time (run_suite.py runs each
+script in its own artifact dir) and flush() waits for pending writes.
+"""
+
+import atexit
+import base64
+import gzip
+import hashlib
+import importlib.util
+import os
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+
+STATS = Counter()
+
+_lock = threading.Lock()
+_pool = None
+_pending = []
+_by_digest = {}   # (sha256, suffix) -> first path written with that content
+_used = 0         # bytes counted against the budget (reserved, then actual)
+
+
+def _budget():
+    return float(os.getenv("ARTIFACT_BUDGET_MB", "200")) * 2**20
+
+
+def _compression():
+    kind = os.getenv("ARTIFACT_COMPRESSION", "gzip").lower()
+    if kind == "zstd":
+        return kind if importlib.util.find_spec("zstandard") else "gzip"
+    return kind if kind in ("gzip", "none") else "gzip"
+
+
+def _compress(data, kind):
+    if kind == "gzip":
+        return gzip.compress(data, compresslevel=6), ".gz"
+    if kind == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor(level=3).compress(data), ".zst"
+    return data, ""
+
+
+def _executor():
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=int(os.getenv("ARTIFACT_WORKERS", "2")),
+                                       thread_name_prefix="artifacts")
+        return _pool
+
+
+def _reserve(path, estimate):
+    global _used
+    with _lock:
+        if _used + estimate > _budget():
+            STATS["dropped"] += 1
+            print(f"[artifacts] disk budget spent, skipped {path.name}")
+            return False
+        _used += estimate
+        return True
+
+
+def _write(path, raw, compress, estimate):
+    """Runs on the pool: decode/compress, dedupe by content hash, write atomically."""
+    global _used
+    raw = raw() if callable(raw) else raw
+    digest = hashlib.sha256(raw).hexdigest()
+    kind = _compression() if compress else "none"
+    data, suffix = _compress(raw, kind)
+    path = path.with_name(path.name + suffix)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with _lock:
+        first = _by_digest.get((digest, suffix))
+        if first is None:
+            _by_digest[(digest, suffix)] = path
+    if first is not None and first != path and first.exists():
+        try:
+            if path.exists():
+                path.unlink()
+            os.link(first, path)
+            stored = 0
+        except OSError:
+            path.write_bytes(first.read_bytes())
+            stored = len(data)
+        STATS["deduped"] += 1
+    else:
+        tmp = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        stored = len(data)
+        STATS["written"] += 1
+
+    with _lock:
+        _used += stored - estimate
+        STATS["bytes_raw"] += len(raw)
+        STATS["bytes_stored"] += stored
+    return path
+
+
+def _submit(path, raw, compress, estimate):
+    path = Path(path).resolve()
+    if not _reserve(path, estimate):
+        return None
+    fut = _executor().submit(_write, path, raw, compress, estimate)
+    with _lock:
+        _pending.append(fut)
+    return fut
+
+
+def screenshot(driver, filename):
+    """Queue a PNG of the current viewport; returns a future (None if skipped/failed)."""
+    try:
+        b64 = driver.get_screenshot_as_base64()
+    except WebDriverException as e:
+        print(f"[artifacts] screenshot {filename} failed: {e.msg}")
+        return None
+    return _submit(filename, lambda: base64.b64decode(b64), False, len(b64) * 3 // 4)
+
+
+def page_source(driver, filename):
+    """Queue the current DOM as (compressed) HTML."""
+    try:
+        html = driver.page_source
+    except WebDriverException as e:
+        print(f"[artifacts] page source {filename} failed: {e.msg}")
+        return None
+    # Budget reservation assumes ~4:1 compression for HTML; corrected after the write.
+    estimate = len(html) if _compression() == "none" else len(html) // 4
+    return _submit(filename, lambda: html.encode("utf-8"), True, estimate)
+
+
+def save_bytes(filename, data, compress=True):
+    """Queue arbitrary bytes (logs, JSON) through the same pipeline."""
+    return _submit(filename, data, compress, len(data))
+
+
+def flush():
+    """Wait for every queued artifact; returns the paths written."""
+    with _lock:
+        pending, _pending[:] = list(_pending), []
+    paths = []
+    for fut in pending:
+        try:
+            paths.append(fut.result())
+        except Exception as e:
+            STATS["errors"] += 1
+            print(f"[artifacts] write failed: {e!r}")
+    return paths
+
+
+def reset():
+    """Flush and start a new run: fresh budget, dedupe table and counters."""
+    global _used
+    flush()
+    with _lock:
+        _used = 0
+        _by_digest.clear()
+        _ring.clear()
+        STATS.clear()
+
+
+# ---------- Capture policies ----------
+
+POLICIES = ("on-failure", "ring", "always")
+
+_ring = deque()   # (seq, name, base64 png, html or None, cwd at capture)
+_ring_seq = 0
+
+
+def policy():
+    value = os.getenv("ARTIFACT_CAPTURE", "on-failure").lower()
+    return value if value in POLICIES else "on-failure"
+
+
+def _remember(driver, name, with_source=False):
+    """Grab a screenshot (and optionally the DOM) into the in-memory ring; nothing is encoded."""
+    global _ring_seq
+    try:
+        b64 = driver.get_screenshot_as_base64()
+        html = driver.page_source if with_source else None
+    except WebDriverException:
+        return
+    with _lock:
+        _ring_seq += 1
+        _ring.append((_ring_seq, name, b64, html, os.getcwd()))
+        while len(_ring) > int(os.getenv("ARTIFACT_RING_SIZE", "5")):
+            _ring.popleft()
+
+
+def dump_ring(directory=None):
+    """Write the ring buffer (oldest first) to <directory or its capture cwd>/ring/ and empty it."""
+    with _lock:
+        entries = list(_ring)
+        _ring.clear()
+    for seq, name, b64, html, cwd in entries:
+        base = Path(directory or cwd) / "ring" / f"{seq:03d}-{Path(name).stem}"
+        _submit(base.with_suffix(".png"), lambda b64=b64: base64.b64decode(b64), False, len(b64) * 3 // 4)
+        if html is not None:
+            _submit(base.with_suffix(".html"), lambda html=html: html.encode("utf-8"), True, len(html) // 4)
+    return len(entries)
+
+
+def checkpoint(driver, filename, source=None):
+    """A progress/success capture: written only under the "always" policy."""
+    mode = policy()
+    if mode == "always":
+        screenshot(driver, filename)
+        if source:
+            page_source(driver, source)
+    elif mode == "ring":
+        _remember(driver, filename, with_source=bool(source))
+
+
+def step(driver, title):
+    """Called by utils.StepTimer at each step boundary; feeds the ring buffer."""
+    if policy() == "ring":
+        _remember(driver, "step-" + "".join(c if c.isalnum() else "_" for c in title)[:40])
+
+
+def failure(driver, filename, source=None):
+    """A failure capture: always written, together with the ring buffer's history."""
+    if policy() == "ring":
+        dump_ring()
+    screenshot(driver, filename)
+    if source:
+        page_source(driver, source)
+
+
+def stats():
+    return {k: STATS[k] for k in ("written", "deduped", "dropped", "errors", "bytes_raw", "bytes_stored")}
+
+
+atexit.register(flush)
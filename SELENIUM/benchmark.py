@@ -0,0 +1,387 @@
+"""
+benchmark.py
+
+Runs each TCxx/NCxx scenario with both tools - SELENIUM/TCxx.py and
+PLAYWRIGHT/tests/TCxx.spec.js - N times after a warmup, against the same target,
+and compares them.
+
+Per run it records:
+ - total wall time of the script
+ - per-step latency, from the "[k/N] ..." progress lines both tools print
+   (time from one marker to the next, the last one until the process exits)
+ - CPU seconds and peak RSS of the process tree, in total and for the browser
+   processes alone (sampled with psutil)
+
+and reports median, p95 and a bootstrap 95% confidence interval of the median
+per tool, plus the Playwright/Selenium ratio of medians.
+
+Step rows are only compared where every tool printed the same "[k/N]" markers
+(today TC04, TC08, TC09 and TC10; the other Playwright specs print none);
+elsewhere the report says so and compares totals only. Playwright specs that
+still call page.waitForTimeout are flagged, since their totals include those
+fixed sleeps.
+
+Both tools launch Chrome the same way: the Playwright specs open a headed,
+maximized browser with normal page loads, so a plain "selenium" next to
+"playwright" runs under the matching debug-headed launch profile (not the
+fast-headless default). results.json records each tool's launch mode.
+
+A tool "selenium:<profile>" runs the Selenium script under that Chrome launch
+profile (launch_profiles.py) and also reports Chrome's launch time, so profiles
+can be compared with each other:
+
+    python benchmark.py TC05 TC10 -n 5 --tools selenium:fast-headless,selenium:debug-headed,selenium:ci-low-memory
+
+    python benchmark.py TC04 TC10 -n 10 --warmup 2 --standin --latency-ms 100
+    python benchmark.py -n 5                    # every scenario both tools have
+
+Tools alternate order every iteration so drift (network, thermal) hits both.
+Raw logs and results.json go to runs/bench-<timestamp>/.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import launch_profiles
+
+try:
+    import psutil
+except ImportError:  # CPU/RSS columns are skipped without it
+    psutil = None
+
+HERE = Path(__file__).resolve().parent
+PLAYWRIGHT = HERE.parent / "PLAYWRIGHT"
+STEP_MARKER = re.compile(r"\[(\d+)/(\d+)\]")
+SLEEP_CALL = re.compile(r"\bwaitForTimeout\(")
+BROWSER_NAMES = re.compile(r"chrome|chromium|headless_shell", re.IGNORECASE)
+SAMPLE_INTERVAL = 0.1
+# How every PLAYWRIGHT/tests/*.spec.js launches Chromium (headless: false,
+# --start-maximized, page.goto waiting for "load"), and the Selenium profile matching it.
+PLAYWRIGHT_LAUNCH = {"headless": False, "window": "maximized", "page_load": "normal"}
+MATCHING_PROFILE = "debug-headed"
+
+
+def command(tool, scenario):
+    """argv for one run of `scenario` with `tool`, or None if that tool lacks it."""
+    if tool.split(":")[0] == "selenium":
+        script = HERE / f"{scenario}.py"
+        return [sys.executable, "-u", str(script)] if script.exists() else None
+    script = PLAYWRIGHT / "tests" / f"{scenario}.spec.js"
+    return ["node", str(script)] if script.exists() else None
+
+
+def selenium_profile(tool, tools):
+    """Launch profile a Selenium tool runs under: its own ("selenium:<profile>"),
+    else the one matching the Playwright specs when Playwright is in the run,
+    else LAUNCH_PROFILE / the default."""
+    if ":" in tool:
+        return tool.split(":", 1)[1]
+    if any(t.split(":")[0] == "playwright" for t in tools):
+        return MATCHING_PROFILE
+    return launch_profiles.name()
+
+
+def launch_mode(tool, tools):
+    """How `tool` launches the browser, as recorded in results.json."""
+    if tool.split(":")[0] != "selenium":
+        return dict(PLAYWRIGHT_LAUNCH)
+    profile = selenium_profile(tool, tools)
+    spec = launch_profiles.PROFILES[profile]
+    window = "maximized" if "--start-maximized" in spec["args"] else next(
+        (a.split("=", 1)[1] for a in spec["args"] if a.startswith("--window-size=")), "default")
+    return {"profile": profile, "headless": spec["headless"], "window": window,
+            "page_load": spec["page_load_strategy"]}
+
+
+def scenarios(names=None):
+    """TC/NC scenario stems of the Selenium scripts (optionally filtered)."""
+    stems = sorted(p.stem for p in HERE.glob("*.py") if re.match(r"^(TC|NC)\d+$", p.stem))
+    if names:
+        wanted = {n.upper().removesuffix(".PY") for n in names}
+        stems = [s for s in stems if s in wanted]
+    return stems
+
+
+class TreeSampler(threading.Thread):
+    """Samples CPU time and RSS of a process and all its descendants."""
+
+    def __init__(self, pid):
+        super().__init__(daemon=True)
+        self.root = psutil.Process(pid)
+        self.stop = threading.Event()
+        self.cpu = {}        # pid -> (is_browser, last seen user+system seconds)
+        self.peak_rss = 0
+        self.peak_browser_rss = 0
+
+    def run(self):
+        while not self.stop.is_set():
+            try:
+                procs = [self.root] + self.root.children(recursive=True)
+            except psutil.NoSuchProcess:
+                break
+            rss = browser_rss = 0
+            for p in procs:
+                try:
+                    with p.oneshot():
+                        times = p.cpu_times()
+                        mem = p.memory_info().rss
+                        browser = bool(BROWSER_NAMES.search(p.name()))
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+                self.cpu[p.pid] = (browser, times.user + times.system)
+                rss += mem
+                browser_rss += mem if browser else 0
+            self.peak_rss = max(self.peak_rss, rss)
+            self.peak_browser_rss = max(self.peak_browser_rss, browser_rss)
+            self.stop.wait(SAMPLE_INTERVAL)
+
+    def result(self):
+        return {
+            "cpu_seconds": round(sum(c for _, c in self.cpu.values()), 3),
+            "browser_cpu_seconds": round(sum(c for b, c in self.cpu.values() if b), 3),
+            "peak_rss_mb": round(self.peak_rss / 2**20, 1),
+            "browser_peak_rss_mb": round(self.peak_browser_rss / 2**20, 1),
+        }
+
+
+def run_once(tool, scenario, run_dir, env, timeout, profile=None):
+    """Run one script, timestamping its step markers; returns the run record.
+    A Selenium script runs under launch profile `profile` (default: the tool's own)."""
+    run_dir.mkdir(parents=True, exist_ok=True)
+    argv = command(tool, scenario)
+    env = {**env, "PYTHONUNBUFFERED": "1", "SUITE_SCRIPT": scenario, "DEBUG_LINGER": "0",
+           "STEP_LOG": str(run_dir / "steps.jsonl")}
+    profile = profile or (tool.split(":", 1)[1] if ":" in tool else None)
+    if profile:
+        env["LAUNCH_PROFILE"] = profile
+
+    marks = []
+    started = time.perf_counter()
+    with open(run_dir / "output.log", "w", encoding="utf-8") as log:
+        proc = subprocess.Popen(argv, cwd=run_dir, env=env, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True, encoding="utf-8", errors="replace")
+        sampler = TreeSampler(proc.pid) if psutil else None
+        if sampler:
+            sampler.start()
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        for line in proc.stdout:
+            log.write(line)
+            m = STEP_MARKER.search(line)
+            if m and line.lstrip().startswith("["):
+                marks.append((f"{m.group(1)}/{m.group(2)}", time.perf_counter() - started))
+        code = proc.wait()
+        timer.cancel()
+        total = time.perf_counter() - started
+        if sampler:
+            sampler.stop.set()
+            sampler.join()
+
+    steps = {}
+    for i, (name, at) in enumerate(marks):
+        end = marks[i + 1][1] if i + 1 < len(marks) else total
+        steps.setdefault(name, round(end - at, 3))  # NC03 prints [1/4] on either branch
+    record = {"tool": tool, "scenario": scenario, "exit_code": code,
+              "total_seconds": round(total, 3), "steps": steps}
+    launches = [json.loads(line)["seconds"] for line in _lines(run_dir / "steps.jsonl")
+                if '"step": "launch"' in line]
+    if launches:
+        record["launch_seconds"] = round(sum(launches), 3)
+    if sampler:
+        record.update(sampler.result())
+    return record
+
+
+def _lines(path):
+    try:
+        return path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+
+
+def percentile(values, q):
+    values = sorted(values)
+    if len(values) == 1:
+        return values[0]
+    pos = (len(values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def bootstrap_ci(values, resamples=2000, alpha=0.05, seed=0):
+    """Percentile bootstrap CI of the median."""
+    rng = random.Random(seed)
+    medians = sorted(statistics.median(rng.choices(values, k=len(values))) for _ in range(resamples))
+    return percentile(medians, alpha / 2), percentile(medians, 1 - alpha / 2)
+
+
+def describe(values):
+    if not values:
+        return None
+    low, high = bootstrap_ci(values)
+    return {"n": len(values), "median": statistics.median(values), "p95": percentile(values, 0.95),
+            "ci_low": low, "ci_high": high, "mean": statistics.fmean(values)}
+
+
+def metrics(runs):
+    """metric name -> list of values across runs (steps as 'step k/N')."""
+    out = {"total_seconds": [r["total_seconds"] for r in runs]}
+    if any("launch_seconds" in r for r in runs):
+        out["launch_seconds"] = [r["launch_seconds"] for r in runs if "launch_seconds" in r]
+    steps = sorted({s for r in runs for s in r["steps"]}, key=lambda s: int(s.split("/")[0]))
+    for s in steps:
+        out[f"step {s}"] = [r["steps"][s] for r in runs if s in r["steps"]]
+    for key in ("cpu_seconds", "browser_cpu_seconds", "peak_rss_mb", "browser_peak_rss_mb"):
+        if runs and key in runs[0]:
+            out[key] = [r[key] for r in runs]
+    return out
+
+
+def sleeps(tool, scenario):
+    """page.waitForTimeout calls in the Playwright spec of `scenario` (0 for Selenium)."""
+    if tool.split(":")[0] == "selenium":
+        return 0
+    spec = PLAYWRIGHT / "tests" / f"{scenario}.spec.js"
+    return len(SLEEP_CALL.findall(spec.read_text(encoding="utf-8"))) if spec.exists() else 0
+
+
+def step_mismatch(results, tools, scenario):
+    """Why the tools' steps for `scenario` cannot be compared, or None if they line up."""
+    marks = {t: frozenset(s for r in results if r["scenario"] == scenario and r["tool"] == t
+                          for s in r["steps"]) for t in tools}
+    if len(set(marks.values())) == 1 and any(marks.values()):
+        return None
+    missing = [t for t in tools if not marks[t]]
+    return f"{', '.join(missing)} printed no [k/N] markers" if missing else "the [k/N] markers differ"
+
+
+def notes(results, tools):
+    """Per scenario: why its steps are not compared, whether the tools launch Chrome
+    differently, and which totals include fixed sleeps."""
+    modes = {t: launch_mode(t, tools) for t in tools}
+    mismatch = None
+    if len({(m["headless"], m["page_load"]) for m in modes.values()}) > 1:
+        mismatch = "launch modes differ (" + ", ".join(
+            f"{t} {'headless' if m['headless'] else 'headed'}/{m['page_load']}" for t, m in modes.items()) + ")"
+    out = {}
+    for scenario in sorted({r["scenario"] for r in results}):
+        lines = [mismatch] if mismatch else []
+        why = step_mismatch(results, tools, scenario)
+        if why:
+            lines.append(f"steps not compared: {why}; compare total_seconds only")
+        for t in tools:
+            n = sleeps(t, scenario)
+            if n:
+                lines.append(f"{t} spec has {n} waitForTimeout sleep(s), included in its times")
+        out[scenario] = lines
+    return out
+
+
+def compare(results, tools):
+    """Per scenario and metric: summary stats for each tool. Step rows only where
+    every tool reported the same steps (see notes)."""
+    table = {}
+    for scenario in sorted({r["scenario"] for r in results}):
+        per_tool = {t: metrics([r for r in results if r["scenario"] == scenario and r["tool"] == t])
+                    for t in tools}
+        steps = step_mismatch(results, tools, scenario) is None
+        names = list(dict.fromkeys(n for t in tools for n in per_tool[t]
+                                   if steps or not n.startswith("step ")))
+        table[scenario] = {n: {t: describe(per_tool[t].get(n, [])) for t in tools} for n in names}
+    return table
+
+
+def print_table(table, tools, scenario_notes=None):
+    def cell(d):
+        if not d:
+            return f"{'-':>32}"
+        return f"{d['median']:8.2f} [{d['ci_low']:6.2f},{d['ci_high']:7.2f}] p95 {d['p95']:7.2f}"
+
+    header = "".join(f"{t + ': median [95% CI] p95':>34}" for t in tools)
+    for scenario, rows in table.items():
+        print("\n" + "="*(24 + 34*len(tools) + 8))
+        print(f"{scenario:<24}{header}   ratio")
+        print("-"*(24 + 34*len(tools) + 8))
+        for metric, by_tool in rows.items():
+            ratio = ""
+            a, b = (by_tool.get(t) for t in tools[:2]) if len(tools) > 1 else (None, None)
+            if a and b and a["median"]:
+                ratio = f"{b['median'] / a['median']:6.2f}x"
+            print(f"{metric:<24}" + "".join(f"  {cell(by_tool[t])}" for t in tools) + f"  {ratio}")
+        for line in (scenario_notes or {}).get(scenario, []):
+            print(f"  note: {line}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Selenium vs Playwright on identical scenarios.")
+    parser.add_argument("scenarios", nargs="*", help="e.g. TC04 TC10 (default: all present for both tools)")
+    parser.add_argument("-n", "--runs", type=int, default=10, help="measured runs per tool and scenario")
+    parser.add_argument("--warmup", type=int, default=1, help="unmeasured runs first (driver/browser caches)")
+    parser.add_argument("--tools", default="selenium,playwright",
+                        help="comma-separated: selenium, playwright, selenium:<launch profile>")
+    parser.add_argument("--standin", action="store_true",
+                        help="run both tools against the local stand-in sites (standin_server.py)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="stand-in per-request latency")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds before a run is killed")
+    parser.add_argument("--out", default=None, help="output dir (default: runs/bench-<timestamp>)")
+    args = parser.parse_args(argv)
+
+    tools = [t.strip() for t in args.tools.split(",") if t.strip()]
+    todo = [s for s in scenarios(args.scenarios) if all(command(t, s) for t in tools)]
+    if not todo:
+        parser.error("no scenario exists for every tool")
+    launch = {t: launch_mode(t, tools) for t in tools}
+    for tool, mode in launch.items():
+        print(f"{tool}: {'headless' if mode['headless'] else 'headed'}, window {mode['window']}, "
+              f"page load {mode['page_load']}" + (f" (profile {mode['profile']})" if "profile" in mode else ""))
+    if psutil is None:
+        print("psutil is not installed: CPU and RSS will not be measured (pip install psutil)")
+    out_dir = Path(args.out or HERE / "runs" / f"bench-{datetime.now():%Y%m%d-%H%M%S}").resolve()
+
+    env = dict(os.environ)
+    if args.standin:
+        import standin_server
+        server = standin_server.start(latency_ms=args.latency_ms)
+        env["BASE_URL"] = server.base_url
+        print(f"Stand-in sites at {server.base_url}/ (latency {args.latency_ms} ms)")
+
+    results = []
+    for scenario in todo:
+        for i in range(args.warmup + args.runs):
+            warm = i < args.warmup
+            order = tools if i % 2 == 0 else tools[::-1]
+            for tool in order:
+                label = f"warmup {i + 1}" if warm else f"run {i - args.warmup + 1}/{args.runs}"
+                rec = run_once(tool, scenario, out_dir / scenario / tool / f"{i:03d}", env, args.timeout,
+                               launch[tool].get("profile"))
+                print(f"  {scenario:<6} {tool:<11} {label:<12} {rec['total_seconds']:>8.2f}s"
+                      f"  exit {rec['exit_code']}")
+                if not warm:
+                    results.append(rec)
+
+    table = compare(results, tools)
+    scenario_notes = notes(results, tools)
+    print_table(table, tools, scenario_notes)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "results.json").write_text(json.dumps({
+        "runs": args.runs, "warmup": args.warmup, "tools": tools,
+        "target": env.get("BASE_URL", "live sites"), "launch": launch,
+        "results": results, "comparison": table,
+        "notes": scenario_notes,
+    }, indent=2), encoding="utf-8")
+    print(f"\nResults: {out_dir / 'results.json'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,95 @@
-
 import os
+from pathlib import Path
+
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.options import Options
 
-@pytest.fixture(scope="session")
-def driver():
+import artifacts
+import http_archive
+import launch_profiles
+import resource_blocking
+import utils
+from driver_pool import DriverPool
+
+HERE = Path(__file__).resolve().parent
+
+def chrome_options():
+    # Headless mode, window size and the rest come from LAUNCH_PROFILE (launch_profiles.py).
     chrome_options = Options()
-    if os.getenv("HEADLESS", "1") == "1":
-        chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1440,900")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-    driver.implicitly_wait(5)
+    return chrome_options
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Returns the DriverPool of warm Chrome sessions shared by all tests (size:
+    DRIVER_POOL_SIZE, default 1). The pool is created on the first call, so a run
+    whose tests all bring their own Chrome options never launches it."""
+    pool = None
+
+    def get():
+        nonlocal pool
+        if pool is None:
+            pool = DriverPool(
+                size=int(os.getenv("DRIVER_POOL_SIZE", "1")),
+                max_uses=int(os.getenv("DRIVER_POOL_MAX_USES", "25")),
+                options_factory=chrome_options,
+            )
+        return pool
+
+    yield get
+    if pool is not None:
+        pool.close()
+
+@pytest.fixture
+def driver(driver_pool, request):
+    """A pooled session, reset (cookies, storage, tabs, about:blank) after each test,
+    set up like a script's own (utils.new_driver): HTTP_ARCHIVE and RESOURCE_BLOCKING
+    attach to it. A test that needs its own Chrome options gets a new Chrome with them:
+
+        @pytest.mark.chrome_options(opts)               # as the TC scripts do
+        @pytest.mark.parametrize("driver", [opts], indirect=True)
+    """
+    marker = request.node.get_closest_marker("chrome_options")
+    options = getattr(request, "param", None) or (marker.args[0] if marker else None)
+    driver = utils.new_driver(options, pool=driver_pool() if options is None else None)
     yield driver
+    rep = getattr(request.node, "rep_call", None)
+    utils.linger(failed=rep is not None and rep.failed, headed=not launch_profiles.headless())
     driver.quit()
+    http_archive.detach_all()
+    resource_blocking.detach_all()
+
+@pytest.fixture
+def site_url():
+    """utils.site_url: demo-site URLs, honouring BASE_URL (stand-in server)."""
+    return utils.site_url
+
+@pytest.fixture
+def credentials():
+    """utils.credentials: demo logins, overridable with <SITE>_USERNAME / <SITE>_PASSWORD."""
+    return utils.credentials
+
+@pytest.fixture(autouse=True)
+def script_run(request, monkeypatch):
+    """Per-test bookkeeping the scripts get from run_suite.py: artifacts land in
+    runs/pytest/<module>/, and steps.jsonl records are tagged with the module name."""
+    stem = Path(str(request.node.fspath)).stem
+    artifact_dir = HERE / "runs" / "pytest" / stem
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("SUITE_SCRIPT", stem)
+    monkeypatch.setenv("STEP_LOG", str(HERE / "runs" / "pytest" / "steps.jsonl"))
+    monkeypatch.chdir(artifact_dir)
+    artifacts.reset()
+    utils.WAIT_LOG.clear()
+    yield
+    rep = getattr(request.node, "rep_call", None)
+    if rep is not None and rep.failed:
+        artifacts.dump_ring()
+    artifacts.flush()
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    rep = yield
+    if rep.when == "call":
+        item.rep_call = rep
+    return rep
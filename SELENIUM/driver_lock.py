@@ -0,0 +1,112 @@
+"""
+driver_lock.py
+
+Resolves the chromedriver binary once and remembers it in a lockfile, so
+scripts don't repeat ChromeDriverManager().install() (a version lookup over the
+network plus filesystem probing) on every launch.
+
+Resolution order:
+ 1. CHROMEDRIVER_PATH        - pinned local binary (also how run_suite.py hands
+                               the parent's resolution to its workers)
+ 2. .chromedriver.lock.json  - result of an earlier run, if the binary still exists
+ 3. webdriver-manager        - online lookup; the result is written to the lockfile
+ 4. Selenium Manager         - its offline cache, when webdriver-manager can't reach the network
+
+Set REFRESH_CHROMEDRIVER=1 (or run `python driver_lock.py --refresh`) to
+ignore the lockfile and resolve again.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+LOCKFILE = Path(os.getenv("CHROMEDRIVER_LOCK", HERE / ".chromedriver.lock.json"))
+
+_resolved = None
+
+
+def read_lock():
+    try:
+        return json.loads(LOCKFILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_lock(**fields):
+    lock = read_lock()
+    lock.update(fields)
+    lock["updated"] = datetime.now().isoformat(timespec="seconds")
+    try:
+        LOCKFILE.write_text(json.dumps(lock, indent=2), encoding="utf-8")
+    except OSError as e:
+        print(f"[driver_lock] could not write {LOCKFILE}: {e}")
+    return lock
+
+
+def _from_webdriver_manager():
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    manager = ChromeDriverManager()
+    path = manager.install()
+    try:
+        version = manager.driver.get_browser_version_from_os()
+    except Exception:
+        version = None
+    return path, version
+
+
+def _from_selenium_manager():
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+    paths = SeleniumManager().binary_paths(["--browser", "chrome", "--offline"])
+    return paths.get("driver_path") or None, None
+
+
+def resolve_driver_path(refresh=False):
+    """Return the chromedriver path to use, or None to leave it to Selenium at launch."""
+    global _resolved
+    refresh = refresh or os.getenv("REFRESH_CHROMEDRIVER") == "1"
+    if _resolved and not refresh:
+        return _resolved
+
+    pinned = os.getenv("CHROMEDRIVER_PATH")
+    if pinned and Path(pinned).exists():
+        _resolved = pinned
+        return _resolved
+
+    lock = read_lock()
+    if not refresh and lock.get("driver_path") and Path(lock["driver_path"]).exists():
+        _resolved = lock["driver_path"]
+        return _resolved
+
+    for source, resolver in (("webdriver-manager", _from_webdriver_manager),
+                             ("selenium-manager", _from_selenium_manager)):
+        try:
+            path, version = resolver()
+        except Exception as e:
+            print(f"[driver_lock] {source} failed: {e}")
+            continue
+        if path:
+            write_lock(driver_path=path, source=source,
+                       browser_version=version or lock.get("browser_version"))
+            _resolved = path
+            return _resolved
+
+    # Keep using a stale-but-present lock entry rather than failing outright.
+    if lock.get("driver_path") and Path(lock["driver_path"]).exists():
+        _resolved = lock["driver_path"]
+    return _resolved
+
+
+def record_browser_version(version):
+    """Store the browser version a session actually reported (cheap, no probing)."""
+    if version and read_lock().get("browser_version") != version:
+        write_lock(browser_version=version)
+
+
+if __name__ == "__main__":
+    path = resolve_driver_path(refresh="--refresh" in sys.argv)
+    print(json.dumps({**read_lock(), "resolved": path}, indent=2))
@@ -0,0 +1,161 @@
+"""
+driver_pool.py
+
+Keeps a few Chrome sessions warm so scripts don't pay Chrome's cold start each time.
+
+A leased session behaves like a normal WebDriver; calling quit() on it hands it
+back to the pool, which resets it (cookies, storage, extra tabs, about:blank)
+before the next lease. Sessions are really quit after `max_uses` leases or if
+the reset fails.
+
+Enable it for scripts with DRIVER_POOL_SIZE=N (utils.new_driver() then leases
+from the process-wide pool), or `python run_suite.py --warm`.
+"""
+
+import atexit
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from selenium.webdriver.chrome.options import Options
+
+DEFAULT_MAX_USES = 25
+
+
+class PooledDriver:
+    """Proxy for a pooled WebDriver; quit() returns the session instead of closing it."""
+
+    def __init__(self, pool, driver):
+        self._pool = pool
+        self._driver = driver
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def quit(self):
+        if self._driver is not None:
+            driver, self._driver = self._driver, None
+            self._pool._leases.discard(self)
+            self._pool.release(driver)
+
+
+class DriverPool:
+    def __init__(self, size=1, max_uses=DEFAULT_MAX_USES, options_factory=None, profile_root=None):
+        from utils import launch_chrome
+
+        self.size = size
+        self.max_uses = max_uses
+        self._launch_chrome = launch_chrome
+        self._options_factory = options_factory or Options
+        self._profile_root = Path(profile_root) if profile_root else None
+        self._idle = queue.Queue()
+        self._leases = set()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._launched = 0
+        self._closed = False
+        with ThreadPoolExecutor(max_workers=size) as ex:
+            for driver in ex.map(lambda _: self._launch(), range(size)):
+                self._idle.put(driver)
+
+    def _launch(self):
+        with self._lock:
+            slot = self._launched
+            self._launched += 1
+        profile = None
+        if self._profile_root:
+            profile = self._profile_root / f"session-{slot}"
+            profile.mkdir(parents=True, exist_ok=True)
+        driver = self._launch_chrome(self._options_factory(), profile_dir=profile)
+        self._uses[id(driver)] = 0
+        return driver
+
+    def acquire(self, timeout=None):
+        """Lease a warm session (blocks while all sessions are leased)."""
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        driver = self._idle.get(timeout=timeout)
+        self._uses[id(driver)] += 1
+        lease = PooledDriver(self, driver)
+        self._leases.add(lease)
+        return lease
+
+    def release(self, driver):
+        if self._closed:
+            self._quit(driver)
+            return
+        if self._uses.get(id(driver), 0) >= self.max_uses or not reset_session(driver):
+            self._quit(driver)
+            driver = self._launch()
+        self._idle.put(driver)
+
+    def _quit(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def reclaim(self):
+        """Return sessions that were leased but never quit (e.g. a script crashed)."""
+        for lease in list(self._leases):
+            lease.quit()
+
+    def close(self):
+        self.reclaim()
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+def reset_session(driver):
+    """Bring a used session back to a blank state. Returns False if the session is unusable."""
+    try:
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Clear storage for every origin this tab visited, then all cookies.
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        origins = set()
+        for entry in history.get("entries", []):
+            parts = urlsplit(entry.get("url", ""))
+            if parts.scheme in ("http", "https"):
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": origin,
+                "storageTypes": "local_storage,session_storage,indexeddb,cache_storage,service_workers",
+            })
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+        driver.implicitly_wait(0)
+        driver.get("about:blank")
+        driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+        return True
+    except Exception:
+        return False
+
+
+_shared = None
+
+
+def shared_pool():
+    """Process-wide pool sized by DRIVER_POOL_SIZE, created on first use."""
+    global _shared
+    if _shared is None:
+        _shared = DriverPool(
+            size=int(os.getenv("DRIVER_POOL_SIZE", "1")),
+            max_uses=int(os.getenv("DRIVER_POOL_MAX_USES", str(DEFAULT_MAX_USES))),
+            profile_root=os.getenv("CHROME_USER_DATA_DIR"),
+        )
+        atexit.register(_shared.close)
+    return _shared
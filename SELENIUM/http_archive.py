@@ -0,0 +1,308 @@
+"""
+http_archive.py
+
+Record/replay of every HTTP response a script's browser makes, via CDP Fetch
+interception on the page target, so reruns can be hermetic and skip the network.
+
+Archives are per test (archives/<name>/index.json, name = utils.script_name())
+and point into a shared content-addressed blob store (archives/blobs/<sha256>),
+so a stylesheet fetched by ten scripts is stored once.
+
+HTTP_ARCHIVE selects the mode (utils.new_driver() attaches automatically):
+    record  - always go to the network, (re)write the archive
+    replay  - serve from the archive only; misses fail as if offline (zero network)
+    auto    - serve hits from the archive, fetch and record misses
+
+    HTTP_ARCHIVE=record python run_suite.py     # or --archive record
+    HTTP_ARCHIVE=replay python run_suite.py TC05
+    python http_archive.py                      # list archives with entry counts
+
+Hit/miss/record counts for the current script are in STATS (run_suite.py adds
+them to summary.json). Only the driver's main tab is intercepted.
+"""
+
+import atexit
+import base64
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.request import urlopen
+
+HERE = Path(__file__).resolve().parent
+ARCHIVE_DIR = Path(os.getenv("HTTP_ARCHIVE_DIR", HERE / "archives"))
+MODES = ("record", "replay", "auto")
+
+# Headers that describe the wire encoding; replayed bodies are already decoded.
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+STATS = Counter()
+_active = {}
+_active_lock = threading.Lock()
+
+
+def mode():
+    value = os.getenv("HTTP_ARCHIVE", "").lower()
+    return value if value in MODES else None
+
+
+def request_key(method, url, post_data=None):
+    h = hashlib.sha256(f"{method} {url}".encode("utf-8"))
+    if post_data:
+        h.update(b"\0" + post_data.encode("utf-8"))
+    return h.hexdigest()
+
+
+class BlobStore:
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def put(self, data):
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.root / digest[:2] / digest
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest):
+        return (self.root / digest[:2] / digest).read_bytes()
+
+
+class Archive:
+    """One test's index of request key -> recorded response."""
+
+    def __init__(self, name, root=ARCHIVE_DIR):
+        self.name = name
+        self.path = Path(root) / name / "index.json"
+        self.blobs = BlobStore(Path(root) / "blobs")
+        self.lock = threading.Lock()
+        self.dirty = False
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def lookup(self, key):
+        with self.lock:
+            return self.entries.get(key)
+
+    def store(self, key, method, url, status, headers, body):
+        entry = {"method": method, "url": url, "status": status, "headers": headers,
+                 "blob": self.blobs.put(body), "size": len(body)}
+        with self.lock:
+            self.entries[key] = entry
+            self.dirty = True
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.entries, indent=1), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self.dirty = False
+
+
+def page_websocket(driver):
+    """CDP websocket URL of the driver's current tab (via Chrome's debuggerAddress)."""
+    address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    handle = driver.current_window_handle
+    with urlopen(f"http://{address}/json/list", timeout=10) as resp:
+        targets = json.load(resp)
+    target = next((t for t in targets if t.get("id") == handle), None) \
+        or next(t for t in targets if t.get("type") == "page")
+    return target["webSocketDebuggerUrl"]
+
+
+class CdpSession:
+    """Minimal CDP client on a page target's websocket; events go to a handler on worker
+    threads (workers=1 keeps them in order)."""
+
+    def __init__(self, ws_url, on_event, workers=8):
+        import websocket
+
+        self.ws = websocket.create_connection(ws_url, timeout=None, suppress_origin=True)
+        self.on_event = on_event
+        self.next_id = 0
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.closed = False
+        self.handlers = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cdp-event")
+        self.reader = threading.Thread(target=self._read, name="cdp-reader", daemon=True)
+        self.reader.start()
+
+    def send(self, method, params=None, wait=True, timeout=30):
+        with self.lock:
+            self.next_id += 1
+            msg_id = self.next_id
+            done = threading.Event()
+            if wait:
+                self.pending[msg_id] = [done, None]
+            self.ws.send(json.dumps({"id": msg_id, "method": method, "params": params or {}}))
+        if not wait:
+            return None
+        if not done.wait(timeout):
+            raise TimeoutError(f"CDP {method} timed out")
+        reply = self.pending.pop(msg_id)[1]
+        if "error" in reply:
+            raise RuntimeError(f"CDP {method}: {reply['error'].get('message')}")
+        return reply.get("result", {})
+
+    def _read(self):
+        while not self.closed:
+            try:
+                msg = json.loads(self.ws.recv())
+            except Exception:
+                break
+            if "id" in msg:
+                slot = self.pending.get(msg["id"])
+                if slot:
+                    slot[1] = msg
+                    slot[0].set()
+            elif not self.closed:
+                self.handlers.submit(self.on_event, msg["method"], msg.get("params", {}))
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+        self.handlers.shutdown(wait=False, cancel_futures=True)
+
+
+class Interceptor:
+    """Serves/records the Fetch.requestPaused events of one browser tab."""
+
+    def __init__(self, driver, archive, mode):
+        self.archive = archive
+        self.mode = mode
+        self.target = page_websocket(driver)
+        self.cdp = CdpSession(self.target, self.on_event)
+        stage = "Response" if mode == "record" else "Request"
+        self.cdp.send("Fetch.enable", {"patterns": [{"urlPattern": "*", "requestStage": stage}]})
+
+    def on_event(self, method, params):
+        if method != "Fetch.requestPaused":
+            return
+        try:
+            if "responseStatusCode" in params or "responseErrorReason" in params:
+                self.record(params)
+            else:
+                self.serve(params)
+        except Exception as e:
+            STATS["errors"] += 1
+            print(f"[http_archive] {params.get('request', {}).get('url')}: {e}")
+            try:
+                self.cdp.send("Fetch.continueRequest", {"requestId": params["requestId"]}, wait=False)
+            except Exception:
+                pass
+
+    def serve(self, params):
+        req = params["request"]
+        if not req["url"].startswith(("http://", "https://")):
+            self.cdp.send("Fetch.continueRequest", {"requestId": params["requestId"]}, wait=False)
+            return
+        key = request_key(req["method"], req["url"], req.get("postData"))
+        entry = self.archive.lookup(key)
+        if entry:
+            body = self.archive.blobs.get(entry["blob"])
+            STATS["hits"] += 1
+            STATS["bytes_served"] += len(body)
+            self.cdp.send("Fetch.fulfillRequest", {
+                "requestId": params["requestId"],
+                "responseCode": entry["status"],
+                "responseHeaders": entry["headers"],
+                "body": base64.b64encode(body).decode("ascii"),
+            }, wait=False)
+            return
+        STATS["misses"] += 1
+        if self.mode == "replay":
+            self.cdp.send("Fetch.failRequest", {"requestId": params["requestId"],
+                                                "errorReason": "InternetDisconnected"}, wait=False)
+        else:
+            self.cdp.send("Fetch.continueRequest", {"requestId": params["requestId"],
+                                                    "interceptResponse": True}, wait=False)
+
+    def record(self, params):
+        req = params["request"]
+        status = params.get("responseStatusCode")
+        if status and req["url"].startswith(("http://", "https://")):
+            body = b""
+            if not 300 <= status < 400:
+                try:
+                    reply = self.cdp.send("Fetch.getResponseBody", {"requestId": params["requestId"]})
+                    body = (base64.b64decode(reply["body"]) if reply.get("base64Encoded")
+                            else reply["body"].encode("utf-8"))
+                except RuntimeError:
+                    pass  # no body (e.g. 204, HEAD)
+            headers = [h for h in params.get("responseHeaders", [])
+                       if h["name"].lower() not in _DROP_HEADERS]
+            self.archive.store(request_key(req["method"], req["url"], req.get("postData")),
+                               req["method"], req["url"], status, headers, body)
+            STATS["recorded"] += 1
+        self.cdp.send("Fetch.continueRequest", {"requestId": params["requestId"]}, wait=False)
+
+    def close(self):
+        try:
+            self.cdp.send("Fetch.disable", timeout=5)
+        except Exception:
+            pass
+        self.cdp.close()
+        self.archive.save()
+
+
+def attach(driver, name, archive_mode=None):
+    """Start intercepting `driver`'s main tab against archive `name`; None if archiving is off."""
+    archive_mode = archive_mode or mode()
+    if not archive_mode:
+        return None
+    archive = Archive(name)
+    if archive_mode == "record":
+        archive.entries.clear()
+    interceptor = Interceptor(driver, archive, archive_mode)
+    with _active_lock:
+        previous = _active.pop(interceptor.target, None)
+        _active[interceptor.target] = interceptor
+    if previous:  # a pooled session re-leased by the next script
+        previous.close()
+    return interceptor
+
+
+def detach_all():
+    """Stop intercepting and write every archive touched by this process."""
+    with _active_lock:
+        interceptors = list(_active.values())
+        _active.clear()
+    for interceptor in interceptors:
+        interceptor.close()
+
+
+atexit.register(detach_all)
+
+
+def stats():
+    return {k: STATS[k] for k in ("hits", "misses", "recorded", "errors", "bytes_served")}
+
+
+def report(out=sys.stdout):
+    for index in sorted(ARCHIVE_DIR.glob("*/index.json")):
+        entries = json.loads(index.read_text(encoding="utf-8"))
+        size = sum(e.get("size", 0) for e in entries.values())
+        print(f"  {index.parent.name:<12} {len(entries):>5} responses  {size / 1024:>9.1f} KiB", file=out)
+
+
+if __name__ == "__main__":
+    if not ARCHIVE_DIR.exists():
+        print(f"No archives yet ({ARCHIVE_DIR}).")
+    else:
+        report()
@@ -1,21 +1,63 @@
 """
-four_tools_5yr_trends.py
+import matplotlib.py
 
-Creates a 5-year trend chart for:
- - playwright (npm)
- - selenium-webdriver (npm)
- - testim (fallback to Google Trends if not on npm)
- - mabl (fallback to Google Trends if not on npm)
+Creates 5-year trend charts for the tools listed in trend_catalogue.toml
+(--catalogue PATH; .yaml/.yml work too when PyYAML is installed): npm
+downloads where a tool has npm packages (aliases summed into one series),
+Google Trends interest as the fallback where it has none.
 
-Output: four_tools_trend.png
+Output: tools_trend.{png,svg,html,json} - one small-multiples panel per
+catalogue group, lines ranked by their latest value (top N per panel) - plus
+tools_trend_<group>.* for groups with more tools than fit a panel, and a
+ranking printed to the console. The HTML file is self-contained (inline SVG,
+ranking table, the data as embedded JSON); --formats picks a subset.
+
+Without a terminal (cron, CI) or with --batch the charts are drawn with the
+Agg backend and never shown, and several charts render in parallel worker
+processes (--workers). An interactive run opens the charts after saving them.
+
+Fetches run on a thread pool sharing one HTTP session; a per-host rate limiter
+(HOST_INTERVALS) spaces out the requests to each API. Unscoped npm packages
+are fetched through the bulk endpoint, up to NPM_BULK_MAX per request (scoped
+ones one by one); Trends-only tools are fetched alongside, and the Trends
+fallbacks for tools without npm data run in parallel once npm has answered.
+
+npm daily downloads are cached in SQLite (NPM_CACHE_DB, default
+.npm_downloads.sqlite next to this script), one row per package and day. A
+run only requests the days it has not fetched yet - after the last cached one
+(plus REFETCH_DAYS, which npm may still be filling in) and any gap a failed
+chunk left - split into chunks of at most NPM_MAX_RANGE_DAYS
+(the API's 18-month limit) fetched in parallel. --offline (or
+NPM_CACHE_OFFLINE=1) draws the chart from the cache alone.
+
+Aggregation is one pass over a long (source, label, date, value) frame of all
+tools: a single groupby resamples every series to `freq` (npm downloads
+summed, Trends interest averaged), one unstack/reindex aligns them and one
+rolling call smooths every column. --freq weekly|monthly|quarterly (or a
+pandas alias) and --smooth N choose the period and window.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import urlsplit
+import argparse
+import html
+import io
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
 import time
 import sys
+import tomllib
 
 # Optional: import pytrends for Google Trends fallback
 try:
@@ -24,57 +66,400 @@ try:
 except Exception:
     PYTRENDS_OK = False
 
+# Optional: PyYAML for .yaml catalogues
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
 # ---------- CONFIG ----------
-# mapping: label -> npm package name (or None to force google trends use)
-items = {
-    "Playwright": "playwright",               # npm package
-    "Selenium": "selenium-webdriver",         # npm package
-    "Testim": "testim",                       # may not exist on npm
-    "Mabl": "mabl"                            # may not exist on npm
-}
+CATALOGUE = Path(__file__).resolve().parent / "trend_catalogue.toml"
+# label -> {"npm": [packages], "group": ..., "trends": keyword or None}; see load_catalogue
+items = {}
 
-months_rolling = 3   # smoothing window (months)
-outfile = "four_tools_trend.png"
+title = "Test automation tools"
+freq = "monthly"     # period of the chart: weekly, monthly, quarterly or a pandas alias
+smoothing_periods = 3   # rolling-mean window, in periods of `freq`
+top = 8              # lines per small-multiples panel
+outfile = "tools_trend.png"
+max_workers = 8      # concurrent fetches
+# minimum seconds between two requests to the same host
+HOST_INTERVALS = {
+    "api.npmjs.org": 0.2,
+    "trends.google.com": 2.0,   # Google rate-limits pytrends aggressively
+}
+DEFAULT_INTERVAL = 0.5
+FREQUENCIES = {"weekly": "W-SUN", "monthly": "ME", "quarterly": "QE"}
+NPM_CACHE_DB = Path(os.getenv("NPM_CACHE_DB", Path(__file__).resolve().parent / ".npm_downloads.sqlite"))
+NPM_MAX_RANGE_DAYS = 540   # the downloads API serves at most 18 months per request
+NPM_BULK_MAX = 128         # bulk requests: at most 128 unscoped packages ...
+NPM_BULK_MAX_DAYS = 365    # ... and 365 days
+npm_bulk = True
+trends_enabled = True
+trends_geo = ""
+REFETCH_DAYS = 2           # the newest days may still be incomplete on npm's side
+RETRY_STATUSES = {429, 500, 502, 503, 504}  # retried with backoff by fetch_npm_range
+RETRY_BACKOFF = 2.0        # seconds before the first retry, doubled per retry (or Retry-After)
+offline = os.getenv("NPM_CACHE_OFFLINE") == "1"
 # ----------------------------
 
+def load_catalogue(path=CATALOGUE):
+    """Read a TOML (or YAML) catalogue into `items` and the settings above."""
+    global title, freq, smoothing_periods, top, outfile, npm_bulk, trends_enabled, trends_geo
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        if yaml is None:
+            sys.exit(f"{path}: install PyYAML to read YAML catalogues (pip install pyyaml)")
+        config = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    else:
+        config = tomllib.loads(path.read_text(encoding="utf-8"))
+
+    settings = config.get("settings", {})
+    title = settings.get("title", title)
+    freq = settings.get("freq", freq)
+    smoothing_periods = settings.get("smoothing", smoothing_periods)
+    top = settings.get("top", top)
+    outfile = settings.get("outfile", outfile)
+    npm_conf = config.get("sources", {}).get("npm", {})
+    trends_conf = config.get("sources", {}).get("trends", {})
+    npm_bulk = npm_conf.get("bulk", npm_bulk)
+    trends_enabled = trends_conf.get("enabled", trends_enabled)
+    trends_geo = trends_conf.get("geo", trends_geo)
+    for host, conf in (("api.npmjs.org", npm_conf), ("trends.google.com", trends_conf)):
+        if "interval" in conf:
+            HOST_INTERVALS[host] = conf["interval"]
+
+    items.clear()
+    for label, tool in config.get("tools", {}).items():
+        npm = tool.get("npm") or []
+        npm = [npm] if isinstance(npm, str) else list(npm)
+        trends = tool.get("trends", label)
+        items[label] = {
+            "npm": npm + [a for a in tool.get("aliases", []) if a not in npm],
+            "group": tool.get("group", "Other"),
+            "trends": trends if trends is not False else None,
+        }
+    if not items:
+        sys.exit(f"{path}: no [tools.<name>] entries")
+    return items
+
+class HostRateLimiter:
+    """Spaces out requests per host; safe to share between threads."""
+
+    def __init__(self, intervals, default=DEFAULT_INTERVAL):
+        self.intervals = intervals
+        self.default = default
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def wait(self, host):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.intervals.get(host, self.default)
+        if slot > now:
+            time.sleep(slot - now)
+
+rate_limiter = HostRateLimiter(HOST_INTERVALS)
+
+_session = None
+_session_lock = threading.Lock()
+
+def http_session():
+    """One pooled session for every fetch thread."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
 def five_years_ago_iso():
     today = date.today()
     five_years_ago = today.replace(year=today.year - 5)
     return five_years_ago.isoformat(), today.isoformat()
 
+def _retry_delay(resp, retry):
+    """Seconds to wait before retry number `retry`: the server's Retry-After if it
+    gives one in seconds, else exponential backoff."""
+    after = resp.headers.get("Retry-After", "") if resp is not None else ""
+    return float(after) if after.isdigit() else RETRY_BACKOFF * 2 ** (retry - 1)
+
 def fetch_npm_range(pkg, start_iso, end_iso, max_retries=2):
-    """Fetch daily downloads for npm package from api.npmjs.org."""
+    """Fetch daily downloads for npm package from api.npmjs.org. Network errors,
+    429 and 5xx responses are retried up to max_retries times with backoff."""
     url = f"https://api.npmjs.org/downloads/range/{start_iso}:{end_iso}/{pkg}"
-    tries = 0
-    while tries <= max_retries:
-        tries += 1
+    attempts = max_retries + 1
+    result = None
+    for attempt in range(1, attempts + 1):
+        resp = None
         try:
-            resp = requests.get(url, timeout=15)
+            rate_limiter.wait(urlsplit(url).netloc)
+            resp = http_session().get(url, timeout=15)
             # 200 -> data; 404 -> no data
             if resp.status_code == 200:
                 return resp.json()
-            else:
-                # return the response for caller to inspect
-                return {"status": resp.status_code, "text": resp.text}
+            # return the response for caller to inspect
+            result = {"status": resp.status_code, "text": resp.text}
+            if resp.status_code not in RETRY_STATUSES:
+                return result
+            problem = f"HTTP {resp.status_code}"
         except requests.RequestException as e:
-            print(f"[npm fetch] error for {pkg}: {e} (try {tries}/{max_retries})")
-            time.sleep(1)
-    return None
+            problem = e
+        if attempt < attempts:
+            delay = _retry_delay(resp, attempt)
+            print(f"[npm fetch] {problem} for {pkg} (try {attempt}/{attempts}), retrying in {delay:g}s")
+            time.sleep(delay)
+        else:
+            print(f"[npm fetch] {problem} for {pkg} (try {attempt}/{attempts}), giving up")
+    return result
 
-def daily_json_to_series(json_obj):
-    """Convert npm downloads JSON to pandas Series indexed by date (daily)."""
-    if not json_obj or "downloads" not in json_obj:
-        return None
-    downloads = json_obj["downloads"]
-    if not downloads:
+# ---------- npm download cache ----------
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS npm_downloads (
+    package   TEXT NOT NULL,
+    day       TEXT NOT NULL,
+    downloads INTEGER NOT NULL,
+    PRIMARY KEY (package, day)
+);
+CREATE TABLE IF NOT EXISTS npm_fetched (
+    package   TEXT NOT NULL,
+    first_day TEXT NOT NULL,
+    last_day  TEXT NOT NULL,
+    PRIMARY KEY (package, first_day)
+);
+-- npm_coverage kept a single range per package; npm_fetched replaces it
+DROP TABLE IF EXISTS npm_coverage;
+"""
+
+_cache_lock = threading.Lock()
+
+@contextmanager
+def _cache_db():
+    """A connection for the calling thread (sqlite3 connections are per-thread),
+    committed and closed on exit."""
+    conn = sqlite3.connect(NPM_CACHE_DB, timeout=10)
+    try:
+        conn.executescript(_CACHE_SCHEMA)
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+def npm_chunks(start_iso, end_iso, max_days=NPM_MAX_RANGE_DAYS):
+    """Split [start, end] into consecutive (start, end) ISO ranges of at most max_days days."""
+    start, end = date.fromisoformat(start_iso), date.fromisoformat(end_iso)
+    chunks = []
+    while start <= end:
+        stop = min(start + timedelta(days=max_days - 1), end)
+        chunks.append((start.isoformat(), stop.isoformat()))
+        start = stop + timedelta(days=1)
+    return chunks
+
+def merge_ranges(ranges):
+    """Sorted (first, last) date ranges with overlapping or adjacent ones joined."""
+    merged = []
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + timedelta(days=1):
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+    return [tuple(r) for r in merged]
+
+def _fetched_ranges(conn, pkg):
+    rows = conn.execute("SELECT first_day, last_day FROM npm_fetched WHERE package = ?", (pkg,))
+    return merge_ranges((date.fromisoformat(a), date.fromisoformat(b)) for a, b in rows)
+
+def missing_ranges(pkg, start_iso, end_iso):
+    """Date ranges of [start, end] not yet in the cache for pkg: the gaps between
+    the ranges fetched so far (a chunk that failed leaves one), plus the last
+    REFETCH_DAYS of the newest range."""
+    with _cache_db() as conn:
+        fetched = _fetched_ranges(conn, pkg)
+    if fetched:
+        first, last = fetched[-1]
+        last -= timedelta(days=REFETCH_DAYS)
+        fetched[-1:] = [(first, last)] if last >= first else []
+    start, end = date.fromisoformat(start_iso), date.fromisoformat(end_iso)
+    ranges = []
+    for first, last in fetched:
+        if first > start:
+            ranges.append((start, min(first - timedelta(days=1), end)))
+        start = max(start, last + timedelta(days=1))
+        if start > end:
+            break
+    if start <= end:
+        ranges.append((start, end))
+    return [(a.isoformat(), b.isoformat()) for a, b in ranges]
+
+def store_npm_days(pkg, downloads, start_iso, end_iso):
+    """Save daily rows and record [start, end] as fetched for pkg. Fetched ranges
+    are kept per chunk and only joined where they touch, so a chunk that failed
+    in between stays missing until a later run gets it."""
+    with _cache_lock, _cache_db() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO npm_downloads (package, day, downloads) VALUES (?, ?, ?)",
+            [(pkg, d["day"], d["downloads"]) for d in downloads])
+        fetched = _fetched_ranges(conn, pkg)
+        fetched = merge_ranges(fetched + [(date.fromisoformat(start_iso), date.fromisoformat(end_iso))])
+        conn.execute("DELETE FROM npm_fetched WHERE package = ?", (pkg,))
+        conn.executemany("INSERT INTO npm_fetched (package, first_day, last_day) VALUES (?, ?, ?)",
+                         [(pkg, a.isoformat(), b.isoformat()) for a, b in fetched])
+
+def cached_npm_range(pkg, start_iso, end_iso):
+    """Cached days of pkg in [start, end], in fetch_npm_range's JSON shape (None if none)."""
+    with _cache_db() as conn:
+        rows = conn.execute(
+            "SELECT day, downloads FROM npm_downloads WHERE package = ? AND day BETWEEN ? AND ? ORDER BY day",
+            (pkg, start_iso, end_iso)).fetchall()
+    if not rows:
         return None
-    df = pd.DataFrame(downloads)
-    df["date"] = pd.to_datetime(df["day"])
-    df.set_index("date", inplace=True)
-    return df["downloads"].sort_index()
+    return {"package": pkg, "start": start_iso, "end": end_iso,
+            "downloads": [{"day": day, "downloads": n} for day, n in rows]}
+
+def fetch_npm_cached(pkg, start_iso, end_iso):
+    """Like fetch_npm_range, but only requests the days the cache lacks, in parallel
+    chunks the API accepts; with offline set it never touches the network."""
+    ranges = [] if offline else missing_ranges(pkg, start_iso, end_iso)
+    chunks = [c for r in ranges for c in npm_chunks(*r)]
+    failure = None
+    if chunks:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            results = list(pool.map(lambda c: fetch_npm_range(pkg, *c), chunks))
+        for (chunk_start, chunk_end), json_obj in zip(chunks, results):
+            if json_obj and isinstance(json_obj, dict) and "downloads" in json_obj:
+                store_npm_days(pkg, json_obj["downloads"], chunk_start, chunk_end)
+            elif isinstance(json_obj, dict) and json_obj.get("status") == 404:
+                # not on npm: remember the range as fetched (with no days) so it is not asked again
+                store_npm_days(pkg, [], chunk_start, chunk_end)
+                failure = json_obj
+            else:
+                # other statuses (429, 5xx) or None after network errors: not stored, so the
+                # chunk stays missing and the next run asks for it again
+                failure = json_obj
+        fetched = sum(len(r["downloads"]) for r in results if isinstance(r, dict) and "downloads" in r)
+        print(f"[npm cache] {pkg}: fetched {len(chunks)} chunk(s), {fetched} days")
+        if isinstance(failure, dict) and failure.get("status") == 404:
+            print(f"[npm cache] {pkg}: 404, cached as no downloads for good - if it is published "
+                  f"later, delete its npm_fetched rows from {NPM_CACHE_DB} to fetch it again")
+    return cached_npm_range(pkg, start_iso, end_iso) or failure
+
+def fetch_npm_bulk_cached(packages, start_iso, end_iso):
+    """fetch_npm_cached for many packages: unscoped ones share bulk requests
+    (NPM_BULK_MAX packages x NPM_BULK_MAX_DAYS per request), scoped ones - which
+    the bulk endpoint does not take - go one by one. Everything runs in parallel."""
+    if offline:
+        return
+    by_range = {}
+    singles = []
+    bulk_count = 0
+    for pkg in dict.fromkeys(packages):
+        if pkg.startswith("@") or not npm_bulk:
+            singles.append(pkg)
+            continue
+        ranges = tuple(missing_ranges(pkg, start_iso, end_iso))
+        if ranges:
+            by_range.setdefault(ranges, []).append(pkg)
+
+    requests_ = []  # (packages, chunk start, chunk end)
+    for ranges, pkgs in by_range.items():
+        if len(pkgs) == 1:  # a one-package "bulk" request gets the single-package response shape
+            singles.append(pkgs[0])
+            continue
+        bulk_count += len(pkgs)
+        for i in range(0, len(pkgs), NPM_BULK_MAX):
+            batch = pkgs[i:i + NPM_BULK_MAX]
+            requests_ += [(batch, *c) for r in ranges for c in npm_chunks(*r, max_days=NPM_BULK_MAX_DAYS)]
+
+    not_on_npm = set()
+
+    def bulk_request(req):
+        """Store one bulk response; the batch's packages if the request failed."""
+        batch, chunk_start, chunk_end = req
+        json_obj = fetch_npm_range(",".join(batch), chunk_start, chunk_end)
+        if not isinstance(json_obj, dict) or "status" in json_obj:
+            status = json_obj.get("status") if isinstance(json_obj, dict) else "no response"
+            print(f"[npm bulk] {len(batch)} packages {chunk_start}..{chunk_end} failed: {status}")
+            return batch
+        for pkg in batch:
+            data = json_obj.get(pkg)
+            if not isinstance(data, dict):  # null for packages not on npm
+                not_on_npm.add(pkg)
+                data = {}
+            store_npm_days(pkg, data.get("downloads", []), chunk_start, chunk_end)
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        failed = list(dict.fromkeys(pkg for batch in pool.map(bulk_request, requests_) for pkg in batch))
+        # the failed chunks are still missing from the cache, so fetch_npm_cached asks
+        # for just those days again, one package at a time
+        for _ in pool.map(lambda pkg: fetch_npm_cached(pkg, start_iso, end_iso), singles + failed):
+            pass
+    print(f"[npm] {len(requests_)} bulk request(s) for {bulk_count} packages, "
+          f"{len(singles)} single-package fetch(es)")
+    if not_on_npm:
+        print(f"[npm] not on npm, cached as no downloads for good: {', '.join(sorted(not_on_npm))} - "
+              f"if one is published later, delete its npm_fetched rows from {NPM_CACHE_DB}")
+    if failed:
+        print(f"[npm] retried {len(failed)} package(s) from failed bulk requests one by one: {', '.join(failed)}")
+
+def npm_day_counts(packages, start_iso, end_iso):
+    """{package: cached days in [start, end]} in one query."""
+    if not packages:
+        return {}
+    marks = ",".join("?" * len(packages))
+    with _cache_db() as conn:
+        rows = conn.execute(
+            f"SELECT package, COUNT(*) FROM npm_downloads WHERE package IN ({marks}) "
+            f"AND day BETWEEN ? AND ? GROUP BY package",
+            [*packages, start_iso, end_iso]).fetchall()
+    return dict(rows)
+
+def load_npm_long(packages, start_iso, end_iso):
+    """Cached daily downloads of {label: [packages]} in [start, end] as one long
+    frame (source, label, date, value), read with a single query. A label's
+    packages (its aliases) end up as rows of the same series."""
+    label_of = {pkg: label for label, pkgs in packages.items() for pkg in pkgs}
+    if not label_of:
+        return pd.DataFrame(columns=["source", "label", "date", "value"])
+    marks = ",".join("?" * len(label_of))
+    with _cache_db() as conn:
+        df = pd.read_sql_query(
+            f"SELECT package, day, downloads FROM npm_downloads "
+            f"WHERE package IN ({marks}) AND day BETWEEN ? AND ?",
+            conn, params=[*label_of, start_iso, end_iso])
+    return pd.DataFrame({"source": "npm", "label": df["package"].map(label_of),
+                         "date": pd.to_datetime(df["day"]), "value": df["downloads"]})
+
+def trends_long(label, series):
+    return pd.DataFrame({"source": "trends", "label": label, "date": series.index, "value": series.values})
+
+def aggregate(long_df, start_iso, end_iso, period=None, smoothing=None, order=None):
+    """Resample, align and smooth every series of a long frame in one pass.
+
+    npm rows are summed per period and Google Trends rows averaged. Returns a
+    wide frame indexed by period end with (source, label) columns, in `order`
+    (a list of labels) where given; periods after end_iso's last full one
+    are dropped."""
+    rule = FREQUENCIES.get(period or freq, period or freq)
+    index = pd.date_range(start=start_iso, end=end_iso, freq=rule)
+    if long_df.empty:
+        return pd.DataFrame(index=index, columns=pd.MultiIndex.from_tuples([], names=["source", "label"]))
+    grouped = (long_df.groupby(["source", "label", pd.Grouper(key="date", freq=rule)])["value"]
+               .agg(["sum", "mean"]))
+    is_npm = grouped.index.get_level_values("source") == "npm"
+    values = grouped["sum"].where(is_npm, grouped["mean"])
+    wide = values.unstack(["source", "label"]).reindex(index).fillna(0)
+    if order:
+        rank = {label: i for i, label in enumerate(order)}
+        wide = wide[sorted(wide.columns, key=lambda c: (c[0] != "npm", rank.get(c[1], len(rank))))]
+    return wide.rolling(window=smoothing or smoothing_periods, min_periods=1).mean()
 
 def get_google_trends_series(keyword, start_iso, end_iso, geo=""):
-    """Use pytrends to get weekly interest over time; resample to month sums/means."""
+    """Use pytrends to get weekly interest over time (0-100) as a Series."""
     if not PYTRENDS_OK:
         print("[WARN] pytrends not available; install pytrends to use Google Trends fallback.")
         return None
@@ -83,106 +468,187 @@ def get_google_trends_series(keyword, start_iso, end_iso, geo=""):
     # pytrends expects YYYY-MM-DD formatted times as "YYYY-MM-DD YYYY-MM-DD"
     timeframe = f"{start_iso} {end_iso}"
     try:
+        rate_limiter.wait("trends.google.com")
         pytrends.build_payload([keyword], cat=0, timeframe=timeframe, geo=geo, gprop='')
         df = pytrends.interest_over_time()
         if df.empty:
             return None
         # pytrends returns weekly granularity for long timeframes; column name is the keyword
         series = df[keyword].copy()
-        # convert weekly to monthly by taking the mean of weeks that fall into each month
         series.index = pd.to_datetime(series.index)
-        monthly = series.resample("M").mean()
-        return monthly
+        return series
     except Exception as e:
         print(f"[pytrends] failed for '{keyword}': {e}")
         return None
 
-def build_time_series():
+def fetch_trends(label, keyword, start_iso, end_iso):
+    """Google Trends fallback for one tool: (long frame or None, log lines); the
+    lines are printed together by the caller so concurrent tools do not interleave."""
+    log = []
+    if offline:
+        log.append(f"  -> skipping Google Trends for '{label}': offline run.")
+    elif not trends_enabled or keyword is None:
+        log.append(f"  -> Google Trends fallback disabled for '{label}'.")
+    elif not PYTRENDS_OK:
+        log.append(f"  -> skipping Google Trends fallback for '{label}': pytrends not installed.")
+    else:
+        log.append(f"  -> Attempting Google Trends for '{label}' (keyword '{keyword}') ...")
+        gt = get_google_trends_series(keyword, start_iso, end_iso, geo=trends_geo)
+        if gt is not None and not gt.empty:
+            log.append(f"  -> Google Trends data obtained for '{label}'.")
+            return trends_long(label, gt), log
+        log.append(f"  -> No Google Trends data for '{label}' (or request failed).")
+    return None, log
+
+def build_time_series(period=None, smoothing=None):
+    """Smoothed per-period series of every tool in `items`: (npm downloads,
+    Google Trends) frames, one column per label."""
     start_iso, end_iso = five_years_ago_iso()
-    monthly_npm = pd.DataFrame(index=pd.date_range(start=start_iso, end=end_iso, freq="M"))
-    monthly_trends = pd.DataFrame(index=monthly_npm.index)  # for Google Trends fallback
-
-    for label, pkg in items.items():
-        print(f"Processing '{label}' (npm name: {pkg}) ...")
-        used_npm = False
-        series_monthly = None
-
-        # Try npm if a package name is provided
-        if pkg:
-            json_obj = fetch_npm_range(pkg, start_iso, end_iso)
-            if json_obj and isinstance(json_obj, dict) and json_obj.get("downloads"):
-                daily = daily_json_to_series(json_obj)
-                if daily is not None and not daily.empty:
-                    # aggregate to monthly sums
-                    series_monthly = daily.resample("M").sum()
-                    used_npm = True
-                    print(f"  -> npm data found for {pkg}; using monthly download counts.")
+
+    started = time.perf_counter()
+    npm_tools = {label: tool["npm"] for label, tool in items.items() if tool["npm"]}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Trends-only tools need not wait for npm
+        trends_jobs = {label: pool.submit(fetch_trends, label, tool["trends"], start_iso, end_iso)
+                       for label, tool in items.items() if not tool["npm"]}
+        fetch_npm_bulk_cached([p for pkgs in npm_tools.values() for p in pkgs], start_iso, end_iso)
+
+        days = npm_day_counts([p for pkgs in npm_tools.values() for p in pkgs], start_iso, end_iso)
+        found = {label: [p for p in pkgs if days.get(p)] for label, pkgs in npm_tools.items()}
+        for label, pkgs in found.items():
+            if not pkgs:
+                trends_jobs[label] = pool.submit(fetch_trends, label, items[label]["trends"], start_iso, end_iso)
+
+        frames = []
+        # report in catalogue order so the log reads the same between runs
+        for label, tool in items.items():
+            print(f"Processing '{label}' (npm: {', '.join(tool['npm']) or '-'}) ...")
+            if found.get(label):
+                print(f"  -> npm data found for {', '.join(found[label])}; using download counts.")
+            elif tool["npm"]:
+                print(f"  -> no npm downloads for {', '.join(tool['npm'])}.")
+            if label in trends_jobs:
+                trends, log = trends_jobs[label].result()
+                print("\n".join(log))
+                if trends is not None:
+                    frames.append(trends)
                 else:
-                    print(f"  -> npm responded but no downloads found for '{pkg}'.")
-            else:
-                code = json_obj.get("status") if isinstance(json_obj, dict) else None
-                print(f"  -> npm API returned status {code} for '{pkg}' (likely no npm package).")
-
-        # If no npm data, fallback to Google Trends (keyword = label)
-        if not used_npm:
-            if not PYTRENDS_OK:
-                print(f"  -> skipping Google Trends fallback for '{label}': pytrends not installed.")
-                continue
-            print(f"  -> Attempting Google Trends fallback for '{label}' ...")
-            gt = get_google_trends_series(label, start_iso, end_iso)
-            if gt is not None and not gt.empty:
-                series_monthly = gt  # already monthly (mean of weekly)
-                print(f"  -> Google Trends data obtained for '{label}'.")
-            else:
-                print(f"  -> No Google Trends data for '{label}' (or request failed).")
+                    print(f"  !! no data for '{label}', skipping.")
+    print(f"Fetched {len(items)} tools in {time.perf_counter() - started:.1f}s")
 
-        if series_monthly is None:
-            print(f"  !! no data for '{label}', skipping.")
+    npm_packages = {label: pkgs for label, pkgs in found.items() if pkgs}
+    long_df = pd.concat([load_npm_long(npm_packages, start_iso, end_iso)] + frames, ignore_index=True)
+    wide = aggregate(long_df, start_iso, end_iso, period, smoothing, order=list(items))
+    sources = wide.columns.get_level_values("source")
+    return wide.loc[:, sources == "npm"].droplevel("source", axis=1), \
+        wide.loc[:, sources == "trends"].droplevel("source", axis=1)
+
+def ranking(npm_series, trends_series):
+    """Tools ranked by their latest smoothed value, with the change over the last
+    year (npm downloads first, then Trends interest, which is on another scale)."""
+    rows = []
+    for source, frame in (("npm", npm_series), ("trends", trends_series)):
+        if frame.empty:
             continue
+        latest = frame.iloc[-1]
+        year_ago = frame[frame.index <= frame.index[-1] - pd.DateOffset(years=1)]
+        before = year_ago.iloc[-1] if not year_ago.empty else latest * float("nan")
+        change = (latest / before.where(before > 0) - 1) * 100
+        rows.append(pd.DataFrame({"source": source, "label": frame.columns,
+                                  "group": [items.get(c, {}).get("group", "Other") for c in frame.columns],
+                                  "latest": latest.values, "change_pct": change.values})
+                    .sort_values("latest", ascending=False))
+    if not rows:
+        return pd.DataFrame(columns=["source", "label", "group", "latest", "change_pct"])
+    ranked = pd.concat(rows, ignore_index=True)
+    ranked.index = ranked.index + 1
+    return ranked
 
-        # Align to monthly index and store in appropriate DataFrame
-        series_monthly = series_monthly.reindex(monthly_npm.index, method=None).fillna(0)
-        if used_npm:
-            monthly_npm[label] = series_monthly
-        else:
-            monthly_trends[label] = series_monthly
+def print_ranking(ranked):
+    print("\nRanking (latest period, change vs. a year earlier):")
+    for rank, row in ranked.iterrows():
+        unit = "downloads" if row["source"] == "npm" else "Trends index"
+        change = "" if pd.isna(row["change_pct"]) else f"{row['change_pct']:+7.1f}%"
+        print(f" {rank:>3}. {row['label']:<20} {row['group']:<22} {row['latest']:>14,.0f} {unit:<12} {change}")
 
-        # polite pause to avoid hitting endpoints too fast
-        time.sleep(0.8)
+def _per(period):
+    return {"weekly": "week", "monthly": "month", "quarterly": "quarter"}.get(period, "period")
+
+def draw_small_multiples(npm_series, trends_series, chart):
+    """One panel per group, each showing its top chart["top"] tools by the latest
+    value (npm solid on the left axis, Trends dashed on the right); None if
+    nothing has data. `chart` carries title, period, top and the label -> group
+    map, so this also runs in a worker process."""
+    groups_of = chart["groups"]
+    groups = list(dict.fromkeys(groups_of.values()))
+    latest = pd.concat([npm_series, trends_series], axis=1).iloc[-1]
+    groups = [g for g in groups if any(groups_of.get(c) == g for c in latest.index)]
+    if not groups:
+        return None
+
+    cols = min(3, len(groups))
+    rows = math.ceil(len(groups) / cols)
+    plt.style.use('default')
+    fig, axes = plt.subplots(rows, cols, figsize=(6 * cols, 4 * rows), sharex=True, squeeze=False)
+    for ax, group in zip(axes.flat, groups):
+        members = [label for label, g in groups_of.items() if g == group]
+        # npm and Trends are on different scales: rank npm tools first, each by its latest value
+        ranked = sorted((m for m in members if m in latest.index),
+                        key=lambda m: (m not in npm_series.columns, -latest[m]))
+        shown = ranked[:chart["top"]]
+        npm_cols = [m for m in shown if m in npm_series.columns]
+        trend_cols = [m for m in shown if m in trends_series.columns]
+        for col in npm_cols:
+            ax.plot(npm_series.index, npm_series[col].values, linewidth=1.8, label=col)
+        ax.set_ylabel(f"npm downloads per {_per(chart['period'])}" if npm_cols else "")
+        ax.grid(axis='y', linestyle='--', alpha=0.3)
+        handles, labels = ax.get_legend_handles_labels()
+        if trend_cols:
+            ax_right = ax.twinx() if npm_cols else ax
+            for col in trend_cols:
+                ax_right.plot(trends_series.index, trends_series[col].values, linestyle='--', linewidth=1.8,
+                              label=f"{col} (Trends)")
+            ax_right.set_ylabel("Google Trends (0-100)")
+            if ax_right is not ax:
+                more = ax_right.get_legend_handles_labels()
+                handles, labels = handles + more[0], labels + more[1]
+            else:
+                handles, labels = ax.get_legend_handles_labels()
+        hidden = len(ranked) - len(shown)
+        ax.set_title(group + (f" (top {len(shown)} of {len(ranked)})" if hidden else ""), fontsize=11)
+        ax.legend(handles, labels, loc='upper left', fontsize=8)
+    for ax in list(axes.flat)[len(groups):]:
+        ax.set_visible(False)
 
-    return monthly_npm, monthly_trends
+    fig.suptitle(f"5-Year Trend: {chart['title']}\n(npm downloads where available; Google Trends fallback where not)")
+    fig.tight_layout()
+    return fig
 
-def plot_series(monthly_npm, monthly_trends, outpath=outfile):
+def draw_series(npm_series, trends_series, chart):
+    """Every series on one chart (npm left axis, Trends right); None if nothing has data."""
+    if npm_series.empty and trends_series.empty:
+        return None
     plt.style.use('default')
     fig, ax_left = plt.subplots(figsize=(14,7))
-    plotted_any = False
 
     # Left axis: npm downloads (absolute counts)
-    if not monthly_npm.empty:
-        for col in monthly_npm.columns:
-            # smoothing
-            s = monthly_npm[col].rolling(window=months_rolling, min_periods=1).mean()
-            ax_left.plot(s.index, s.values, linewidth=2.2, label=f"{col} (npm downloads)")
-            plotted_any = True
+    for col in npm_series.columns:
+        s = npm_series[col]
+        ax_left.plot(s.index, s.values, linewidth=2.2, label=f"{col} (npm downloads)")
 
     ax_left.set_xlabel("Date")
-    ax_left.set_ylabel("Downloads per month (npm)")
+    ax_left.set_ylabel(f"Downloads per {_per(chart['period'])} (npm)")
     ax_left.grid(axis='y', linestyle='--', alpha=0.3)
 
     # Right axis: Google Trends index (0-100)
     ax_right = None
-    if not monthly_trends.empty:
+    if not trends_series.empty:
         ax_right = ax_left.twinx()
-        for col in monthly_trends.columns:
-            s = monthly_trends[col].rolling(window=months_rolling, min_periods=1).mean()
+        for col in trends_series.columns:
+            s = trends_series[col]
             ax_right.plot(s.index, s.values, linestyle='--', linewidth=2.2, label=f"{col} (Google Trends)", alpha=0.9)
-            plotted_any = True
         ax_right.set_ylabel("Google Trends interest (0-100)")
 
-    if not plotted_any:
-        print("No series were plotted (no data). Exiting without saving.")
-        return
-
     # Combine legends
     handles_left, labels_left = ax_left.get_legend_handles_labels()
     handles_right, labels_right = (ax_right.get_legend_handles_labels() if ax_right else ([], []))
@@ -191,24 +657,197 @@ def plot_series(monthly_npm, monthly_trends, outpath=outfile):
 
     ax_left.legend(handles, labels, loc='upper left', fontsize=10)
 
-    plt.title("5-Year Trend: Playwright, Selenium, Testim, Mabl\n(npm downloads where available; Google Trends fallback where not)")
+    ax_left.set_title(f"5-Year Trend: {chart['title']}\n(npm downloads where available; Google Trends fallback where not)")
     fig.tight_layout()
-    plt.savefig(outpath, dpi=150)
-    print(f"Saved chart to: {outpath}")
-    plt.show()
+    return fig
+
+# ---------- Rendering ----------
+
+FORMATS = ("png", "svg", "html", "json")
+PARALLEL_MIN_CHARTS = 3   # fewer charts render in-process; starting workers would cost more
+DRAW = {"groups": draw_small_multiples, "single": draw_series}
+
+_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+  body {{ font-family: sans-serif; margin: 2em; color: #222; }}
+  svg {{ max-width: 100%; height: auto; }}
+  table {{ border-collapse: collapse; margin-top: 1em; }}
+  th, td {{ padding: 0.25em 0.8em; border-bottom: 1px solid #ddd; text-align: right; }}
+  th:nth-child(2), td:nth-child(2), th:nth-child(3), td:nth-child(3) {{ text-align: left; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{svg}
+<table>
+<tr><th>#</th><th>Tool</th><th>Group</th><th>Latest</th><th>Source</th><th>1-year change</th></tr>
+{rows}
+</table>
+<script type="application/json" id="trend-data">{data}</script>
+</body>
+</html>
+"""
+
+def chart_data(npm_series, trends_series, chart):
+    """The series behind a chart as plain JSON: {source: {label: [[date, value], ...]}} plus the ranking."""
+    series = {}
+    for source, frame in (("npm", npm_series), ("trends", trends_series)):
+        if not frame.empty:
+            dates = frame.index.strftime("%Y-%m-%d").tolist()
+            series[source] = {col: [[d, round(float(v), 3)] for d, v in zip(dates, frame[col].values)]
+                              for col in frame.columns}
+    ranked = chart["ranking"]
+    return {
+        "title": chart["title"],
+        "period": chart["period"],
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "series": series,
+        "ranking": json.loads(ranked.to_json(orient="records")) if ranked is not None else [],
+    }
+
+def _change(pct):
+    return "" if pct is None else f"{pct:+.1f}%"
+
+def write_outputs(fig, stem, formats, data):
+    """Save one chart in every requested format; returns the written paths."""
+    paths = []
+    svg = None
+    if "png" in formats:
+        fig.savefig(f"{stem}.png", dpi=150)
+        paths.append(f"{stem}.png")
+    if "svg" in formats or "html" in formats:
+        buf = io.StringIO()
+        fig.savefig(buf, format="svg")
+        svg = buf.getvalue()
+        if "svg" in formats:
+            Path(f"{stem}.svg").write_text(svg, encoding="utf-8")
+            paths.append(f"{stem}.svg")
+    if "html" in formats:
+        inline = svg[svg.index("<svg"):]  # drop the XML prolog and doctype
+        rows = "\n".join(
+            f"<tr><td>{i}</td><td>{html.escape(r['label'])}</td><td>{html.escape(r['group'])}</td>"
+            f"<td>{r['latest']:,.0f}</td><td>{r['source']}</td><td>{_change(r['change_pct'])}</td></tr>"
+            for i, r in enumerate(data["ranking"], 1))
+        Path(f"{stem}.html").write_text(_HTML.format(
+            title=html.escape(data["title"]), svg=inline, rows=rows,
+            data=json.dumps(data).replace("</", "<\\/")), encoding="utf-8")
+        paths.append(f"{stem}.html")
+    if "json" in formats:
+        Path(f"{stem}.json").write_text(json.dumps(data, indent=1), encoding="utf-8")
+        paths.append(f"{stem}.json")
+    return paths
+
+def render_chart(job):
+    """Draw and save one chart job (also the worker-process entry point).
+    Returns (written paths, figure or None); the figure is kept open only for show."""
+    if job["batch"]:
+        plt.switch_backend("Agg")
+    fig = DRAW[job["layout"]](job["npm"], job["trends"], job["chart"])
+    if fig is None:
+        return [], None
+    paths = write_outputs(fig, job["stem"], job["formats"],
+                          chart_data(job["npm"], job["trends"], job["chart"]))
+    if job["batch"]:
+        plt.close(fig)
+        fig = None
+    return paths, fig
+
+def chart_jobs(npm_series, trends_series, ranked, layout, period, stem, formats, batch, per_group=False):
+    """The overview chart plus, for groups with more tools than fit a panel (or all
+    groups with per_group), one chart per group with all of its tools."""
+    groups_of = {label: tool["group"] for label, tool in items.items()}
+    base = {"title": title, "period": period, "top": top, "groups": groups_of, "ranking": ranked}
+    jobs = [{"layout": layout, "stem": stem, "npm": npm_series, "trends": trends_series,
+             "chart": base, "formats": formats, "batch": batch}]
+    for group in dict.fromkeys(groups_of.values()):
+        members = [label for label, g in groups_of.items() if g == group]
+        if not per_group and len(members) <= top:
+            continue
+        npm_cols = [m for m in members if m in npm_series.columns]
+        trend_cols = [m for m in members if m in trends_series.columns]
+        if not npm_cols and not trend_cols:
+            continue
+        slug = re.sub(r"[^a-z0-9]+", "-", group.lower()).strip("-")
+        chart = dict(base, title=f"{title}: {group}", top=len(members),
+                     groups={m: group for m in members},
+                     ranking=ranked[ranked["label"].isin(members)] if ranked is not None else None)
+        jobs.append({"layout": "single", "stem": f"{stem}_{slug}", "npm": npm_series[npm_cols],
+                     "trends": trends_series[trend_cols], "chart": chart, "formats": formats, "batch": batch})
+    return jobs
+
+def render_all(jobs, workers=None):
+    """Render every job - in worker processes when there are enough of them (batch
+    mode only: an interactive run keeps its figures to show). Returns the paths."""
+    batch = all(job["batch"] for job in jobs)
+    started = time.perf_counter()
+    if batch and len(jobs) >= PARALLEL_MIN_CHARTS and (workers or os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count(), len(jobs))) as pool:
+            results = list(pool.map(render_chart, jobs))
+    else:
+        results = [render_chart(job) for job in jobs]
+    paths = [p for written, _ in results for p in written]
+    print(f"Rendered {len(jobs)} chart(s) in {time.perf_counter() - started:.1f}s:")
+    for path in paths:
+        print(f"  {path}")
+    return paths
 
 def main():
+    global offline
+    parser = argparse.ArgumentParser(description="5-year trend charts for the tools in a catalogue.")
+    parser.add_argument("--catalogue", default=CATALOGUE,
+                        help="TOML or YAML catalogue of tools (default: trend_catalogue.toml)")
+    parser.add_argument("--layout", choices=("groups", "single"), default="groups",
+                        help="small multiples per group, or every tool on one chart")
+    parser.add_argument("--offline", action="store_true",
+                        help="use only the cached npm data (no network requests to npm)")
+    parser.add_argument("--freq", default=None,
+                        help="chart period: weekly, monthly, quarterly or a pandas alias (default: from the catalogue)")
+    parser.add_argument("--smooth", type=int, default=None,
+                        help="rolling-mean window in periods (default: from the catalogue)")
+    parser.add_argument("--formats", default=",".join(FORMATS),
+                        help=f"comma-separated outputs among {', '.join(FORMATS)} (default: all)")
+    parser.add_argument("--per-group", action="store_true",
+                        help="also write one chart per group (always done for groups with more than `top` tools)")
+    parser.add_argument("--batch", action="store_true",
+                        help="never open a window (implied without a terminal or display): Agg backend, files only")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="render processes for batch runs (default: CPU count)")
+    args = parser.parse_args()
+    offline = args.offline or offline
+    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown:
+        parser.error(f"unknown format(s): {', '.join(unknown)}")
+    batch = args.batch or not sys.stdout.isatty() or plt.get_backend().lower() == "agg"
+    if batch:
+        plt.switch_backend("Agg")
+    load_catalogue(args.catalogue)
+    period = args.freq or freq
     if not PYTRENDS_OK:
         print("Note: 'pytrends' is not installed. The script will still try npm data but cannot fall back to Google Trends.")
         print("To install pytrends: pip install pytrends")
-    monthly_npm, monthly_trends = build_time_series()
+    npm_series, trends_series = build_time_series(period, args.smooth)
     # show small summary
     print("\nData summary:")
-    if not monthly_npm.empty:
-        print(" npm series:", list(monthly_npm.columns))
-    if not monthly_trends.empty:
-        print(" Google Trends series:", list(monthly_trends.columns))
-    plot_series(monthly_npm, monthly_trends)
+    if not npm_series.empty:
+        print(" npm series:", list(npm_series.columns))
+    if not trends_series.empty:
+        print(" Google Trends series:", list(trends_series.columns))
+    if npm_series.empty and trends_series.empty:
+        print("No series were plotted (no data). Exiting without saving.")
+        return
+    ranked = ranking(npm_series, trends_series)
+    print_ranking(ranked)
+
+    stem = str(Path(outfile).with_suffix(""))
+    jobs = chart_jobs(npm_series, trends_series, ranked, args.layout, period, stem, formats, batch, args.per_group)
+    render_all(jobs, args.workers)
+    if not batch:
+        plt.show()
 
 if __name__ == "__main__":
     main()
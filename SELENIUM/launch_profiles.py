@@ -0,0 +1,97 @@
+"""
+launch_profiles.py
+
+Named Chrome launch profiles, applied by utils.launch_chrome() to every session
+(scripts, the conftest fixtures and the driver pool). Pick one with LAUNCH_PROFILE:
+
+    fast-headless   (default) headless, fixed 1440x900 window, background
+                    services/extensions off, page_load_strategy=eager
+    debug-headed    a visible, maximized browser with normal page loads, for
+                    watching or debugging a script
+    ci-low-memory   fast-headless plus /dev/shm off, one renderer per site at
+                    most, a smaller V8 heap and no images, for small CI runners
+
+    LAUNCH_PROFILE=debug-headed python TC04.py
+
+HEADLESS=0 (the older switch) still selects debug-headed when LAUNCH_PROFILE is
+unset. A script's own options (prefs, excludeSwitches, ...) are kept; the
+profile adds its flags and prefs on top.
+
+Compare the profiles on the same scripts:
+
+    python benchmark.py TC05 TC10 -n 5 --tools selenium:fast-headless,selenium:ci-low-memory
+"""
+
+import os
+
+# Flags that only switch off work a test never needs.
+_QUIET = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+PROFILES = {
+    "fast-headless": {
+        "headless": True,
+        "args": ["--window-size=1440,900", "--disable-gpu"] + _QUIET,
+        "prefs": {},
+        "page_load_strategy": "eager",
+    },
+    "debug-headed": {
+        "headless": False,
+        "args": ["--start-maximized"],
+        "prefs": {},
+        "page_load_strategy": "normal",
+    },
+    "ci-low-memory": {
+        "headless": True,
+        "args": ["--window-size=1280,800", "--disable-gpu", "--disable-dev-shm-usage", "--no-sandbox",
+                 "--renderer-process-limit=2", "--js-flags=--max-old-space-size=512"] + _QUIET,
+        # No images: nothing asserts on them, and they are most of the page weight.
+        "prefs": {"profile.managed_default_content_settings.images": 2},
+        "page_load_strategy": "eager",
+    },
+}
+
+DEFAULT = "fast-headless"
+
+
+def name():
+    """The profile selected by LAUNCH_PROFILE (or HEADLESS=0), falling back to the default."""
+    value = os.getenv("LAUNCH_PROFILE", "").strip().lower()
+    if not value:
+        value = "debug-headed" if os.getenv("HEADLESS") == "0" else DEFAULT
+    if value not in PROFILES:
+        raise ValueError(f"unknown LAUNCH_PROFILE {value!r}; choose one of {', '.join(PROFILES)}")
+    return value
+
+
+def headless(profile=None):
+    return PROFILES[profile or name()]["headless"]
+
+
+def apply(options, profile=None):
+    """Add the profile's flags, prefs and load strategy to `options` (idempotent)."""
+    spec = PROFILES[profile or name()]
+    args = list(spec["args"])
+    if spec["headless"]:
+        args.insert(0, "--headless=new")
+        # A maximized window means nothing without a screen; the profile sets a size.
+        while "--start-maximized" in options.arguments:
+            options.arguments.remove("--start-maximized")
+    for arg in args:
+        if arg not in options.arguments:
+            options.add_argument(arg)
+    if spec["prefs"]:
+        prefs = dict(options.experimental_options.get("prefs", {}))
+        prefs.update(spec["prefs"])
+        options.add_experimental_option("prefs", prefs)
+    options.page_load_strategy = spec["page_load_strategy"]
+    return options
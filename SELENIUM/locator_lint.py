@@ -0,0 +1,275 @@
+"""
+locator_lint.py
+
+Static check of the scripts' locators: pulls every literal locator out of the
+TC/NC sources (the fallback lists such as TC02's error_locators or TC08's
+participants_selectors, (By.X, "...") tuples, driver.find_element(s) calls),
+compiles each once with lxml / cssselect and evaluates them all against the
+saved page snapshots (snapshots.py). No browser involved; the whole run takes
+a couple of seconds.
+
+    python locator_lint.py                 # every script, every snapshot
+    python locator_lint.py TC04 TC08       # selected scripts
+    python locator_lint.py --json          # machine-readable report
+
+For each locator it reports the nodes matched per snapshot and the cost of one
+evaluation over all snapshots (best of REPEAT runs), most expensive first, also
+as a multiple of one plain pass over every element ("x1.0"); SLOW_FACTOR
+passes or more is reported as slow. Patterns that are costly in the browser
+too are flagged:
+
+    //*[...]            predicate run on every element of the page
+    translate(., ...)   lower-cases the full text of each candidate's subtree
+    contains(text(),..) only sees the first text node (and still scans)
+
+An XPath or CSS selector that does not compile is an error (exit 1); a CSS
+selector cssselect cannot translate (e.g. a ::before pseudo-element) is listed
+as unchecked.
+Locators built at runtime (f-strings, variables) are skipped.
+"""
+
+import argparse
+import ast
+import json
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import lxml.html
+from cssselect import ExpressionError, SelectorSyntaxError
+from lxml import etree
+from selenium.webdriver.common.by import By
+
+import snapshots
+
+HERE = Path(__file__).resolve().parent
+LIST_NAME = re.compile(r"(locators|selectors)$")
+FIND_CALLS = {"find_element", "find_elements", "find_first"}
+
+REPEAT = 5
+SLOW_FACTOR = 4.0  # cost in plain DOM passes (see _pass_cost)
+SCAN = "//*[@id='__locator_lint__']"
+
+FLAGS = [
+    (re.compile(r"//\*\["), "//*[...]"),
+    (re.compile(r"translate\(\s*\.\s*,"), "translate(., ...)"),
+    (re.compile(r"contains\(\s*text\(\)"), "contains(text(),..)"),
+]
+
+
+@dataclass
+class Locator:
+    by: str
+    value: str
+    where: list = field(default_factory=list)  # "TC02.py:25 error_locators"
+    matches: dict = field(default_factory=dict)  # snapshot name -> node count
+    cost_us: float = 0.0
+    passes: float = 0.0
+    flags: list = field(default_factory=list)
+    error: str = None
+    unchecked: str = None
+
+    @property
+    def key(self):
+        return (self.by, self.value)
+
+
+# ---------- Extraction ----------
+
+def _locator(node):
+    """(by, value) for a literal locator node - a bare string (XPath) or a
+    (By.X, "...") tuple - else None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return By.XPATH, node.value
+    if (isinstance(node, ast.Tuple) and len(node.elts) == 2
+            and isinstance(node.elts[0], ast.Attribute) and isinstance(node.elts[0].value, ast.Name)
+            and node.elts[0].value.id == "By"
+            and isinstance(node.elts[1], ast.Constant) and isinstance(node.elts[1].value, str)):
+        return getattr(By, node.elts[0].attr, None), node.elts[1].value
+    return None
+
+
+class _Collector(ast.NodeVisitor):
+    def __init__(self, filename):
+        self.filename = filename
+        self.found = []  # (by, value, where)
+        self.skipped = 0
+
+    def _add(self, node, label, bare_strings=True):
+        loc = _locator(node)
+        if loc and loc[0] and (bare_strings or not isinstance(node, ast.Constant)):
+            self.found.append((*loc, f"{self.filename}:{node.lineno} {label}"))
+            return True
+        return False
+
+    def _add_list(self, node, label):
+        for elt in node.elts:
+            if not self._add(elt, label):
+                self.skipped += 1
+
+    def visit_Assign(self, node):
+        names = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        if isinstance(node.value, (ast.List, ast.Tuple)) and any(LIST_NAME.search(n) for n in names):
+            self._add_list(node.value, names[0])
+            return
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        name = getattr(node.func, "attr", getattr(node.func, "id", None))
+        rest = node.args
+        if name == "find_first" and len(node.args) >= 2:
+            # find_first(driver, [candidates, ...]) or find_first(driver, (By.X, "..."))
+            candidates, rest = node.args[1], node.args[2:]
+            if isinstance(candidates, (ast.List, ast.Tuple)) and not _locator(candidates):
+                self._add_list(candidates, name)
+            elif not self._add(candidates, name):
+                rest = node.args[1:]
+        elif name in FIND_CALLS and len(node.args) >= 2:
+            # driver.find_element(By.X, "...")
+            loc = _locator(ast.Tuple(elts=node.args[:2]))
+            if loc and loc[0]:
+                self.found.append((*loc, f"{self.filename}:{node.lineno} {name}"))
+                rest = node.args[2:]
+        self.visit(node.func)
+        for arg in rest + [k.value for k in node.keywords]:
+            self.visit(arg)
+
+    def visit_Tuple(self, node):
+        # (By.X, "...") anywhere else: EC conditions, locator dicts, ...
+        if not self._add(node, "tuple", bare_strings=False):
+            self.generic_visit(node)
+
+
+def extract(paths):
+    """Locators in the given scripts, merged by (by, value); plus the count of skipped entries."""
+    merged, skipped = {}, 0
+    for path in paths:
+        collector = _Collector(path.name)
+        collector.visit(ast.parse(path.read_text(encoding="utf-8"), filename=str(path)))
+        skipped += collector.skipped
+        for by, value, where in collector.found:
+            merged.setdefault((by, value), Locator(by, value)).where.append(where)
+    return list(merged.values()), skipped
+
+
+# ---------- Evaluation ----------
+
+def load_snapshots():
+    """Parsed trees of the non-empty *.html captures in this folder."""
+    trees = {}
+    for path in sorted(HERE.glob("*.html")):
+        if path.stat().st_size >= snapshots.MIN_SIZE:
+            trees[path.name] = lxml.html.document_fromstring(path.read_bytes())
+    return trees
+
+
+def _cost(compiled, trees):
+    """Seconds for one evaluation over all trees, best of REPEAT runs."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        for tree in trees.values():
+            compiled(tree)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _pass_cost(trees):
+    """Cost of one plain pass over every element: the unit for Locator.passes."""
+    return _cost(etree.XPath(SCAN), trees)
+
+
+def evaluate(locators, trees):
+    unit = _pass_cost(trees) if trees else 0
+    for loc in locators:
+        try:
+            compiled = snapshots.compile_locator(loc.key)
+        except ExpressionError as e:
+            loc.unchecked = str(e)
+            continue
+        except (SelectorSyntaxError, etree.XPathSyntaxError, ValueError) as e:
+            loc.error = f"{type(e).__name__}: {e}"
+            continue
+        try:
+            for name, tree in trees.items():
+                loc.matches[name] = sum(isinstance(n, lxml.html.HtmlElement) for n in compiled(tree))
+            if trees:
+                cost = _cost(compiled, trees)
+                loc.cost_us = round(cost * 1e6, 1)
+                loc.passes = round(cost / unit, 2)
+        except etree.XPathEvalError as e:
+            loc.error = f"XPathEvalError: {e}"
+        loc.flags = [label for pattern, label in FLAGS if loc.by == By.XPATH and pattern.search(loc.value)]
+
+
+def scripts(names=None):
+    paths = sorted(p for p in HERE.iterdir() if re.match(r"^(TC|NC)\d+\.py$", p.name))
+    if names:
+        wanted = {n.upper().removesuffix(".PY") for n in names}
+        paths = [p for p in paths if p.stem.upper() in wanted]
+    return paths
+
+
+def report(locators, trees, skipped, slow_factor=SLOW_FACTOR, out=sys.stdout):
+    short = {name: f"s{i}" for i, name in enumerate(trees, 1)}
+    print(f"{len(locators)} locators from the scripts ({skipped} runtime-built skipped), "
+          f"{len(trees)} snapshots:", file=out)
+    for name, tag in short.items():
+        print(f"  {tag} = {name}", file=out)
+    print(file=out)
+    for loc in sorted(locators, key=lambda l: (l.error is None, -l.cost_us)):
+        if loc.error:
+            status = "ERROR"
+        elif loc.unchecked:
+            status = "unchk"
+        elif loc.passes >= slow_factor:
+            status = "SLOW "
+        else:
+            status = "ok   "
+        hits = " ".join(f"{short[n]}:{c}" for n, c in loc.matches.items() if c) or "no matches"
+        print(f"{status} {loc.cost_us:>8.1f} us x{loc.passes:<5.1f} {loc.by}={loc.value[:80]!r}", file=out)
+        print(f"{'':>25}{hits}; {', '.join(loc.where[:3])}{' ...' if len(loc.where) > 3 else ''}", file=out)
+        for note in filter(None, [loc.error, loc.unchecked and f"cssselect cannot check it: {loc.unchecked}"]):
+            print(f"{'':>25}{note}", file=out)
+        if loc.flags:
+            print(f"{'':>25}flagged: {', '.join(loc.flags)}", file=out)
+    errors = sum(bool(l.error) for l in locators)
+    slow = sum(l.passes >= slow_factor for l in locators)
+    never = sum(not l.error and not l.unchecked and not any(l.matches.values()) for l in locators)
+    print(f"\n{errors} errors, {slow} slow (>= {slow_factor:g} DOM passes), {sum(bool(l.flags) for l in locators)} flagged, "
+          f"{never} match no snapshot", file=out)
+
+
+def test_locators_compile():
+    locators, _ = extract(scripts())
+    evaluate(locators, {"empty": lxml.html.document_fromstring("<html><body></body></html>")})
+    bad = [f"{l.by}={l.value!r} ({l.where[0]}): {l.error}" for l in locators if l.error]
+    assert not bad, "\n".join(bad)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the scripts' locators against the saved snapshots.")
+    parser.add_argument("scripts", nargs="*", help="script stems, e.g. TC04 TC08 (default: all)")
+    parser.add_argument("--slow", type=float, default=SLOW_FACTOR,
+                        help=f"report locators costing this many plain DOM passes or more as slow "
+                             f"(default {SLOW_FACTOR:g})")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    paths = scripts(args.scripts)
+    if not paths:
+        parser.error("no matching TC/NC scripts found")
+    locators, skipped = extract(paths)
+    trees = load_snapshots()
+    evaluate(locators, trees)
+    if args.json:
+        print(json.dumps([asdict(l) for l in locators], indent=1))
+    else:
+        report(locators, trees, skipped, args.slow)
+    return 1 if any(l.error for l in locators) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+locator_stats.py
+
+Remembers which candidate of a fallback locator list actually matched, per
+site + logical element name, so later runs try the usual winner first.
+
+utils.find_first(..., key="search_button") reads and updates it. Stats live in
+a small SQLite file (safe with several run_suite.py workers writing at once);
+entries not seen for LOCATOR_STATS_TTL_DAYS (default 30) expire.
+
+    python locator_stats.py            # hit rate / latency report (locator drift)
+    LOCATOR_STATS=0 python TC04.py     # disable reordering and recording
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+DB_PATH = Path(os.getenv("LOCATOR_STATS_DB", HERE / ".locator_stats.sqlite"))
+TTL_SECONDS = float(os.getenv("LOCATOR_STATS_TTL_DAYS", "30")) * 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS locator_stats (
+    site      TEXT NOT NULL,
+    name      TEXT NOT NULL,
+    locator   TEXT NOT NULL,
+    hits      INTEGER NOT NULL DEFAULT 0,
+    misses    INTEGER NOT NULL DEFAULT 0,
+    total_ms  REAL NOT NULL DEFAULT 0,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (site, name, locator)
+)
+"""
+
+_conn = None
+
+
+def enabled():
+    return os.getenv("LOCATOR_STATS", "1") != "0"
+
+
+def _db():
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_PATH, timeout=10, isolation_level=None)
+        _conn.execute(_SCHEMA)
+        _conn.execute("DELETE FROM locator_stats WHERE last_seen < ?", (time.time() - TTL_SECONDS,))
+    return _conn
+
+
+def order(site, name, locator_ids):
+    """Indices of `locator_ids`, best success rate first (unseen ones keep their place)."""
+    rows = _db().execute(
+        "SELECT locator, hits, misses FROM locator_stats WHERE site = ? AND name = ?",
+        (site, name)).fetchall()
+    stats = {loc: (hits, misses) for loc, hits, misses in rows}
+
+    def score(i):
+        hits, misses = stats.get(locator_ids[i], (0, 0))
+        return (hits + 1) / (hits + misses + 2)  # Laplace-smoothed: unseen = 0.5
+
+    return sorted(range(len(locator_ids)), key=lambda i: -score(i))
+
+
+def record(site, name, tried_ids, winner_id, elapsed_ms):
+    """Count a hit (with latency) for the winner and a miss for every candidate tried before it."""
+    now = time.time()
+    db = _db()
+    with db:
+        for loc in tried_ids:
+            hit = loc == winner_id
+            db.execute(
+                """INSERT INTO locator_stats (site, name, locator, hits, misses, total_ms, last_seen)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (site, name, locator) DO UPDATE SET
+                       hits = hits + excluded.hits,
+                       misses = misses + excluded.misses,
+                       total_ms = total_ms + excluded.total_ms,
+                       last_seen = excluded.last_seen""",
+                (site, name, loc, int(hit), int(not hit), elapsed_ms if hit else 0, now))
+
+
+def report(out=sys.stdout):
+    rows = _db().execute(
+        "SELECT site, name, locator, hits, misses, total_ms FROM locator_stats "
+        "ORDER BY site, name, hits * 1.0 / (hits + misses) DESC").fetchall()
+    current = None
+    for site, name, loc, hits, misses, total_ms in rows:
+        if (site, name) != current:
+            current = (site, name)
+            print(f"\n{site} :: {name}", file=out)
+        rate = hits / (hits + misses) if hits + misses else 0
+        avg = f"{total_ms / hits:7.0f} ms" if hits else "      - ms"
+        print(f"  {rate:6.1%}  {hits:>4} hit {misses:>4} miss  {avg}  {loc}", file=out)
+
+
+if __name__ == "__main__":
+    if not DB_PATH.exists():
+        print(f"No locator stats yet ({DB_PATH}).")
+    else:
+        report()
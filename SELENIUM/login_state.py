@@ -0,0 +1,233 @@
+"""
+login_state.py
+
+Logs in to a demo site once per worker process and reuses the session.
+
+The first login(driver, site) in a process goes through the site's UI login
+form, then snapshots the browser's cookies and localStorage. Later calls - in
+the same or a new Chrome session - inject that snapshot instead (cookies via
+CDP before the first navigation, localStorage on the first document) and open
+the post-login landing page directly:
+
+    login_state.login(driver, "orangehrm")   # -> "fresh" the first time, then "restored"
+
+A snapshot is dropped and the UI login repeated when one of its cookies has
+expired or when the landing page does not show the logged-in marker (the server
+forgot the session, someone logged out). Tests about logging in (TC01, TC02,
+TC03, NC01) keep their own UI flow and do not call this; LOGIN_CACHE=0 makes
+every call a UI login.
+
+Counts for the current script (restored / fresh / expired) are in STATS.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils import credentials, fill_form, site_url
+
+STATS = Counter()
+
+# Per site: login page, its form fields, the post-login landing page and an
+# element that is only there when logged in.
+SITES = {
+    "saucedemo": {
+        "login": "/",
+        "username": (By.ID, "user-name"),
+        "password": (By.ID, "password"),
+        "submit": (By.ID, "login-button"),
+        "landing": "/inventory.html",
+        "logged_in": (By.CLASS_NAME, "inventory_list"),
+    },
+    "orangehrm": {
+        "login": "/web/index.php/auth/login",
+        "username": (By.NAME, "username"),
+        "password": (By.NAME, "password"),
+        "submit": (By.CSS_SELECTOR, "button[type='submit']"),
+        "landing": "/web/index.php/dashboard/index",
+        "logged_in": (By.XPATH, "//span[normalize-space()='PIM']"),
+    },
+    "parabank": {
+        "login": "/parabank/index.htm",
+        "username": (By.NAME, "username"),
+        "password": (By.NAME, "password"),
+        "submit": (By.CSS_SELECTOR, "input.button[value='Log In']"),
+        "landing": "/parabank/overview.htm",
+        "logged_in": (By.LINK_TEXT, "Log Out"),
+    },
+    "moodle": {
+        "login": "/login/index.php",
+        "username": (By.ID, "username"),
+        "password": (By.ID, "password"),
+        "submit": (By.ID, "loginbtn"),
+        "landing": "/my/",
+        "logged_in": (By.CSS_SELECTOR, "a[href*='login/logout.php']"),
+    },
+}
+
+LOGIN_TIMEOUT = 25
+CHECK_TIMEOUT = 5
+EXPIRY_MARGIN = 30  # seconds; a cookie this close to expiring counts as expired
+
+_lock = threading.Lock()
+_snapshots = {}  # (site root URL, username) -> {"cookies": [...], "local_storage": {...}}
+
+_READ_STORAGE_JS = "return JSON.stringify(Object.assign({}, window.localStorage));"
+
+# Runs once on the first document of the landing navigation (see _inject).
+_WRITE_STORAGE_JS = """
+(function () {
+  if (location.origin !== %(origin)s || sessionStorage.getItem('__login_state')) return;
+  sessionStorage.setItem('__login_state', '1');
+  var items = %(items)s;
+  for (var k in items) localStorage.setItem(k, items[k]);
+})();
+"""
+
+
+def enabled():
+    return os.getenv("LOGIN_CACHE", "1") != "0"
+
+
+def _key(site, username):
+    return (site_url(site), username)
+
+
+def _origin(site):
+    parts = urlsplit(site_url(site))
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _logged_in(driver, site, timeout=CHECK_TIMEOUT):
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located(SITES[site]["logged_in"]))
+        return True
+    except TimeoutException:
+        return False
+
+
+def _ui_login(driver, site, username, password):
+    spec = SITES[site]
+    driver.get(site_url(site, spec["login"]))
+    fill_form(driver, {spec["username"]: username, spec["password"]: password}, timeout=LOGIN_TIMEOUT)
+    driver.find_element(*spec["submit"]).click()
+    if not _logged_in(driver, site, LOGIN_TIMEOUT):
+        raise AssertionError(f"{site}: login as {username!r} failed (still at {driver.current_url})")
+
+
+def _snapshot(driver):
+    try:
+        storage = json.loads(driver.execute_script(_READ_STORAGE_JS) or "{}")
+    except WebDriverException:
+        storage = {}
+    return {"cookies": driver.get_cookies(), "local_storage": storage}
+
+
+def _expired(snapshot):
+    now = time.time() + EXPIRY_MARGIN
+    return any(c.get("expiry") and c["expiry"] < now for c in snapshot["cookies"])
+
+
+def _cdp_cookie(cookie, scheme):
+    """A get_cookies() entry as a CDP Network.CookieParam."""
+    param = {k: cookie[k] for k in ("name", "value", "path", "secure", "httpOnly") if k in cookie}
+    domain = cookie.get("domain", "")
+    if domain.startswith("."):
+        param["domain"] = domain
+    else:  # host-only cookie: pin it to the host with a URL
+        param["url"] = f"{scheme}://{domain}{cookie.get('path', '/')}"
+    if cookie.get("expiry"):
+        param["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+        param["sameSite"] = cookie["sameSite"]
+    return param
+
+
+def _has_cdp(driver):
+    """Whether `driver` takes CDP commands (local Chrome); a remote or non-Chrome
+    driver has no execute_cdp_cmd or rejects it."""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+    except WebDriverException:
+        return False
+    return True
+
+
+def _inject(driver, site, snapshot):
+    """Put the snapshot into the browser and open the landing page."""
+    landing = site_url(site, SITES[site]["landing"])
+    origin = _origin(site)
+    if not _has_cdp(driver):
+        # No CDP: set everything from the site's own origin.
+        driver.get(site_url(site, SITES[site]["login"]))
+        for cookie in snapshot["cookies"]:
+            driver.add_cookie({k: v for k, v in cookie.items() if k != "domain" or v.startswith(".")})
+        for k, v in snapshot["local_storage"].items():
+            driver.execute_script("localStorage.setItem(arguments[0], arguments[1]);", k, v)
+        driver.get(landing)
+        return
+    driver.execute_cdp_cmd("Network.setCookies", {
+        "cookies": [_cdp_cookie(c, urlsplit(origin).scheme) for c in snapshot["cookies"]]})
+    script = None
+    if snapshot["local_storage"]:
+        script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": _WRITE_STORAGE_JS % {"origin": json.dumps(origin),
+                                           "items": json.dumps(snapshot["local_storage"])}})
+    try:
+        driver.get(landing)
+    finally:
+        if script:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                   {"identifier": script["identifier"]})
+
+
+def login(driver, site, username=None):
+    """Leave `driver` logged in to `site` on its landing page; returns "restored" or "fresh"."""
+    username, password = credentials(site, username)
+    key = _key(site, username)
+    if enabled():
+        with _lock:
+            snapshot = _snapshots.get(key)
+        if snapshot is not None:
+            if not _expired(snapshot):
+                _inject(driver, site, snapshot)
+                if _logged_in(driver, site):
+                    STATS["restored"] += 1
+                    print(f"      Reused {site} session for {username}")
+                    return "restored"
+            STATS["expired"] += 1
+            print(f"      Cached {site} session for {username} expired, logging in again")
+            with _lock:
+                _snapshots.pop(key, None)
+            driver.delete_all_cookies()
+
+    _ui_login(driver, site, username, password)
+    STATS["fresh"] += 1
+    if enabled():
+        snapshot = _snapshot(driver)
+        with _lock:
+            _snapshots[key] = snapshot
+    if urlsplit(driver.current_url).path != urlsplit(site_url(site, SITES[site]["landing"])).path:
+        driver.get(site_url(site, SITES[site]["landing"]))
+    return "fresh"
+
+
+def forget(site=None):
+    """Drop cached sessions (all, or one site's)."""
+    with _lock:
+        for key in [k for k in _snapshots if site is None or k[0] == site_url(site)]:
+            del _snapshots[key]
+
+
+def stats():
+    return {k: STATS[k] for k in ("restored", "fresh", "expired")}
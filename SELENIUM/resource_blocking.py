@@ -0,0 +1,330 @@
+"""
+resource_blocking.py
+
+Blocks third-party trackers, ads, web fonts and (optionally) images and media in
+a script's browser with CDP Network.setBlockedURLs, so the demo sites reach
+"loaded" sooner, and reports what each page load saved.
+
+RESOURCE_BLOCKING selects the mode (utils.new_driver() attaches automatically):
+    on        - block; per page load print requests blocked, bytes and ms saved
+    baseline  - block nothing; record response sizes and load times to compare against
+    (unset)   - off
+
+    python run_suite.py --blocking baseline TC04 TC09   # once, unblocked
+    python run_suite.py --blocking on TC04 TC09         # "~840 KiB, ~1300 ms saved" per page
+
+Bytes saved are the recorded sizes of the blocked URLs; ms saved is the page's
+baseline load time (median of the last runs) minus this load. Both need a
+baseline run first; without one only the blocked-request counts are reported.
+The baseline lives in SQLite (.resource_baseline.sqlite,
+RESOURCE_BASELINE), so run_suite's worker processes can all add to it.
+
+Lists: RULES holds a "*" entry for every site plus per-site (utils.SITES name)
+"deny" and "allow" URL patterns (`*` wildcards). A page gets the "*" and its
+own site's deny patterns, minus any pattern its site allows. BLOCKLIST_FILE
+points to a JSON file of the same shape whose lists are added to these.
+BLOCK_MEDIA=1 also drops images, audio and video.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import statistics
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from http_archive import CdpSession, page_websocket
+
+HERE = Path(__file__).resolve().parent
+BASELINE = Path(os.getenv("RESOURCE_BASELINE", HERE / ".resource_baseline.sqlite"))
+MODES = ("on", "baseline")
+
+RULES = {
+    "*": {
+        "deny": [
+            "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+            "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*",
+            "*facebook.net*", "*hotjar.com*", "*clarity.ms*", "*cdn.segment.com*",
+            "*mixpanel.com*", "*nr-data.net*", "*intercom.io*", "*tawk.to*",
+            "*onesignal.com*", "*addthis.com*", "*sharethis.com*",
+        ],
+        "allow": [],
+    },
+    "phptravels": {
+        "deny": ["*fonts.googleapis.com*", "*fonts.gstatic.com*", "*maps.googleapis.com*",
+                 "*translate.google*", "*translate.googleapis.com*"],
+        "allow": [],
+    },
+    "saucedemo": {"deny": ["*backtrace.io*"], "allow": []},
+    "moodle": {"deny": ["*fonts.googleapis.com*", "*fonts.gstatic.com*"], "allow": []},
+    "orangehrm": {"deny": [], "allow": []},
+    "parabank": {"deny": [], "allow": []},
+}
+
+MEDIA = ["*.png", "*.png?*", "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.gif", "*.gif?*",
+         "*.webp", "*.webp?*", "*.avif", "*.ico", "*.mp4", "*.webm", "*.mp3", "*.ogg"]
+
+BASELINE_RUNS = 5  # load times kept per page
+
+STATS = Counter()
+PAGES = []  # per page load of the current script: url, blocked, bytes_saved, ms_saved, ...
+
+_active = {}
+_lock = threading.Lock()
+
+
+def mode():
+    value = os.getenv("RESOURCE_BLOCKING", "").lower()
+    return value if value in MODES else None
+
+
+def rules():
+    """RULES merged with BLOCKLIST_FILE, if set."""
+    merged = {site: {k: list(v) for k, v in lists.items()} for site, lists in RULES.items()}
+    path = os.getenv("BLOCKLIST_FILE")
+    if path:
+        for site, lists in json.loads(Path(path).read_text(encoding="utf-8")).items():
+            entry = merged.setdefault(site, {"deny": [], "allow": []})
+            for kind in ("deny", "allow"):
+                entry[kind] += [p for p in lists.get(kind, []) if p not in entry[kind]]
+    return merged
+
+
+def patterns(site=None, media=None, table=None):
+    """URL patterns to block on a page of `site`. With no site (before the first
+    navigation) every site's deny list applies, minus anything any site allows."""
+    table = table or rules()
+    media = os.getenv("BLOCK_MEDIA") == "1" if media is None else media
+    sites = [site] if site in table else [s for s in table if s != "*"] if site is None else []
+    deny = list(table["*"]["deny"]) + [p for s in sites for p in table[s]["deny"]]
+    allow = set(table["*"]["allow"]) | {p for s in sites for p in table[s]["allow"]}
+    if media:
+        deny += MEDIA
+    return [p for p in dict.fromkeys(deny) if p not in allow]
+
+
+def site_for(url):
+    """utils.SITES name serving `url` (live host or BASE_URL/<name>), or None."""
+    from utils import SITES
+
+    base = os.getenv("BASE_URL")
+    if base and url.startswith(base.rstrip("/") + "/"):
+        first = url[len(base.rstrip("/")) + 1:].split("/", 1)[0].split("?", 1)[0]
+        return first if first in SITES else None
+    host = urlsplit(url).netloc
+    return next((name for name, root in SITES.items() if urlsplit(root).netloc == host), None)
+
+
+def page_key(url):
+    parts = urlsplit(url)
+    return parts.netloc + parts.path
+
+
+# ---------- Baseline ----------
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS baseline_sizes (
+    url  TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS baseline_loads (
+    page    TEXT NOT NULL,
+    load_ms REAL NOT NULL,
+    at      REAL NOT NULL
+);
+"""
+
+
+def _db(path=None):
+    conn = sqlite3.connect(path or BASELINE, timeout=10, isolation_level=None)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def load_baseline(path=None):
+    """{"sizes": {url: bytes}, "loads": {page: [ms, ...]}} (oldest load first)."""
+    path = path or BASELINE
+    if not path.exists():
+        return {"sizes": {}, "loads": {}}
+    conn = _db(path)
+    try:
+        sizes = dict(conn.execute("SELECT url, size FROM baseline_sizes"))
+        loads = {}
+        for page, load_ms in conn.execute("SELECT page, load_ms FROM baseline_loads ORDER BY at, rowid"):
+            loads.setdefault(page, []).append(load_ms)
+    finally:
+        conn.close()
+    return {"sizes": sizes, "loads": loads}
+
+
+def save_baseline(sizes, loads, path=None):
+    """Add new sizes and load times to the baseline, keeping the last BASELINE_RUNS
+    loads per page. One transaction per call, so concurrent workers do not lose
+    each other's rows."""
+    conn = _db(path)
+    try:
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT INTO baseline_sizes (url, size) VALUES (?, ?) "
+            "ON CONFLICT (url) DO UPDATE SET size = excluded.size", sizes.items())
+        conn.executemany("INSERT INTO baseline_loads (page, load_ms, at) VALUES (?, ?, ?)",
+                         [(page, ms, now) for page, values in loads.items() for ms in values])
+        conn.executemany(
+            """DELETE FROM baseline_loads WHERE page = ? AND rowid NOT IN (
+                   SELECT rowid FROM baseline_loads WHERE page = ? ORDER BY at DESC, rowid DESC LIMIT ?)""",
+            [(page, page, BASELINE_RUNS) for page in loads])
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+class Blocker:
+    """Blocks by pattern on one browser tab and accounts for each page load."""
+
+    def __init__(self, driver, blocking_mode):
+        self.mode = blocking_mode
+        self.table = rules()
+        self.baseline = load_baseline()
+        self.new_sizes = {}
+        self.new_loads = {}
+        self.urls = {}       # requestId -> url
+        self.page = None
+        self.site = False    # False: nothing applied yet
+        self.target = page_websocket(driver)
+        self.cdp = CdpSession(self.target, self.on_event, workers=1)  # page accounting needs event order
+        frames = self.cdp.send("Page.getFrameTree")
+        self.main_frame = frames["frameTree"]["frame"]["id"]
+        self.cdp.send("Network.enable")
+        self.cdp.send("Page.enable")
+        self.apply(None)
+
+    def apply(self, site):
+        if self.mode != "on" or site == self.site:
+            return
+        self.site = site
+        self.cdp.send("Network.setBlockedURLs", {"urls": patterns(site, table=self.table)}, wait=False)
+
+    def on_event(self, method, params):
+        try:
+            handler = getattr(self, "_" + method.replace(".", "_"), None)
+            if handler:
+                handler(params)
+        except Exception as e:
+            STATS["errors"] += 1
+            print(f"[blocking] {method}: {e!r}")
+
+    def _Network_requestWillBeSent(self, params):
+        url = params["request"]["url"]
+        self.urls[params["requestId"]] = url
+        if (params.get("type") == "Document" and params.get("frameId") == self.main_frame
+                and params["requestId"] == params.get("loaderId")):
+            self.finish_page()
+            self.apply(site_for(url))
+            self.page = {"url": url, "start": params["timestamp"], "requests": 0, "blocked": 0,
+                         "bytes": 0, "bytes_saved": 0, "unknown_size": 0}
+
+    def _Network_loadingFinished(self, params):
+        url = self.urls.pop(params["requestId"], None)
+        if url is None:
+            return
+        size = int(params.get("encodedDataLength", 0))
+        if self.mode == "baseline" and size:
+            self.new_sizes[url] = size
+        if self.page:
+            self.page["requests"] += 1
+            self.page["bytes"] += size
+
+    def _Network_loadingFailed(self, params):
+        url = self.urls.pop(params["requestId"], None)
+        if not params.get("blockedReason") or not self.page:
+            return
+        self.page["blocked"] += 1
+        size = self.baseline["sizes"].get(url)
+        if size is None:
+            self.page["unknown_size"] += 1
+        else:
+            self.page["bytes_saved"] += size
+
+    def _Page_loadEventFired(self, params):
+        if self.page and "load_ms" not in self.page:
+            self.page["load_ms"] = round((params["timestamp"] - self.page["start"]) * 1000, 1)
+            self.finish_page()
+
+    def finish_page(self):
+        page, self.page = self.page, None
+        if not page:
+            return
+        key = page_key(page["url"])
+        if self.mode == "baseline":
+            if "load_ms" in page:
+                self.new_loads.setdefault(key, []).append(page["load_ms"])
+            return
+        before = self.baseline["loads"].get(key)
+        if "load_ms" in page and before:
+            page["ms_saved"] = round(statistics.median(before) - page["load_ms"], 1)
+        page.pop("start", None)
+        with _lock:
+            PAGES.append(page)
+            STATS["pages"] += 1
+            STATS["blocked"] += page["blocked"]
+            STATS["bytes_saved"] += page["bytes_saved"]
+            STATS["ms_saved"] += page.get("ms_saved", 0)
+        saved = f"~{page['bytes_saved'] / 1024:.0f} KiB"
+        if page["unknown_size"]:
+            saved += f" (+{page['unknown_size']} not in baseline)"
+        if "ms_saved" in page:
+            saved += f", ~{page['ms_saved']:.0f} ms"
+        print(f"[blocking] {key}: {page['blocked']} requests blocked, {saved} saved")
+
+    def close(self):
+        self.finish_page()
+        try:
+            self.cdp.send("Network.setBlockedURLs", {"urls": []}, timeout=5)
+        except Exception:
+            pass
+        self.cdp.close()
+        if self.mode == "baseline" and (self.new_sizes or self.new_loads):
+            save_baseline(self.new_sizes, self.new_loads)
+
+
+def attach(driver, blocking_mode=None):
+    """Start blocking (or baselining) on `driver`'s main tab; None if blocking is off."""
+    blocking_mode = blocking_mode or mode()
+    if not blocking_mode:
+        return None
+    blocker = Blocker(driver, blocking_mode)
+    with _lock:
+        previous = _active.pop(blocker.target, None)
+        _active[blocker.target] = blocker
+    if previous:  # a pooled session re-leased by the next script
+        previous.close()
+    return blocker
+
+
+def detach_all():
+    with _lock:
+        blockers = list(_active.values())
+        _active.clear()
+    for blocker in blockers:
+        blocker.close()
+
+
+atexit.register(detach_all)
+
+
+def stats():
+    return {k: STATS[k] for k in ("pages", "blocked", "bytes_saved", "ms_saved", "errors")}
+
+
+if __name__ == "__main__":
+    base = load_baseline()
+    print(f"Baseline {BASELINE}: {len(base['sizes'])} response sizes, {len(base['loads'])} pages")
+    for key, values in sorted(base["loads"].items()):
+        print(f"  {key:<60} {statistics.median(values):>8.0f} ms  (n={len(values)})")
+    for site in [None] + [s for s in rules() if s != "*"]:
+        print(f"{site or 'before the first navigation'}: blocks {len(patterns(site))} URL patterns")
@@ -0,0 +1,270 @@
+"""
+run_suite.py
+
+Runs the TC/NC scripts in this folder across a pool of worker processes.
+
+Each script is a pytest-style test with a `__main__` entry point
+(utils.run_standalone), so every task runs one script as __main__ inside a
+worker with:
+ - its own Chrome profile (one --user-data-dir per worker process)
+ - its own artifact directory (screenshots / page dumps land there)
+
+Usage:
+    python run_suite.py                 # all TC*.py and NC*.py, one worker per core
+    python run_suite.py -w 4 TC04 NC03  # selected scripts, 4 workers
+    python run_suite.py --warm          # each worker keeps a warm Chrome (driver_pool.py)
+    python run_suite.py --standin       # against local stand-in sites (standin_server.py)
+    python run_suite.py --archive replay  # serve HTTP from recorded archives (http_archive.py)
+    python run_suite.py --blocking on   # block trackers/fonts/ads (resource_blocking.py)
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing.util
+import os
+import re
+import runpy
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+from driver_lock import resolve_driver_path
+
+HERE = Path(__file__).resolve().parent
+SCRIPT_NAME = re.compile(r"^(TC|NC)\d+\.py$")
+
+# Scripts exit 1 when their test raises (utils.run_standalone); the NC scripts,
+# which expect their errors, report the verdict on stdout instead.
+PASS_MARKERS = re.compile(r"test passed", re.IGNORECASE)
+FAIL_MARKERS = re.compile(r"test failed|assertion fail", re.IGNORECASE)
+
+
+def discover(names=None):
+    """Return the TC/NC script paths, optionally filtered by stem (e.g. 'TC04')."""
+    scripts = sorted(p for p in HERE.iterdir() if SCRIPT_NAME.match(p.name))
+    if names:
+        wanted = {n.upper().removesuffix(".PY") for n in names}
+        scripts = [p for p in scripts if p.stem.upper() in wanted]
+    return scripts
+
+
+def verdict(output, crashed, failed=False):
+    if crashed:
+        return "error"
+    if failed or FAIL_MARKERS.search(output):
+        return "failed"
+    if PASS_MARKERS.search(output):
+        return "passed"
+    return "completed"
+
+
+def _init_worker(out_dir, warm):
+    """Give this worker process its own Chrome profile for all of its scripts."""
+    profile = Path(out_dir) / "profiles" / f"worker-{os.getpid()}"
+    profile.mkdir(parents=True, exist_ok=True)
+    os.environ["CHROME_USER_DATA_DIR"] = str(profile)
+    if str(HERE) not in sys.path:
+        sys.path.insert(0, str(HERE))
+    if warm:
+        os.environ.setdefault("DRIVER_POOL_SIZE", "1")
+        from driver_pool import shared_pool
+        pool = shared_pool()  # launch Chrome now, before the first script is handed over
+        # Pool workers skip atexit, so close the warm sessions via multiprocessing's finalizers.
+        multiprocessing.util.Finalize(None, pool.close, exitpriority=10)
+
+
+def run_script(script, out_dir):
+    """Run one script in this worker; its cwd is the script's artifact directory."""
+    script = Path(script)
+    artifact_dir = Path(out_dir) / script.stem
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    log_path = artifact_dir / "output.log"
+
+    import artifacts
+    import http_archive
+    import login_state
+    import resource_blocking
+    import utils
+    artifacts.reset()
+    utils.WAIT_LOG.clear()
+    utils.STEPS.clear()
+    http_archive.STATS.clear()
+    resource_blocking.STATS.clear()
+    resource_blocking.PAGES.clear()
+    login_state.STATS.clear()  # the cached sessions themselves live on for the worker's next scripts
+    os.environ["SUITE_SCRIPT"] = script.stem
+    os.environ["DEBUG_LINGER"] = "0"  # unattended: tear the browser down right away
+    os.environ["STEP_LOG"] = str(Path(out_dir).resolve() / "steps.jsonl")
+
+    crashed = failed = False
+    cwd = os.getcwd()
+    started = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            try:
+                os.chdir(artifact_dir)
+                runpy.run_path(str(script), run_name="__main__")
+            except SystemExit as e:
+                failed = e.code == 1  # utils.run_standalone: the test raised
+                crashed = e.code not in (None, 0, 1)
+            except BaseException:
+                crashed = True
+                traceback.print_exc()
+            finally:
+                os.chdir(cwd)
+                http_archive.detach_all()
+                resource_blocking.detach_all()
+                artifacts.flush()
+                if os.getenv("DRIVER_POOL_SIZE"):
+                    from driver_pool import shared_pool
+                    shared_pool().reclaim()
+    elapsed = time.perf_counter() - started
+
+    output = log_path.read_text(encoding="utf-8", errors="replace")
+    status = verdict(output, crashed, failed)
+    if status in ("failed", "error"):
+        artifacts.dump_ring(artifact_dir)  # ring-buffer policy: keep the last steps' screenshots
+        artifacts.flush()
+    timed = [s for s in utils.STEPS if s["step"] != "launch"]  # launch: utils.launch_chrome
+    slowest = max(timed, key=lambda s: s["seconds"], default=None)
+    return {
+        "script": script.name,
+        "status": status,
+        "seconds": round(elapsed, 2),
+        "waits": utils.wait_savings(),
+        "archive": http_archive.stats(),
+        "blocking": resource_blocking.stats(),
+        "artifact_files": artifacts.stats(),
+        "logins": login_state.stats(),
+        "steps": len(timed),
+        "launch_seconds": round(sum(s["seconds"] for s in utils.STEPS if s["step"] == "launch"), 3),
+        "slowest_step": slowest and {"step": slowest["step"], "seconds": slowest["seconds"]},
+        "worker": os.getpid(),
+        "artifacts": str(artifact_dir),
+    }
+
+
+def run_suite(scripts, workers, out_dir, warm=False):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    results = []
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(str(out_dir), warm)) as pool:
+        futures = {pool.submit(run_script, str(s), str(out_dir)): s for s in scripts}
+        for fut in as_completed(futures):
+            res = fut.result()
+            results.append(res)
+            print(f"  {res['script']:<10} {res['status']:<10} {res['seconds']:>7.2f}s")
+    wall = time.perf_counter() - started
+
+    results.sort(key=lambda r: r["script"])
+    summary = {
+        "workers": workers,
+        "warm": warm,
+        "wall_seconds": round(wall, 2),
+        "script_seconds": round(sum(r["seconds"] for r in results), 2),
+        "sleep_saved_seconds": round(sum(r["waits"]["saved"] for r in results), 2),
+        "archive": {k: sum(r["archive"][k] for r in results) for k in ("hits", "misses", "recorded")},
+        "blocking": {k: round(sum(r["blocking"][k] for r in results), 1)
+                     for k in ("pages", "blocked", "bytes_saved", "ms_saved")},
+        "artifact_files": {k: sum(r["artifact_files"][k] for r in results)
+                           for k in ("written", "deduped", "dropped", "bytes_raw", "bytes_stored")},
+        "logins": {k: sum(r["logins"][k] for r in results) for k in ("restored", "fresh", "expired")},
+        "counts": {s: sum(r["status"] == s for r in results)
+                   for s in ("passed", "failed", "completed", "error")},
+        "results": results,
+    }
+    (out_dir / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return summary
+
+
+def print_summary(summary, out_dir):
+    print("\n" + "="*60)
+    print("SUITE SUMMARY")
+    print("="*60)
+    for r in summary["results"]:
+        w = r["waits"]
+        print(f"  {r['script']:<10} {r['status']:<10} {r['seconds']:>7.2f}s"
+              f"   waits: {w['waited']:.2f}s instead of {w['sleep_replaced']:.2f}s sleep"
+              f" (saved {w['saved']:.2f}s)")
+        if r["slowest_step"]:
+            print(f"  {'':<21}slowest step: {r['slowest_step']['step']!r} "
+                  f"{r['slowest_step']['seconds']:.2f}s")
+    print("-"*60)
+    counts = ", ".join(f"{k}={v}" for k, v in summary["counts"].items())
+    print(f"  {counts}")
+    print(f"  Wall time: {summary['wall_seconds']:.2f}s with {summary['workers']} worker(s) "
+          f"(sum of script times: {summary['script_seconds']:.2f}s)")
+    print(f"  Adaptive waits saved {summary['sleep_saved_seconds']:.2f}s of fixed sleeps")
+    a = summary["artifact_files"]
+    print(f"  Artifacts: {a['written']} written, {a['deduped']} deduped, {a['dropped']} over budget; "
+          f"{a['bytes_stored'] / 2**20:.1f} MiB on disk ({a['bytes_raw'] / 2**20:.1f} MiB raw)")
+    a = summary["logins"]
+    if a["fresh"] or a["restored"]:
+        print(f"  Logins: {a['fresh']} through the UI, {a['restored']} restored from cached sessions "
+              f"({a['expired']} expired)")
+    if os.getenv("RESOURCE_BLOCKING") == "on":
+        b = summary["blocking"]
+        print(f"  Resource blocking: {b['blocked']:.0f} requests blocked over {b['pages']:.0f} page loads, "
+              f"~{b['bytes_saved'] / 2**20:.1f} MiB and ~{b['ms_saved'] / 1000:.1f}s saved vs. the baseline")
+    if os.getenv("HTTP_ARCHIVE"):
+        a = summary["archive"]
+        print(f"  HTTP archive ({os.getenv('HTTP_ARCHIVE')}): {a['hits']} hits, {a['misses']} misses, "
+              f"{a['recorded']} recorded")
+    print(f"  Summary: {Path(out_dir) / 'summary.json'} (per-step timings: steps.jsonl)")
+    print("="*60)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Selenium TC/NC scripts in parallel.")
+    parser.add_argument("scripts", nargs="*", help="script stems to run, e.g. TC01 NC03 (default: all)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument("--out", default=None,
+                        help="artifact root (default: runs/<timestamp>)")
+    parser.add_argument("--warm", action="store_true",
+                        help="keep a pre-launched Chrome per worker and reuse it between scripts")
+    parser.add_argument("--standin", action="store_true",
+                        help="serve the demo sites locally (standin_server.py) and point BASE_URL at them")
+    parser.add_argument("--archive", choices=("record", "replay", "auto"),
+                        help="record/replay HTTP traffic per script (sets HTTP_ARCHIVE)")
+    parser.add_argument("--blocking", choices=("on", "baseline"),
+                        help="block third-party resources, or record the unblocked baseline (sets RESOURCE_BLOCKING)")
+    parser.add_argument("--latency-ms", type=float, default=0,
+                        help="per-request latency added by the stand-in server")
+    args = parser.parse_args(argv)
+
+    scripts = discover(args.scripts)
+    if not scripts:
+        parser.error("no matching TC/NC scripts found")
+    out_dir = Path(args.out or HERE / "runs" / datetime.now().strftime("%Y%m%d-%H%M%S")).resolve()
+    workers = max(1, min(args.workers, len(scripts)))
+
+    # Resolve chromedriver once here; workers inherit the pinned path.
+    driver_path = resolve_driver_path()
+    if driver_path:
+        os.environ["CHROMEDRIVER_PATH"] = driver_path
+
+    if args.archive:
+        os.environ["HTTP_ARCHIVE"] = args.archive
+    if args.blocking:
+        os.environ["RESOURCE_BLOCKING"] = args.blocking
+    if args.standin:
+        import standin_server
+        server = standin_server.start(latency_ms=args.latency_ms)
+        os.environ["BASE_URL"] = server.base_url
+        print(f"Stand-in sites at {server.base_url}/ (latency {args.latency_ms} ms)")
+
+    print(f"Running {len(scripts)} script(s) on {workers} worker(s) → {out_dir}")
+    summary = run_suite(scripts, workers, out_dir, warm=args.warm)
+    print_summary(summary, out_dir)
+    return 1 if summary["counts"]["failed"] or summary["counts"]["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+snapshots.py
+
+Offline checks of the scripts' locators and page assertions against saved page
+sources, parsed in-process with lxml: no browser, no network, milliseconds per
+page. A locator that stops matching a fresh snapshot is caught here before a
+full browser run times out on it.
+
+Each entry in SNAPSHOTS names an HTML file in this directory, the page it was
+taken from (site, path, and whether it needs a login) and the checks the
+scripts rely on:
+
+    {"locator": (By.NAME, "username"), "expect": "present"}        # or "absent"
+    {"locator": ..., "expect": "present", "text": "Login"}         # first match's text contains
+    {"locator": ..., "min_count": 10}                              # at least N matches
+    {"page_contains": ["404", "not found"]}                        # any of these in the page text
+
+    python snapshots.py                       # run every check
+    pytest snapshots.py -q                    # the same, one test per snapshot
+    python snapshots.py --refresh             # re-capture every snapshot with Chrome (honours BASE_URL)
+    python snapshots.py --refresh nc05_404_page_source.html
+
+The checks repeat the locators the scripts use (locator_lint.py reads them
+from the sources instead); the scripts' own helpers, such as utils.find_first,
+run JavaScript in the page and need a browser.
+Matching is presence-based: a snapshot has no layout, so "visible" is not checked.
+"""
+
+import argparse
+import functools
+import sys
+import time
+from pathlib import Path
+
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+import pytest
+from selenium.webdriver.common.by import By
+
+HERE = Path(__file__).resolve().parent
+
+_PIM_LIST = ("orangehrm", "/web/index.php/pim/viewEmployeeList")
+_PIM_CHECKS = [
+    {"locator": (By.XPATH, "//span[normalize-space()='PIM']"), "expect": "present"},
+    {"locator": (By.XPATH, "//h5[normalize-space()='Employee Information']"), "expect": "present"},
+    {"locator": (By.XPATH, "//button[normalize-space()='Reset']"), "expect": "present"},
+    {"locator": (By.XPATH, "//label[normalize-space()='Employee Id']/following::input[1]"), "expect": "present"},
+    {"locator": (By.XPATH, "//button[normalize-space()='Search']"), "expect": "present"},
+    {"locator": (By.XPATH, "//div[contains(@class,'oxd-table-body')]/div[contains(@class,'oxd-table-card')]"),
+     "min_count": 1},
+]
+
+_LOWER = "translate({},'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz')"
+
+SNAPSHOTS = {
+    # NC01: OrangeHRM login page - the wrong locator misses, the correct ones match.
+    "nc01_failure_page_source.html": {
+        "page": ("orangehrm", "/web/index.php/auth/login"),
+        "checks": [
+            {"locator": (By.ID, "wrong_username_id"), "expect": "absent"},
+            {"locator": (By.NAME, "username"), "expect": "present"},
+            {"locator": (By.NAME, "password"), "expect": "present"},
+            {"locator": (By.CSS_SELECTOR, "button[type='submit']"), "expect": "present", "text": "Login"},
+        ],
+    },
+    # NC03: PHPTravels home - the destination input and a search button exist.
+    "nc03_unexpected_page_source.html": {
+        "page": ("phptravels", "/"),
+        "checks": [
+            {"locator": (By.XPATH, f"//input[contains({_LOWER.format('@placeholder')},'dest') or "
+                                   f"contains({_LOWER.format('@placeholder')},'to') or "
+                                   f"contains({_LOWER.format('@name')},'dest') or "
+                                   f"contains({_LOWER.format('@id')},'dest')]"), "expect": "present"},
+            {"locator": (By.XPATH, f"//button[contains({_LOWER.format('.')},'search') or "
+                                   f"contains({_LOWER.format('@value')},'search') or "
+                                   f"contains({_LOWER.format('@id')},'search')]"), "expect": "present"},
+        ],
+    },
+    # NC05: Moodle 404 - none of the login-page locators, and a "not found" message.
+    "nc05_404_page_source.html": {
+        "page": ("moodle", "/abc123"),
+        "checks": [
+            {"locator": (By.ID, "username"), "expect": "absent"},
+            {"locator": (By.ID, "login"), "expect": "absent"},
+            {"locator": (By.CSS_SELECTOR, "form#login"), "expect": "absent"},
+            {"locator": (By.CSS_SELECTOR, "input[name='username']"), "expect": "absent"},
+            {"page_contains": ["404", "not found", "page not found", "error 404"]},
+        ],
+    },
+    # TC06: OrangeHRM PIM employee list (two captures of the same page).
+    "orangehrm_add_employee_source.html": {"page": _PIM_LIST, "login": True, "checks": _PIM_CHECKS},
+    "orangehrm_add_employee_validation_dom.html": {"page": _PIM_LIST, "login": True, "checks": _PIM_CHECKS},
+}
+
+MIN_SIZE = 100  # bytes; smaller files are treated as missing captures
+
+
+def _norm(text):
+    return " ".join((text or "").split())
+
+
+def _literal(value):
+    """`value` as an XPath 1.0 string literal."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+@functools.lru_cache(maxsize=None)
+def compile_locator(locator):
+    """A compiled lxml XPath for a Selenium (By, value) locator or a bare XPath string."""
+    by, value = (By.XPATH, locator) if isinstance(locator, str) else locator
+    if by == By.CSS_SELECTOR:
+        return CSSSelector(value)
+    if by == By.CLASS_NAME:
+        return CSSSelector("." + value)
+    expr = {
+        By.XPATH: lambda: value,
+        By.ID: lambda: f".//*[@id={_literal(value)}]",
+        By.NAME: lambda: f".//*[@name={_literal(value)}]",
+        By.TAG_NAME: lambda: f".//{value}",
+        By.LINK_TEXT: lambda: f".//a[normalize-space(.)={_literal(value)}]",
+        By.PARTIAL_LINK_TEXT: lambda: f".//a[contains(., {_literal(value)})]",
+    }.get(by)
+    if expr is None:
+        raise ValueError(f"unsupported locator strategy: {by}")
+    return etree.XPath(expr())
+
+
+def find_all(root, locator):
+    """lxml elements under `root` matching a Selenium (By, value) locator or a bare XPath."""
+    return [e for e in compile_locator(locator)(root) if isinstance(e, lxml.html.HtmlElement)]
+
+
+def describe(check):
+    if "page_contains" in check:
+        return f"page contains one of {check['page_contains']}"
+    by, value = check["locator"]
+    want = f">= {check['min_count']} matches" if "min_count" in check else check["expect"]
+    return f"{by}={value[:70]!r} {want}"
+
+
+def run_checks(name, spec=None):
+    """Failures (descriptions) for one snapshot; None if the file is missing or empty."""
+    spec = spec or SNAPSHOTS[name]
+    path = HERE / name
+    if not path.exists() or path.stat().st_size < MIN_SIZE:
+        return None
+    source = path.read_text(encoding="utf-8", errors="replace")
+    root = lxml.html.document_fromstring(source)
+    failures = []
+    for check in spec["checks"]:
+        if "page_contains" in check:
+            text = source.lower()
+            ok = any(s.lower() in text for s in check["page_contains"])
+        else:
+            found = find_all(root, check["locator"])
+            if "min_count" in check:
+                ok = len(found) >= check["min_count"]
+            elif check["expect"] == "absent":
+                ok = not found
+            else:
+                ok = bool(found) and check.get("text", "").lower() in _norm(found[0].text_content()).lower()
+        if not ok:
+            failures.append(describe(check))
+    return failures
+
+
+@pytest.mark.parametrize("name", sorted(SNAPSHOTS))
+def test_snapshot(name):
+    failures = run_checks(name)
+    if failures is None:
+        pytest.skip(f"{name} is missing or empty; run python snapshots.py --refresh {name}")
+    assert not failures, f"{name}: " + "; ".join(failures)
+
+
+# ---------- Refresh ----------
+
+def refresh(names):
+    """Re-capture snapshots from the live sites (or BASE_URL stand-ins) with one Chrome session."""
+    import login_state
+    from utils import new_driver, site_url, wait_settled
+
+    driver = new_driver()
+    try:
+        for name in names:
+            site, path = SNAPSHOTS[name]["page"]
+            if SNAPSHOTS[name].get("login"):
+                login_state.login(driver, site)
+            driver.get(site_url(site, path))
+            wait_settled(driver)
+            (HERE / name).write_text(driver.page_source, encoding="utf-8")
+            failures = run_checks(name)
+            status = "ok" if not failures else f"{len(failures)} check(s) now fail"
+            print(f"  {name:<45} {len(driver.page_source) / 1024:>7.1f} KiB  {status}")
+    finally:
+        driver.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check (or refresh) the saved page snapshots.")
+    parser.add_argument("names", nargs="*", help="snapshot file names (default: all)")
+    parser.add_argument("--refresh", action="store_true", help="re-capture the pages with Chrome first")
+    args = parser.parse_args(argv)
+    names = args.names or sorted(SNAPSHOTS)
+    unknown = [n for n in names if n not in SNAPSHOTS]
+    if unknown:
+        parser.error(f"unknown snapshot(s): {', '.join(unknown)}")
+
+    if args.refresh:
+        refresh(names)
+
+    failed = 0
+    for name in names:
+        started = time.perf_counter()
+        failures = run_checks(name)
+        ms = (time.perf_counter() - started) * 1000
+        if failures is None:
+            print(f"SKIP  {name} (missing or empty; --refresh it)")
+            continue
+        checks = len(SNAPSHOTS[name]["checks"])
+        print(f"{'FAIL' if failures else 'ok  '}  {name:<45} {checks} checks  {ms:6.1f} ms")
+        for failure in failures:
+            print(f"        - {failure}")
+        failed += bool(failures)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
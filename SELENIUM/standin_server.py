@@ -0,0 +1,757 @@
+"""
+standin_server.py
+
+Local stand-ins for the public demo sites the scripts use, so the suite can run
+offline and timings aren't dominated by the demos' latency and outages.
+
+Each site is a small stateful app mounted under its own prefix and serving the
+ids/classes/texts the scripts rely on:
+
+    /saucedemo/        login, inventory (sorting, cart via localStorage), cart
+    /orangehrm/        login, dashboard, PIM employee list search
+    /parabank/, /parabank-testar/
+                       login (+ error), accounts overview, transfer funds, register
+    /moodle/           home, login/logout, dashboard, course, participants, profiles, 404
+    /phptravels/       flights (airport autocomplete, results), hotels (search, details)
+
+Point the scripts at it with BASE_URL (see utils.site_url):
+
+    python standin_server.py --port 8000 --latency-ms 150 --jitter-ms 50
+    BASE_URL=http://127.0.0.1:8000 python TC05.py
+    python run_suite.py --standin --latency-ms 150
+"""
+
+import argparse
+import html
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from datetime import date
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+esc = html.escape
+
+
+def page(title, body, head=""):
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{esc(title)}</title>
+<style>body{{font-family:sans-serif;margin:0}} .hidden{{display:none}}</style>{head}</head>
+<body>{body}</body></html>"""
+
+
+class Response:
+    def __init__(self, body="", status=200, content_type="text/html; charset=utf-8", headers=None):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.status = status
+        self.headers = [("Content-Type", content_type)] + list(headers or [])
+
+    @classmethod
+    def redirect(cls, location, headers=None):
+        return cls("", 302, headers=[("Location", location)] + list(headers or []))
+
+    @classmethod
+    def json(cls, data):
+        return cls(json.dumps(data), content_type="application/json")
+
+
+class Request:
+    def __init__(self, method, path, query, form, cookies):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.form = form
+        self.cookies = cookies
+
+    def arg(self, name, default=""):
+        values = self.form.get(name) or self.query.get(name)
+        return values[0] if values else default
+
+
+class App:
+    """One stand-in site mounted at `root`, with cookie-keyed server-side sessions."""
+
+    cookie = "session"
+
+    def __init__(self, root):
+        self.root = root
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def url(self, path):
+        return self.root + path
+
+    def session(self, req):
+        sid = req.cookies.get(self.cookie)
+        with self.lock:
+            return self.sessions.get(sid, {}) if sid else {}
+
+    def start_session(self, **data):
+        sid = uuid.uuid4().hex
+        with self.lock:
+            self.sessions[sid] = data
+        return ("Set-Cookie", f"{self.cookie}={sid}; Path={self.root}; HttpOnly")
+
+    def end_session(self, req):
+        with self.lock:
+            self.sessions.pop(req.cookies.get(self.cookie), None)
+        return ("Set-Cookie", f"{self.cookie}=; Path={self.root}; Max-Age=0")
+
+    def not_found(self, req):
+        return Response(page("404 Not Found", "<h1>404 Not Found</h1><p>Page not found.</p>"), 404)
+
+    def handle(self, req):
+        raise NotImplementedError
+
+
+# ---------- SauceDemo ----------
+
+PRODUCTS = [
+    ("Sauce Labs Backpack", 29.99),
+    ("Sauce Labs Bike Light", 9.99),
+    ("Sauce Labs Bolt T-Shirt", 15.99),
+    ("Sauce Labs Fleece Jacket", 49.99),
+    ("Sauce Labs Onesie", 7.99),
+    ("Test.allTheThings() T-Shirt (Red)", 15.99),
+]
+
+SAUCE_USERS = {"standard_user", "problem_user", "performance_glitch_user", "visual_user", "error_user"}
+
+SAUCE_JS = """
+function cart() { return JSON.parse(localStorage.getItem('cart-contents') || '[]'); }
+function saveCart(items) {
+  localStorage.setItem('cart-contents', JSON.stringify(items));
+  var badge = document.querySelector('.shopping_cart_badge');
+  var link = document.querySelector('.shopping_cart_link');
+  if (items.length) {
+    if (!badge) { badge = document.createElement('span'); badge.className = 'shopping_cart_badge'; link.appendChild(badge); }
+    badge.textContent = items.length;
+  } else if (badge) { badge.remove(); }
+}
+function syncButtons() {
+  var items = cart();
+  document.querySelectorAll('.inventory_item button').forEach(function (b) {
+    var slug = b.dataset.slug, inCart = items.indexOf(slug) !== -1;
+    b.id = (inCart ? 'remove-' : 'add-to-cart-') + slug;
+    b.textContent = inCart ? 'Remove' : 'Add to cart';
+  });
+}
+function toggle(btn) {
+  var items = cart(), slug = btn.dataset.slug, i = items.indexOf(slug);
+  if (i === -1) items.push(slug); else items.splice(i, 1);
+  saveCart(items); syncButtons();
+}
+function sortItems(how) {
+  var list = document.querySelector('.inventory_list');
+  var items = Array.prototype.slice.call(list.children);
+  items.sort(function (a, b) {
+    var na = a.dataset.name, nb = b.dataset.name, pa = +a.dataset.price, pb = +b.dataset.price;
+    if (how === 'za') return nb.localeCompare(na);
+    if (how === 'lohi') return pa - pb || na.localeCompare(nb);
+    if (how === 'hilo') return pb - pa || na.localeCompare(nb);
+    return na.localeCompare(nb);
+  });
+  items.forEach(function (el) { list.appendChild(el); });
+}
+document.addEventListener('DOMContentLoaded', function () { saveCart(cart()); syncButtons(); });
+"""
+
+
+def slugify(name):
+    return "".join(c if c.isalnum() else "-" for c in name.lower()).strip("-").replace("--", "-")
+
+
+class SauceDemo(App):
+    cookie = "session-username"
+
+    def header(self):
+        return (f'<div class="primary_header"><div class="app_logo">Swag Labs</div>'
+                f'<a class="shopping_cart_link" href="{self.url("/cart.html")}"></a></div>')
+
+    def handle(self, req):
+        user = self.session(req).get("user")
+        if req.path in ("/", "/index.html"):
+            if req.method == "POST":
+                username, password = req.arg("user-name"), req.arg("password")
+                if username in SAUCE_USERS and password == "secret_sauce":
+                    return Response.redirect(self.url("/inventory.html"),
+                                             [self.start_session(user=username)])
+                error = ("Epic sadface: Username and password do not match any user in this service"
+                         if username else "Epic sadface: Username is required")
+                return self.login(error)
+            return self.login()
+        if req.path in ("/inventory.html", "/cart.html") and not user:
+            return self.login("Epic sadface: You can only access '%s' when you are logged in." % req.path)
+        if req.path == "/inventory.html":
+            return self.inventory()
+        if req.path == "/cart.html":
+            return self.cart_page()
+        return self.not_found(req)
+
+    def login(self, error=""):
+        err = f'<h3 data-test="error" class="error-message-container error">{esc(error)}</h3>' if error else ""
+        return Response(page("Swag Labs", f"""
+<div class="login_wrapper"><div class="login_logo">Swag Labs</div>
+<form method="post" action="{self.url('/')}">
+  <input class="input_error form_input" placeholder="Username" type="text" data-test="username" id="user-name" name="user-name">
+  <input class="input_error form_input" placeholder="Password" type="password" data-test="password" id="password" name="password">
+  {err}
+  <input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">
+</form></div>"""))
+
+    def inventory(self):
+        items = "".join(f"""
+<div class="inventory_item" data-name="{esc(name)}" data-price="{price}">
+  <div class="inventory_item_description">
+    <a href="#"><div class="inventory_item_name">{esc(name)}</div></a>
+    <div class="pricebar"><div class="inventory_item_price">${price:.2f}</div>
+    <button class="btn btn_inventory" data-slug="{slugify(name)}" id="add-to-cart-{slugify(name)}"
+            onclick="toggle(this)">Add to cart</button></div>
+  </div>
+</div>""" for name, price in sorted(PRODUCTS))
+        return Response(page("Swag Labs", f"""
+{self.header()}
+<div class="header_secondary_container"><span class="title">Products</span>
+<select class="product_sort_container" data-test="product-sort-container" onchange="sortItems(this.value)">
+  <option value="az">Name (A to Z)</option><option value="za">Name (Z to A)</option>
+  <option value="lohi">Price (low to high)</option><option value="hilo">Price (high to low)</option>
+</select></div>
+<div class="inventory_list">{items}</div>
+<div style="height:1200px"></div>""", head=f"<script>{SAUCE_JS}</script>"))
+
+    def cart_page(self):
+        prices = {slugify(n): (n, p) for n, p in PRODUCTS}
+        return Response(page("Swag Labs", f"""
+{self.header()}
+<span class="title">Your Cart</span>
+<div class="cart_list"></div>
+<script>
+var PRODUCTS = {json.dumps(prices)};
+cart().forEach(function (slug) {{
+  var p = PRODUCTS[slug]; if (!p) return;
+  var item = document.createElement('div');
+  item.className = 'cart_item';
+  item.innerHTML = '<div class="cart_quantity">1</div><div class="cart_item_label">' +
+    '<div class="inventory_item_name">' + p[0] + '</div>' +
+    '<div class="inventory_item_price">$' + p[1].toFixed(2) + '</div></div>';
+  document.querySelector('.cart_list').appendChild(item);
+}});
+</script>""", head=f"<script>{SAUCE_JS}</script>"))
+
+
+# ---------- OrangeHRM ----------
+
+EMPLOYEES = [
+    ("0001", "Odis", "Adalwin"),
+    ("0002", "Peter", "Anderson"),
+    ("0003", "Linda", "Jane"),
+    ("0004", "Russel", "Hamilton"),
+]
+
+
+class OrangeHRM(App):
+    cookie = "orangehrm"
+
+    def layout(self, body):
+        return page("OrangeHRM", f"""
+<aside class="oxd-sidepanel"><ul class="oxd-main-menu">
+  <li><a class="oxd-main-menu-item" href="{self.url('/web/index.php/admin/viewSystemUsers')}"><span class="oxd-main-menu-item--name">Admin</span></a></li>
+  <li><a class="oxd-main-menu-item" href="{self.url('/web/index.php/pim/viewEmployeeList')}"><span class="oxd-main-menu-item--name">PIM</span></a></li>
+  <li><a class="oxd-main-menu-item" href="{self.url('/web/index.php/dashboard/index')}"><span class="oxd-main-menu-item--name">Dashboard</span></a></li>
+</ul></aside>
+<main class="oxd-layout-context">{body}</main>""")
+
+    def handle(self, req):
+        logged_in = self.session(req).get("user")
+        if req.path in ("/", "/web/index.php", "/web/index.php/auth/login"):
+            return self.login()
+        if req.path == "/web/index.php/auth/validate" and req.method == "POST":
+            if req.arg("username") == "Admin" and req.arg("password") == "admin123":
+                return Response.redirect(self.url("/web/index.php/dashboard/index"),
+                                         [self.start_session(user="Admin")])
+            return self.login("Invalid credentials")
+        if req.path == "/web/index.php/auth/logout":
+            return Response.redirect(self.url("/web/index.php/auth/login"), [self.end_session(req)])
+        if not logged_in:
+            return Response.redirect(self.url("/web/index.php/auth/login"))
+        if req.path == "/web/index.php/dashboard/index":
+            return Response(self.layout('<h6 class="oxd-topbar-header-breadcrumb-module">Dashboard</h6>'
+                                        '<div class="orangehrm-dashboard-grid">Time at Work</div>'))
+        if req.path == "/web/index.php/pim/viewEmployeeList":
+            return self.employee_list(req.arg("empId").strip())
+        return self.not_found(req)
+
+    def login(self, error=""):
+        err = f'<div class="oxd-alert oxd-alert--error" role="alert"><p class="oxd-alert-content-text">{error}</p></div>' if error else ""
+        return Response(page("OrangeHRM", f"""
+<div class="orangehrm-login-container"><h5 class="orangehrm-login-title">Login</h5>{err}
+<form class="oxd-form" method="post" action="{self.url('/web/index.php/auth/validate')}">
+  <label class="oxd-label">Username</label><input class="oxd-input" name="username" placeholder="Username">
+  <label class="oxd-label">Password</label><input class="oxd-input" type="password" name="password" placeholder="Password">
+  <button type="submit" class="oxd-button oxd-button--main orangehrm-login-button">Login</button>
+</form></div>"""))
+
+    def employee_list(self, emp_id):
+        rows = [e for e in EMPLOYEES if not emp_id or e[0] == emp_id]
+        if rows:
+            body = "".join(
+                f'<div class="oxd-table-card"><div class="oxd-table-row"><div class="oxd-table-cell"><span>{i}</span></div>'
+                f'<div class="oxd-table-cell"><span>{first}</span></div><div class="oxd-table-cell"><span>{last}</span></div></div></div>'
+                for i, first, last in rows)
+            found = f'<span class="oxd-text">({len(rows)}) Records Found</span>'
+        else:
+            body = ""
+            found = '<span class="oxd-text">No Records Found</span>'
+        return Response(self.layout(f"""
+<div class="oxd-table-filter"><h5 class="oxd-table-filter-title">Employee Information</h5>
+<form class="oxd-form" method="get" action="{self.url('/web/index.php/pim/viewEmployeeList')}">
+  <div class="oxd-input-group"><label class="oxd-label">Employee Name</label><input class="oxd-input" name="empName"></div>
+  <div class="oxd-input-group"><label class="oxd-label">Employee Id</label><input class="oxd-input" name="empId" value="{esc(emp_id)}"></div>
+  <a href="{self.url('/web/index.php/pim/viewEmployeeList')}"><button type="button" class="oxd-button oxd-button--ghost">Reset</button></a>
+  <button type="submit" class="oxd-button oxd-button--secondary">Search</button>
+</form></div>
+<div class="orangehrm-horizontal-padding">{found}</div>
+<div class="oxd-table orangehrm-employee-list"><div class="oxd-table-body">{body}</div></div>"""))
+
+
+# ---------- ParaBank ----------
+
+class ParaBank(App):
+    cookie = "JSESSIONID"
+    USERS = {"john": "demo"}
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.accounts = {}  # username -> {account id: balance}
+
+    def accounts_for(self, user):
+        with self.lock:
+            return self.accounts.setdefault(user, {"13344": 515.50, "13455": 1000.00, "13566": 100.00})
+
+    def layout(self, right, user=None):
+        if user:
+            left = f"""<div id="leftPanel"><p class="smallText">Welcome {esc(user)}</p><ul>
+  <li><a href="{self.url('/parabank/openaccount.htm')}">Open New Account</a></li>
+  <li><a href="{self.url('/parabank/overview.htm')}">Accounts Overview</a></li>
+  <li><a href="{self.url('/parabank/transfer.htm')}">Transfer Funds</a></li>
+  <li><a href="{self.url('/parabank/logout.htm')}">Log Out</a></li></ul></div>"""
+        else:
+            left = f"""<div id="leftPanel"><h2>Customer Login</h2>
+<form name="login" method="post" action="{self.url('/parabank/login.htm')}">
+  <div class="login"><input type="text" class="input" name="username"></div>
+  <div class="login"><input type="password" class="input" name="password"></div>
+  <div class="login"><input type="submit" class="button" value="Log In"></div>
+</form><p><a href="{self.url('/parabank/register.htm')}">Register</a></p></div>"""
+        return page("ParaBank | Welcome | Online Banking",
+                    f'<div id="mainPanel"><div id="bodyPanel">{left}<div id="rightPanel">{right}</div></div></div>')
+
+    def handle(self, req):
+        user = self.session(req).get("user")
+        path = req.path.removeprefix("/parabank")
+        if path in ("", "/", "/index.htm"):
+            return Response(self.layout("<h2>ATM Services</h2><p>Withdraw Funds</p>", user))
+        if path == "/login.htm" and req.method == "POST":
+            username = req.arg("username")
+            if self.USERS.get(username) == req.arg("password") and username:
+                return Response.redirect(self.url("/parabank/overview.htm"), [self.start_session(user=username)])
+            return Response(self.layout('<h1 class="title">Error!</h1>'
+                                        '<p class="error">The username and password could not be verified.</p>'))
+        if path == "/logout.htm":
+            return Response.redirect(self.url("/parabank/index.htm"), [self.end_session(req)])
+        if path == "/register.htm":
+            return self.register()
+        if not user:
+            return Response(self.layout('<p class="error">An internal error has occurred and has been logged.</p>'))
+        if path == "/overview.htm":
+            rows = "".join(f'<tr><td><a href="#">{acct}</a></td><td>${bal:,.2f}</td></tr>'
+                           for acct, bal in self.accounts_for(user).items())
+            return Response(self.layout(f'<h1 class="title">Accounts Overview</h1>'
+                                        f'<table id="accountTable">{rows}</table>', user))
+        if path == "/services/accounts":
+            return Response.json(list(self.accounts_for(user)))
+        if path == "/transfer.htm":
+            return self.transfer(req, user)
+        return self.not_found(req)
+
+    def transfer(self, req, user):
+        if req.method == "POST":
+            accounts = self.accounts_for(user)
+            src, dst = req.arg("fromAccountId"), req.arg("toAccountId")
+            try:
+                amount = float(req.arg("amount"))
+            except ValueError:
+                amount = None
+            if amount is None or src not in accounts or dst not in accounts:
+                return Response(self.layout('<h1 class="title">Error!</h1><p class="error">'
+                                            'The amount cannot be empty.</p>', user))
+            with self.lock:
+                accounts[src] -= amount
+                accounts[dst] += amount
+            return Response(self.layout(f"""<div id="showResult"><h1 class="title">Transfer Complete!</h1>
+<p><span id="amountResult">${amount:,.2f}</span> has been transferred from account
+<span id="fromAccountIdResult">#{src}</span> to account <span id="toAccountIdResult">#{dst}</span>.</p>
+<p>See Account Activity for more details.</p></div>""", user))
+        # Like the real page, the account dropdowns are filled in by an XHR after load.
+        return Response(self.layout(f"""<div id="showForm"><h1 class="title">Transfer Funds</h1>
+<form method="post" action="{self.url('/parabank/transfer.htm')}">
+  <p><b>Amount:</b> $<input id="amount" name="amount" type="text" class="input"></p>
+  <div>From account #<select id="fromAccountId" name="fromAccountId" class="input"></select>
+  to account #<select id="toAccountId" name="toAccountId" class="input"></select></div>
+  <div><input type="submit" class="button" value="Transfer"></div>
+</form></div>
+<script>
+fetch('{self.url('/parabank/services/accounts')}').then(function (r) {{ return r.json(); }}).then(function (ids) {{
+  ['fromAccountId', 'toAccountId'].forEach(function (id) {{
+    var sel = document.getElementById(id);
+    ids.forEach(function (acct) {{ var o = document.createElement('option'); o.value = o.textContent = acct; sel.appendChild(o); }});
+  }});
+}});
+</script>""", user))
+
+    def register(self):
+        fields = ["customer.firstName", "customer.lastName", "customer.address.street", "customer.address.city",
+                  "customer.address.state", "customer.address.zipCode", "customer.phoneNumber", "customer.ssn",
+                  "customer.username", "customer.password", "repeatedPassword"]
+        rows = "".join(f'<tr><td>{f.split(".")[-1]}:</td><td><input id="{f}" name="{f}" class="input"></td></tr>'
+                       for f in fields)
+        return Response(self.layout(f"""<h1 class="title">Signing up is easy!</h1>
+<form id="customerForm" method="post" action="{self.url('/parabank/register.htm')}">
+<table class="form2">{rows}
+<tr><td></td><td><input type="submit" class="button" value="Register"></td></tr></table></form>"""))
+
+
+# ---------- Moodle ----------
+
+MOODLE_USERS = {"admin": "Admin User", "manager": "Max Manager", "teacher": "Terri Teacher", "student": "Sam Student"}
+MOODLE_COURSES = {2: "Moodle and Mountaineering", 3: "Celebrating Cultures", 4: "History: Russia in Revolution"}
+
+
+class Moodle(App):
+    cookie = "MoodleSession"
+
+    def layout(self, title, body, user=None):
+        if user:
+            nav = f"""<div class="usermenu">
+<button id="user-menu-toggle" class="btn dropdown-toggle" onclick="document.getElementById('user-action-menu').classList.toggle('hidden')">{esc(MOODLE_USERS[user])}</button>
+<div id="user-action-menu" class="dropdown-menu hidden">
+  <a class="dropdown-item" href="{self.url('/user/profile.php')}">Profile</a>
+  <a class="dropdown-item" href="{self.url('/login/logout.php?sesskey=' + user)}">Log out</a>
+</div></div>"""
+        else:
+            nav = (f'<div class="usermenu"><span class="login">You are not logged in. '
+                   f'<a href="{self.url("/login/index.php")}">Log in</a></span></div>')
+        return page(title, f"""<nav class="navbar"><a class="navbar-brand" href="{self.url('/')}">Mount Orange School</a>
+<a href="{self.url('/')}">Home</a> <a href="{self.url('/my/')}">Dashboard</a>{nav}</nav>
+<div id="page" class="container">{body}</div>""")
+
+    def handle(self, req):
+        user = self.session(req).get("user")
+        if req.path == "/":
+            return Response(self.layout("Mount Orange School", "<h2>Available courses</h2>" + self.course_links(), user))
+        if req.path == "/login/index.php":
+            if req.method == "POST":
+                username = req.arg("username")
+                if username in MOODLE_USERS and req.arg("password") == "sandbox24":
+                    return Response.redirect(self.url("/my/"), [self.start_session(user=username)])
+                return self.login('<div class="alert alert-danger" role="alert">Invalid login, please try again</div>')
+            return self.login()
+        if req.path == "/login/logout.php":
+            return Response.redirect(self.url("/"), [self.end_session(req)])
+        if not user:
+            if req.path in ("/my/", "/course/view.php", "/user/index.php", "/user/view.php", "/user/profile.php"):
+                return Response.redirect(self.url("/login/index.php"))
+            return self.not_found(req)
+        if req.path == "/my/":
+            return Response(self.layout("Dashboard", "<h2>Course overview</h2>" + self.course_links(), user))
+        course_id = int(req.arg("id", "0") or 0) if req.arg("id", "").isdigit() else 0
+        if req.path == "/course/view.php" and course_id in MOODLE_COURSES:
+            return Response(self.layout(MOODLE_COURSES[course_id], f"""
+<nav class="secondary-navigation"><ul class="nav">
+  <li><a href="{self.url(f'/course/view.php?id={course_id}')}">Course</a></li>
+  <li><a href="{self.url(f'/user/index.php?id={course_id}')}">Participants</a></li>
+  <li><a href="{self.url(f'/grade/report/index.php?id={course_id}')}">Grades</a></li>
+</ul></nav><h1>{esc(MOODLE_COURSES[course_id])}</h1>""", user))
+        if req.path == "/user/index.php" and course_id in MOODLE_COURSES:
+            rows = "".join(
+                f'<tr><td><a href="{self.url(f"/user/view.php?id={i}&course={course_id}")}">{esc(name)}</a></td>'
+                f'<td>{login}@example.com</td></tr>'
+                for i, (login, name) in enumerate(MOODLE_USERS.items(), start=2))
+            return Response(self.layout("Participants", f"""<h2>Participants</h2>
+<div class="userlist"><p data-region="participant-count">{len(MOODLE_USERS)} participants found</p>
+<table class="generaltable table-sm" id="participants"><tbody>{rows}</tbody></table></div>""", user))
+        if req.path in ("/user/view.php", "/user/profile.php"):
+            logins = list(MOODLE_USERS)
+            idx = course_id - 2 if req.path == "/user/view.php" else logins.index(user)
+            if not 0 <= idx < len(logins):
+                return self.not_found(req)
+            return Response(self.layout(MOODLE_USERS[logins[idx]], f"""<h1>{esc(MOODLE_USERS[logins[idx]])}</h1>
+<section class="userprofile"><h3>User details</h3><dl><dt>Email address</dt><dd>{logins[idx]}@example.com</dd></dl></section>""", user))
+        return self.not_found(req)
+
+    def course_links(self):
+        return "".join(f'<div class="coursebox course-info-container"><h3 class="coursename">'
+                       f'<a href="{self.url(f"/course/view.php?id={cid}")}">{esc(name)}</a></h3></div>'
+                       for cid, name in MOODLE_COURSES.items())
+
+    def login(self, error=""):
+        return Response(self.layout("Log in to the site", f"""<div class="login-container"><h2>Log in</h2>{error}
+<form method="post" action="{self.url('/login/index.php')}" id="login">
+  <input type="text" name="username" id="username" class="form-control" placeholder="Username">
+  <input type="password" name="password" id="password" class="form-control" placeholder="Password">
+  <button type="submit" class="btn btn-primary" id="loginbtn">Log in</button>
+</form><p>Username: admin / manager / teacher / student, password: sandbox24</p></div>"""))
+
+    def not_found(self, req):
+        return Response(self.layout("Error", '<div class="errorbox alert alert-danger">'
+                                             '<p class="errormessage">404 - Page not found</p></div>'), 404)
+
+
+# ---------- PHPTravels ----------
+
+AIRPORTS = [
+    ("LHR", "London Heathrow Airport", "London"), ("LGW", "London Gatwick Airport", "London"),
+    ("DXB", "Dubai International Airport", "Dubai"), ("DWC", "Al Maktoum International", "Dubai"),
+    ("JFK", "John F Kennedy Intl", "New York"), ("CDG", "Charles de Gaulle Airport", "Paris"),
+]
+CITIES = ["Dubai, United Arab Emirates", "London, United Kingdom", "Paris, France", "Istanbul, Turkey"]
+HOTELS = ["Jumeirah Beach Hotel", "Rose Rayhaan Rotana", "Hyatt Regency Perth", "Grand Plaza Hotel"]
+
+PHP_AUTOCOMPLETE_JS = """
+function autocomplete(input, url) {
+  var list = document.createElement('ul');
+  list.setAttribute('role', 'listbox');
+  list.className = 'autocomplete-results hidden';
+  input.parentNode.appendChild(list);
+  var timer = null;
+  input.addEventListener('input', function () {
+    clearTimeout(timer);
+    timer = setTimeout(function () {
+      if (!input.value) { list.classList.add('hidden'); return; }
+      fetch(url + encodeURIComponent(input.value)).then(function (r) { return r.json(); }).then(function (items) {
+        list.innerHTML = '';
+        items.forEach(function (text) {
+          var li = document.createElement('li');
+          li.setAttribute('role', 'option');
+          li.textContent = text;
+          li.addEventListener('click', function () {
+            input.value = text.split(' ')[0]; list.classList.add('hidden');
+          });
+          list.appendChild(li);
+        });
+        list.classList.toggle('hidden', !items.length);
+      });
+    }, 150);
+  });
+  input.addEventListener('keydown', function (e) {
+    var first = list.querySelector('li');
+    if (e.key === 'Enter' && first && !list.classList.contains('hidden')) { e.preventDefault(); first.click(); }
+  });
+}
+"""
+
+
+class PHPTravels(App):
+    def layout(self, title, body, head=""):
+        return page(title, f"""<header class="header-area"><a href="{self.url('/')}">PHPTRAVELS</a>
+<a href="{self.url('/flights')}">Flights</a> <a href="{self.url('/hotels')}">Hotels</a></header>
+{body}
+<div id="cookie_disclaimer" class="cookie-bar"><span>We use cookies.</span>
+<button type="button" class="cookie-close close" aria-label="Close"
+        onclick="document.getElementById('cookie_disclaimer').remove()">Accept</button></div>""", head)
+
+    def handle(self, req):
+        if req.path == "/":
+            return Response(self.layout("PHPTRAVELS", """<h1>Let's book your next trip!</h1>
+<form class="main_search"><input type="text" name="destination" placeholder="Destination" class="form-control">
+<button type="submit" class="btn btn-primary">Search</button></form>"""))
+        if req.path == "/api/airports":
+            q = req.arg("q").strip().upper()
+            return Response.json([f"{code} - {name}, {city}" for code, name, city in AIRPORTS
+                                  if q and (code.startswith(q) or city.upper().startswith(q))])
+        if req.path == "/flights":
+            return self.flights_form()
+        if req.path.startswith("/flights/"):
+            return self.flight_results(req.path.split("/")[2:])
+        if req.path == "/hotels":
+            return self.hotels_form()
+        if req.path.startswith("/hotels/search"):
+            return self.hotel_results(req.arg("city") or "Dubai")
+        if req.path.startswith("/hotels/detail/"):
+            return self.hotel_detail(req.path.rsplit("/", 1)[-1])
+        return self.not_found(req)
+
+    def flights_form(self):
+        default_date = date.today().strftime("%d-%m-%Y")
+        return Response(self.layout("Search Flights", f"""<h1>Search for best Flights</h1>
+<form id="flights-search" class="content" onsubmit="return searchFlights(this)">
+  <div class="form-group"><input type="text" name="from" class="form-control" placeholder="Flying From" autocomplete="off"></div>
+  <div class="form-group"><input type="text" name="to" class="form-control" placeholder="Destination To" autocomplete="off"></div>
+  <div class="form-group date"><span class="label">Depart Date</span>
+    <input type="text" name="depart" class="form-control depart" value="{default_date}"></div>
+  <button type="submit" class="btn btn-primary btn-block">Search</button>
+</form>
+<script>
+autocomplete(document.querySelector('[name=from]'), '{self.url('/api/airports?q=')}');
+autocomplete(document.querySelector('[name=to]'), '{self.url('/api/airports?q=')}');
+function searchFlights(form) {{
+  var from = form.from.value.trim().toLowerCase(), to = form.to.value.trim().toLowerCase();
+  if (!from || !to) {{
+    var msg = document.getElementById('validation') || document.createElement('div');
+    msg.id = 'validation'; msg.className = 'alert alert-danger error'; msg.setAttribute('role', 'alert');
+    msg.textContent = 'Please fill out the required fields';
+    form.appendChild(msg); return false;
+  }}
+  location.href = '{self.url('/flights/')}' + from + '/' + to + '/oneway/economy/' + form.depart.value + '/1/0/0';
+  return false;
+}}
+</script>""", head=f"<script>{PHP_AUTOCOMPLETE_JS}</script>"))
+
+    def flight_results(self, parts):
+        origin, dest = (parts + ["", ""])[:2]
+        flights = [(f"{origin.upper()} → {dest.upper()}", airline, price)
+                   for airline, price in (("Emirates", 420), ("British Airways", 455), ("Qatar Airways", 398))]
+        cards = "".join(f'<div class="flight-card card"><h4>{esc(route)}</h4><p>{airline}</p>'
+                        f'<strong>USD {price}</strong><button class="btn btn-primary">Select</button></div>'
+                        for route, airline, price in flights)
+        return Response(self.layout("Flights", f'<h2 class="sec__title">{len(flights)} Flights Found</h2>{cards}'))
+
+    def hotels_form(self):
+        options = "".join(f'<div class="dropdown-item" onclick="pickCity(this)">{c}</div>' for c in CITIES)
+        return Response(self.layout("Search Hotels", f"""<h1>Search for best Hotels</h1>
+<form id="hotels-search" method="get" action="{self.url('/hotels/search')}">
+  <div class="form-group"><input type="text" name="city" class="form-control" placeholder="Search by City or Destination"
+       autocomplete="off" onclick="setTimeout(function () {{ document.getElementById('cities').classList.remove('hidden'); }}, 200)">
+  <div id="cities" class="dropdown-menu hidden">{options}</div></div>
+  <button type="submit" class="btn btn-primary search_button">Search</button>
+</form>
+<script>function pickCity(el) {{
+  document.querySelector('[name=city]').value = el.textContent.split(',')[0];
+  document.getElementById('cities').classList.add('hidden');
+}}</script>"""))
+
+    def hotel_results(self, city):
+        cards = "".join(f"""<div class="card hotel-card"><h3 class="card-title">{esc(name)}</h3>
+<p>{esc(city)}</p><a class="btn btn-primary" href="{self.url(f'/hotels/detail/{i}')}">View More</a></div>"""
+                        for i, name in enumerate(HOTELS, start=1))
+        return Response(self.layout("Hotels", f"<h2>Hotels in {esc(city)}</h2>{cards}"))
+
+    def hotel_detail(self, hotel_id):
+        try:
+            name = HOTELS[int(hotel_id) - 1]
+        except (ValueError, IndexError):
+            return self.not_found(None)
+        rooms = "".join(f'<div class="room"><h4>{kind} Room</h4><span class="price">USD {price}</span>'
+                        f'<button class="btn btn-primary">Book Now</button></div>'
+                        for kind, price in (("Deluxe", 180), ("Executive", 260)))
+        return Response(self.layout(name, f"<h2>{esc(name)}</h2><h3>Available Rooms</h3>{rooms}"))
+
+
+# ---------- Server ----------
+
+APPS = {
+    "saucedemo": SauceDemo,
+    "orangehrm": OrangeHRM,
+    "parabank": ParaBank,
+    "parabank-testar": ParaBank,
+    "moodle": Moodle,
+    "phptravels": PHPTravels,
+}
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms=0, jitter_ms=0):
+        super().__init__(address, StandinHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.apps = {name: cls("/" + name) for name, cls in APPS.items()}
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def delay(self):
+        ms = self.latency_ms + (random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0)
+        if ms > 0:
+            time.sleep(ms / 1000)
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        if os.getenv("STANDIN_LOG") == "1":
+            super().log_message(fmt, *args)
+
+    def do_GET(self):
+        self.dispatch()
+
+    def do_POST(self):
+        self.dispatch()
+
+    def dispatch(self):
+        parts = urlsplit(self.path)
+        site, _, rest = parts.path.lstrip("/").partition("/")
+        app = self.server.apps.get(site)
+
+        form = {}
+        if self.command == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+        cookies = {k: m.value for k, m in SimpleCookie(self.headers.get("Cookie", "")).items()}
+
+        self.server.delay()
+        if app is None:
+            links = "".join(f'<li><a href="/{quote(name)}/">{name}</a></li>' for name in self.server.apps)
+            resp = Response(page("Stand-in sites", f"<h1>Stand-in sites</h1><ul>{links}</ul>"),
+                            200 if parts.path == "/" else 404)
+        else:
+            req = Request(self.command, "/" + rest, parse_qs(parts.query, keep_blank_values=True), form, cookies)
+            try:
+                resp = app.handle(req)
+            except Exception as e:
+                resp = Response(page("500", f"<h1>500 Internal Server Error</h1><pre>{esc(repr(e))}</pre>"), 500)
+
+        self.send_response(resp.status)
+        for name, value in resp.headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(resp.body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(resp.body)
+
+
+def start(port=0, latency_ms=0, jitter_ms=0, host="127.0.0.1"):
+    """Start the stand-in server on a background thread; returns the server (see .base_url)."""
+    server = StandinServer((host, port), latency_ms=latency_ms, jitter_ms=jitter_ms)
+    threading.Thread(target=server.serve_forever, name="standin-server", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve local stand-ins for the demo sites.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=float(os.getenv("STANDIN_LATENCY_MS", "0")),
+                        help="added delay per request")
+    parser.add_argument("--jitter-ms", type=float, default=float(os.getenv("STANDIN_JITTER_MS", "0")),
+                        help="uniform +/- jitter on top of --latency-ms")
+    args = parser.parse_args()
+
+    server = StandinServer((args.host, args.port), latency_ms=args.latency_ms, jitter_ms=args.jitter_ms)
+    print(f"Stand-in sites at {server.base_url}/ (latency {args.latency_ms} ms ± {args.jitter_ms} ms)")
+    print(f"Use: BASE_URL={server.base_url} python TC05.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,174 @@
+import contextlib
+import inspect
+import json
+import os
+import sys
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
 
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    SessionNotCreatedException,
+    TimeoutException,
+    WebDriverException,
+)
+
+import artifacts
+import http_archive
+import launch_profiles
+import locator_stats
+import resource_blocking
+from driver_lock import record_browser_version, resolve_driver_path
 
 DEFAULT_TIMEOUT = 15
 
+# Live demo sites. With BASE_URL set (e.g. http://127.0.0.1:8000 from
+# standin_server.py) each site is served from {BASE_URL}/{name} instead.
+SITES = {
+    "saucedemo": "https://www.saucedemo.com",
+    "orangehrm": "https://opensource-demo.orangehrmlive.com",
+    "parabank": "https://parabank.parasoft.com",
+    "parabank-testar": "https://para.testar.org",
+    "moodle": "https://sandbox.moodledemo.net",
+    "phptravels": "https://phptravels.net",
+}
+
+def site_url(site, path=""):
+    """URL of `path` on a demo site, honouring the BASE_URL stand-in override."""
+    base = os.getenv("BASE_URL")
+    root = f"{base.rstrip('/')}/{site}" if base else SITES[site]
+    return root + path
+
+# Public demo logins; <SITE>_USERNAME / <SITE>_PASSWORD (e.g. MOODLE_PASSWORD) override them.
+CREDENTIALS = {
+    "saucedemo": ("standard_user", "secret_sauce"),
+    "orangehrm": ("Admin", "admin123"),
+    "parabank": ("john", "demo"),
+    "moodle": ("admin", "sandbox24"),  # every sandbox role shares the password
+}
+
+def credentials(site, username=None):
+    """(username, password) for a demo site; `username` picks another role (e.g. moodle "teacher")."""
+    default_user, default_password = CREDENTIALS[site]
+    prefix = site.upper().replace("-", "_")
+    return (username or os.getenv(f"{prefix}_USERNAME", default_user),
+            os.getenv(f"{prefix}_PASSWORD", default_password))
+
+def launch_chrome(options=None, profile_dir=None):
+    """Start a fresh Chrome session with the LAUNCH_PROFILE flags (launch_profiles.py),
+    optionally on a dedicated --user-data-dir. The launch time goes to STEP_LOG."""
+    options = launch_profiles.apply(options or Options())
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    started = time.perf_counter()
+    try:
+        driver = webdriver.Chrome(service=Service(resolve_driver_path()), options=options)
+    except SessionNotCreatedException:
+        # Usually Chrome updated under a locked driver: resolve once more and retry.
+        driver = webdriver.Chrome(service=Service(resolve_driver_path(refresh=True)), options=options)
+    record_browser_version(driver.capabilities.get("browserVersion"))
+    _write_step({"script": script_name(), "step": "launch", "profile": launch_profiles.name(),
+                 "seconds": round(time.perf_counter() - started, 3)})
+    return driver
+
+def script_options(test):
+    """Chrome options a test asks for with @pytest.mark.chrome_options(opts), or None."""
+    for mark in getattr(test, "pytestmark", []):
+        if mark.name == "chrome_options":
+            return mark.args[0]
+    return None
+
+def new_driver(options=None, pool=None):
+    """Driver for a script or test: a warm session leased from `pool` (or from the
+    process-wide pool when DRIVER_POOL_SIZE is set), otherwise a new Chrome on the
+    per-worker profile dir set by run_suite.py. A caller with its own `options`
+    always gets a new Chrome, since pooled sessions were launched without them.
+    With HTTP_ARCHIVE set, its traffic is recorded/replayed (http_archive.py); with
+    RESOURCE_BLOCKING set, third-party resources are blocked (resource_blocking.py)."""
+    if options is None and (pool is not None or os.getenv("DRIVER_POOL_SIZE")):
+        if pool is None:
+            from driver_pool import shared_pool
+            pool = shared_pool()
+        driver = pool.acquire()
+    else:
+        driver = launch_chrome(options, profile_dir=os.getenv("CHROME_USER_DATA_DIR"))
+    if http_archive.mode():
+        http_archive.attach(driver, script_name())
+    if resource_blocking.mode():
+        resource_blocking.attach(driver)
+    return driver
+
+LINGER_SECONDS = 10
+
+def linger(failed=False, headed=True):
+    """Hold the browser open before teardown, only when someone is there to look.
+
+    DEBUG_LINGER (or `python TC04.py --linger[=SECONDS|pause]`):
+        auto (default)  after a failure, with a visible browser, on an interactive terminal
+        0 / off         never - batch runs (run_suite.py, benchmark.py) set this
+        SECONDS         always, for that long
+        pause           always, until Enter is pressed
+    """
+    value = os.getenv("DEBUG_LINGER", "auto").strip().lower()
+    if value in ("", "0", "off", "no", "false"):
+        return
+    if value == "auto":
+        if not (failed and headed and sys.stdin.isatty() and sys.stdout.isatty()):
+            return
+        value = str(LINGER_SECONDS)
+    if value == "pause":
+        try:
+            input("\nBrowser left open - press Enter to close it...")
+        except (EOFError, OSError):  # no stdin (e.g. pytest capturing output)
+            pass
+        return
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = LINGER_SECONDS
+    print(f"\nKeeping browser open for {seconds:g} seconds...")
+    time.sleep(seconds)
+
+def _linger_flag(argv):
+    """DEBUG_LINGER value from a --linger / --linger=VALUE argument, or None."""
+    for arg in argv:
+        if arg == "--linger":
+            return str(LINGER_SECONDS)
+        if arg.startswith("--linger="):
+            return arg.split("=", 1)[1]
+    return None
+
+def run_standalone(test, options=None):
+    """Run a test function as a plain script (python TC04.py, run_suite.py): launches
+    its own driver (with the test's chrome_options marker unless `options` is given)
+    and passes the same arguments as the conftest fixtures. Exits 1 if the test fails."""
+    flag = _linger_flag(sys.argv[1:])
+    if flag is not None:
+        os.environ["DEBUG_LINGER"] = flag
+    headed = not launch_profiles.headless()
+    driver = new_driver(options if options is not None else script_options(test))
+    fixtures = {"driver": driver, "site_url": site_url, "credentials": credentials}
+    failed = False
+    try:
+        test(**{name: fixtures[name] for name in inspect.signature(test).parameters})
+    except Exception:
+        failed = True
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        linger(failed, headed)
+        driver.quit()
+
 def wait_visible(driver, by, locator, timeout=DEFAULT_TIMEOUT):
     return WebDriverWait(driver, timeout).until(EC.visibility_of_element_located((by, locator)))
 
@@ -12,6 +176,450 @@ def wait_clickable(driver, by, locator, timeout=DEFAULT_TIMEOUT):
     return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((by, locator)))
 
 def type_text(el, txt, clear=True):
+    """Set a field's text; with clear=True that is one JS call (see fill_form)."""
     if clear:
-        el.clear()
-    el.send_keys(txt)
+        el.parent.execute_script(_FILL_JS, [[None, el, txt]])
+    else:
+        el.send_keys(txt)
+
+# ---------- Adaptive waits ----------
+# Each wait polls one injected JS probe instead of sleeping a fixed time. The
+# probe installs itself once per document (fetch/XHR counters, a MutationObserver)
+# and reports the page state in a single round trip.
+_PROBE_JS = """
+var itemsXPath = arguments[0];
+var p = window.__waitProbe;
+if (!p) {
+  p = window.__waitProbe = {inflight: 0, lastNet: Date.now(), lastMutation: Date.now()};
+  var done = function () { p.inflight--; p.lastNet = Date.now(); };
+  if (window.fetch) {
+    var origFetch = window.fetch;
+    window.fetch = function () {
+      p.inflight++; p.lastNet = Date.now();
+      return origFetch.apply(this, arguments).finally(done);
+    };
+  }
+  var origSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    p.inflight++; p.lastNet = Date.now();
+    this.addEventListener('loadend', done);
+    return origSend.apply(this, arguments);
+  };
+  new MutationObserver(function () { p.lastMutation = Date.now(); })
+    .observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+var now = Date.now();
+var lastResource = 0;
+performance.getEntriesByType('resource').forEach(function (r) {
+  lastResource = Math.max(lastResource, performance.timeOrigin + r.responseEnd);
+});
+var animations = (document.getAnimations ? document.getAnimations() : []).filter(function (a) {
+  return a.playState === 'running' && a.effect && a.effect.getComputedTiming().iterations !== Infinity;
+});
+var items = null;
+if (itemsXPath) {
+  var snap = document.evaluate(itemsXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  items = 0;
+  for (var i = 0; i < snap.snapshotLength; i++) {
+    var el = snap.snapshotItem(i);
+    if (el.getClientRects().length && el.textContent.trim()) items++;
+  }
+}
+return {
+  readyState: document.readyState,
+  inflight: p.inflight,
+  netIdleMs: now - Math.max(p.lastNet, lastResource),
+  domQuietMs: now - p.lastMutation,
+  animations: animations.length,
+  items: items
+};
+"""
+
+# Every adaptive wait is logged so a run can report the sleep time it saved.
+WAIT_LOG = []
+
+def probe(driver, items_xpath=None):
+    """One round trip: install the probe if needed and return the page state."""
+    return driver.execute_script(_PROBE_JS, items_xpath)
+
+def _adaptive_wait(driver, name, ready, timeout, replaces, items_xpath=None):
+    # Never wait longer than the fixed sleep being replaced, unless told to.
+    if timeout is None:
+        timeout = replaces or DEFAULT_TIMEOUT
+    started = time.perf_counter()
+    ok = True
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1,
+                      ignored_exceptions=(WebDriverException,)).until(
+            lambda d: ready(probe(d, items_xpath)))
+    except TimeoutException:
+        ok = False
+    waited = time.perf_counter() - started
+    WAIT_LOG.append({"wait": name, "waited": waited, "replaces": replaces, "ok": ok})
+    return ok
+
+def wait_network_idle(driver, idle_ms=500, timeout=None, replaces=0):
+    """No fetch/XHR in flight and no resource finished for `idle_ms`."""
+    return _adaptive_wait(driver, "network_idle",
+                          lambda s: s["inflight"] == 0 and s["netIdleMs"] >= idle_ms,
+                          timeout, replaces)
+
+def wait_dom_quiet(driver, quiet_ms=300, timeout=None, replaces=0):
+    """No DOM mutation for `quiet_ms`."""
+    return _adaptive_wait(driver, "dom_quiet", lambda s: s["domQuietMs"] >= quiet_ms,
+                          timeout, replaces)
+
+def wait_animations_done(driver, timeout=None, replaces=0):
+    """No finite CSS/Web animation or transition still running."""
+    return _adaptive_wait(driver, "animations_done", lambda s: s["animations"] == 0,
+                          timeout, replaces)
+
+def wait_autocomplete(driver, items_xpath, quiet_ms=200, timeout=None, replaces=0):
+    """At least one visible, non-empty item matches `items_xpath` and the list stopped changing."""
+    return _adaptive_wait(driver, "autocomplete",
+                          lambda s: bool(s["items"]) and s["domQuietMs"] >= quiet_ms,
+                          timeout, replaces, items_xpath)
+
+def wait_settled(driver, quiet_ms=300, timeout=None, replaces=0):
+    """Page loaded, network idle, DOM quiet and animations finished."""
+    return _adaptive_wait(driver, "settled",
+                          lambda s: (s["readyState"] == "complete" and s["inflight"] == 0
+                                     and s["netIdleMs"] >= quiet_ms and s["domQuietMs"] >= quiet_ms
+                                     and s["animations"] == 0),
+                          timeout, replaces)
+
+def wait_savings(log=None):
+    """Totals for the logged waits: fixed sleep replaced vs. time actually waited."""
+    log = WAIT_LOG if log is None else log
+    replaced = sum(w["replaces"] for w in log)
+    waited = sum(w["waited"] for w in log)
+    return {"waits": len(log), "sleep_replaced": round(replaced, 2),
+            "waited": round(waited, 2), "saved": round(replaced - waited, 2)}
+
+# ---------- Locator race ----------
+# find_first() checks every candidate locator in one JS call per poll tick, so a
+# fallback list costs at most one timeout instead of one timeout per candidate.
+_LOCATE_JS = """
+function all(c) {
+  var kind = c[0], value = c[1], out = [];
+  if (kind === 'xpath') {
+    var snap = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < snap.snapshotLength; i++) out.push(snap.snapshotItem(i));
+    return out;
+  }
+  if (kind === 'css') return Array.prototype.slice.call(document.querySelectorAll(value));
+  return Array.prototype.filter.call(document.querySelectorAll('a'), function (a) {
+    var text = a.innerText.trim();
+    return kind === 'link' ? text === value : text.indexOf(value) !== -1;
+  });
+}
+function visible(el) {
+  if (!el.getClientRects().length) return false;
+  var style = getComputedStyle(el);
+  return style.visibility !== 'hidden' && style.opacity !== '0';
+}
+"""
+
+_FIND_FIRST_JS = _LOCATE_JS + """
+var cands = arguments[0], cond = arguments[1];
+function ok(el) {
+  if (cond === 'present') return true;
+  if (!visible(el)) return false;
+  return cond !== 'clickable' || !(el.disabled || el.getAttribute('aria-disabled') === 'true');
+}
+for (var i = 0; i < cands.length; i++) {
+  try {
+    var els = all(cands[i]);
+    for (var j = 0; j < els.length; j++) if (ok(els[j])) return [els[j], i];
+  } catch (e) { /* invalid selector for this page: treat as no match */ }
+}
+return null;
+"""
+
+def _css_escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+def _to_js_locator(candidate):
+    """Map a (By, value) tuple (or a bare XPath string) to a kind the race script understands."""
+    if isinstance(candidate, str):
+        return ["xpath", candidate]
+    by, value = candidate
+    if by == By.XPATH:
+        return ["xpath", value]
+    if by == By.CSS_SELECTOR:
+        return ["css", value]
+    if by == By.ID:
+        return ["css", f'[id="{_css_escape(value)}"]']
+    if by == By.NAME:
+        return ["css", f'[name="{_css_escape(value)}"]']
+    if by == By.CLASS_NAME:
+        return ["css", f'[class~="{_css_escape(value)}"]']
+    if by == By.TAG_NAME:
+        return ["css", value]
+    if by == By.LINK_TEXT:
+        return ["link", value]
+    if by == By.PARTIAL_LINK_TEXT:
+        return ["partial", value]
+    raise ValueError(f"unsupported locator strategy: {by}")
+
+def _locator_id(candidate):
+    kind, value = _to_js_locator(candidate)
+    return f"{kind}={value}"
+
+def _stats_site(url):
+    """locator_stats key for the page at `url`: its host, plus the site name when
+    BASE_URL serves every site from one host (resource_blocking.site_for)."""
+    netloc = urlsplit(url).netloc or "local"
+    base = os.getenv("BASE_URL")
+    if base and url.startswith(base.rstrip("/") + "/"):
+        site = resource_blocking.site_for(url)
+        if site:
+            return f"{netloc}/{site}"
+    return netloc
+
+def find_first(driver, candidates, timeout=DEFAULT_TIMEOUT, condition="visible", key=None):
+    """Race all candidate locators; return (element, index of the winning candidate).
+
+    `condition` is "present", "visible" or "clickable". Returns (None, None) if
+    nothing matched within `timeout` (timeout=0 checks exactly once).
+
+    With `key` (a logical element name) the race tries candidates in the order
+    that has worked best on this site before, and records the outcome in
+    locator_stats.py. The returned index always refers to `candidates` as passed.
+    """
+    candidates = list(candidates)
+    ranking = list(range(len(candidates)))
+    site = None
+    if key and locator_stats.enabled():
+        site = _stats_site(driver.current_url)
+        ids = [_locator_id(c) for c in candidates]
+        ranking = locator_stats.order(site, key, ids)
+
+    js_candidates = [_to_js_locator(candidates[i]) for i in ranking]
+    found = [None, None]
+
+    def race(d):
+        hit = d.execute_script(_FIND_FIRST_JS, js_candidates, condition)
+        if hit:
+            found[:] = hit
+        return bool(hit)
+
+    started = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2,
+                      ignored_exceptions=(WebDriverException,)).until(race)
+    except TimeoutException:
+        pass
+    element, pos = found
+    index = ranking[pos] if pos is not None else None
+
+    if site:
+        # Candidates ranked ahead of the winner were checked and missed; the rest weren't decided.
+        tried = ranking if pos is None else ranking[:pos + 1]
+        locator_stats.record(site, key, [ids[i] for i in tried],
+                             ids[index] if index is not None else None,
+                             (time.perf_counter() - started) * 1000)
+    return element, index
+
+# ---------- Form filling ----------
+# fill_form() sets every field in one JS call through the native value setter
+# (so React/Vue-style inputs see the change) and fires input/change, instead of
+# a clear() and a send_keys() round trip per field. human_type() is for widgets
+# that react to real keystrokes (autocomplete): the keys and the pauses between
+# them go to the browser as one W3C action sequence, with no Python-side sleeps.
+_FILL_JS = _LOCATE_JS + """
+var fields = arguments[0], missing = [];
+function setValue(el, v) {
+  if (el.type === 'checkbox' || el.type === 'radio') {
+    if (el.checked !== !!v) el.click();
+    return;
+  }
+  el.focus();
+  var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+            : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+            : HTMLInputElement.prototype;
+  Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, v);
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+var targets = fields.map(function (f, i) {
+  if (f[1]) return f[1];
+  var els = [];
+  try { els = all(f[0]).filter(visible); } catch (e) {}
+  if (!els.length) missing.push(i);
+  return els[0];
+});
+if (missing.length) return missing;
+for (var i = 0; i < fields.length; i++) setValue(targets[i], fields[i][2]);
+return [];
+"""
+
+TYPING_DELAY_MS = 80
+
+def fill_form(driver, fields, timeout=DEFAULT_TIMEOUT):
+    """Set several form fields in one WebDriver call.
+
+    `fields` maps a locator ((By, value) or bare XPath) or a WebElement to its value
+    (a string; True/False for checkboxes and radios). Nothing is set until every
+    field is visible; raises TimeoutException naming the missing ones.
+    """
+    items = fields.items() if isinstance(fields, dict) else fields
+    payload = [[None, target, value] if hasattr(target, "send_keys") else [_to_js_locator(target), None, value]
+               for target, value in items]
+    missing = []
+
+    def filled(d):
+        missing[:] = d.execute_script(_FILL_JS, payload)
+        return not missing
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(filled)
+    except TimeoutException:
+        names = [f"{payload[i][0][0]}={payload[i][0][1]}" for i in missing]
+        raise TimeoutException(f"form fields not found: {', '.join(names)}") from None
+
+def human_type(driver, element, text, delay_ms=None, clear=True):
+    """Type into an autocomplete-style widget key by key, `delay_ms` apart
+    (default TYPING_DELAY_MS env, 80), as a single browser-side action sequence."""
+    delay = float(os.getenv("TYPING_DELAY_MS", TYPING_DELAY_MS) if delay_ms is None else delay_ms) / 1000
+    actions = ActionChains(driver, duration=0)
+    actions.click(element)
+    if clear:
+        select_all = Keys.COMMAND if sys.platform == "darwin" else Keys.CONTROL
+        actions.key_down(select_all).send_keys("a").key_up(select_all).send_keys(Keys.BACKSPACE)
+    for char in text:
+        actions.send_keys(char)
+        if delay:
+            actions.pause(delay)
+    actions.perform()
+
+# ---------- Step timing ----------
+# Every finished step is appended as one JSON line to STEP_LOG (run_suite.py
+# points it at <run>/steps.jsonl) and kept in STEPS for the current script.
+
+STEPS = []
+
+_STEP_METRICS_JS = """
+var since = arguments[0], tasks = [];
+try {
+  var obs = new PerformanceObserver(function () {});
+  obs.observe({type: 'longtask', buffered: true});
+  tasks = obs.takeRecords();
+  obs.disconnect();
+} catch (e) {}
+tasks = tasks.filter(function (t) { return performance.timeOrigin + t.startTime >= since; });
+var nav = performance.getEntriesByType('navigation')[0];
+return {
+  url: location.href,
+  navigated: performance.timeOrigin >= since,
+  navigation: nav ? {
+    type: nav.type,
+    ttfb_ms: Math.round(nav.responseStart),
+    dom_content_loaded_ms: Math.round(nav.domContentLoadedEventEnd),
+    load_ms: Math.round(nav.loadEventEnd),
+    transfer_bytes: nav.transferSize
+  } : null,
+  long_tasks: tasks.length,
+  long_task_ms: Math.round(tasks.reduce(function (s, t) { return s + t.duration; }, 0))
+};
+"""
+
+def script_name():
+    """Stem of the running TC/NC script (run_suite.py sets SUITE_SCRIPT for its workers)."""
+    return os.getenv("SUITE_SCRIPT") or Path(sys.argv[0]).stem or "interactive"
+
+def _command_counter(driver):
+    """Count WebDriver commands on the underlying session (unwrapping a pooled lease)."""
+    real = getattr(driver, "_driver", None) or driver
+    if not hasattr(real, "_command_count"):
+        real._command_count = 0
+        execute = real.execute
+        def counting_execute(*args, **kwargs):
+            real._command_count += 1
+            return execute(*args, **kwargs)
+        real.execute = counting_execute
+    return real
+
+def _write_step(record):
+    STEPS.append(record)
+    path = Path(os.getenv("STEP_LOG", "steps.jsonl"))
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        print(f"[steps] could not write {path}: {e}")
+
+class StepTimer:
+    """Times consecutive steps of one script: begin() closes the previous step and
+    prints the progress line for the next one; end() closes the last."""
+
+    def __init__(self, driver=None, script=None):
+        self.driver = driver
+        self.script = script or script_name()
+        self.index = 0
+        self.current = None
+
+    def begin(self, title, echo=True):
+        self.end(final=False)
+        if echo:
+            print(f"\n{title}")
+        self.index += 1
+        counter = _command_counter(self.driver) if self.driver is not None else None
+        self.current = {
+            "name": title,
+            "started": time.time(),
+            "perf": time.perf_counter(),
+            "commands": counter._command_count if counter else None,
+        }
+
+    def end(self, final=True, error=None):
+        if self.current is None:
+            return None
+        step, self.current = self.current, None
+        seconds = time.perf_counter() - step["perf"]
+        record = {
+            "script": self.script,
+            "step": step["name"],
+            "index": self.index,
+            "started": datetime.fromtimestamp(step["started"]).isoformat(timespec="milliseconds"),
+            "seconds": round(seconds, 3),
+            "commands": None,
+            "final": final,
+            "error": repr(error) if error else None,
+            "browser": None,
+        }
+        if self.driver is not None:
+            artifacts.step(self.driver, step["name"])
+            counter = _command_counter(self.driver)
+            record["commands"] = counter._command_count - step["commands"]
+            try:
+                record["browser"] = self.driver.execute_script(_STEP_METRICS_JS, step["started"] * 1000)
+            except WebDriverException:
+                pass
+        _write_step(record)
+        return record
+
+class step(contextlib.ContextDecorator):
+    """Time a block or function as a single step:
+
+        with step("fill search form", driver): ...
+
+        @step("login", driver)
+        def login(): ...
+    """
+
+    def __init__(self, name, driver=None):
+        self.name = name
+        self.driver = driver
+
+    def _recreate_cm(self):
+        return type(self)(self.name, self.driver)
+
+    def __enter__(self):
+        self.timer = StepTimer(self.driver)
+        self.timer.begin(self.name, echo=False)
+        return self.timer
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timer.end(error=exc)
+        return False